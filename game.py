@@ -7,10 +7,15 @@ Usage Example:
     game.run()
 """
 import pygame
+from host.sync import StateSync
 from util.constants import GameState
+from util.frame_rate import FrameRatePolicy
+from util.profiler import FrameProfiler
+from util.scheduler import Scheduler
 from util.score import Score
 from player.player_manager import PlayerManager
 
+# pylint: disable=R0902
 class Game():
     """
     Class that contains the main game logic.
@@ -27,8 +32,18 @@ class Game():
         state (State): The game's current state
         player_manager (PlayerManager): A reference to the PlayerManager object
             that keeps track of players
+        dirty_rendering (boolean): True if only changed regions of the screen are redrawn
+            and pushed to the display each frame
+        frame_rate (FrameRatePolicy): Decides how fast the game loop runs
+        scheduler (Scheduler): Runs countdowns and delayed callbacks for the states and
+            players, advanced once per frame
+        sync (StateSync): Sends changes in game state to host clients in hosted mode
+        profiler (FrameProfiler): Times each part of the game loop, shown over the game
+            when F3 is pressed
     """
-    def __init__(self, screen, states, start_state=GameState.TITLE):
+    # pylint: disable=R0913,R0917
+    def __init__(self, screen, states, start_state=GameState.TITLE, dirty_rendering=False,
+                 frame_rate=None, player_manager=None, profiler=None):
         """Initializes Game Object
 
         Args:
@@ -36,16 +51,32 @@ class Game():
             states (dict of GameSate: State): Dictionary of all possible game states
             start_state (GameState, optional): name of state the game enters on launch.
                 Defaults to GameState.TITLE.
+            dirty_rendering (boolean, optional): Only redraw changed regions of the screen.
+                Defaults to False.
+            frame_rate (FrameRatePolicy, optional): Decides how fast the game loop runs.
+                Defaults to FrameRatePolicy().
+            player_manager (PlayerManager, optional): Keeps track of players.
+                Defaults to PlayerManager().
+            profiler (FrameProfiler, optional): Times each part of the game loop.
+                Defaults to FrameProfiler().
         """
         self.screen = screen
         self.game_board = pygame.Surface((1300, 1000))
         self.clock = pygame.time.Clock()
         self.states = states
+        self.scheduler = Scheduler()
         for key in self.states.keys():
             states[key].set_name(key)
+            states[key].scheduler = self.scheduler
         self.state = states[start_state]
-        self.player_manager = PlayerManager()
+        self.player_manager = PlayerManager() if player_manager is None else player_manager
+        self.player_manager.scheduler = self.scheduler
         self.score_board = Score()
+        self.dirty_rendering = dirty_rendering
+        self.frame_rate = FrameRatePolicy() if frame_rate is None else frame_rate
+        self.last_tick = 0
+        self.sync = StateSync()
+        self.profiler = FrameProfiler() if profiler is None else profiler
 
     def handle_events(self):
         """Handles events like mouse clicks, keyboard presses.
@@ -58,6 +89,9 @@ class Game():
                 if event.key == pygame.K_ESCAPE:
                     # Exit game if escape key is pressed
                     return True
+                if event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                    continue
             if self.state.name == GameState.BOARD:
                 if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                     if pygame.mouse.get_pos()[0] > 1300:
@@ -68,11 +102,17 @@ class Game():
             self.state.handle_event(event)
         return False
 
+    def toggle_profiler(self):
+        """Shows or hides the profiler overlay, redrawing what it covered."""
+        self.profiler.toggle_overlay()
+        self.state.invalidate()
+
     def change_state(self, next_state):
         """Changes state to the next game state and passes along persistent data."""
         store = self.state.store
         self.state = self.states[next_state]
         self.state.startup(store, self.player_manager)
+        self.state.invalidate()
         self.score_board.reset(self.player_manager)
 
     def update(self, elapsed_time):
@@ -81,12 +121,23 @@ class Game():
         Args:
             elapsed_time (int): Milliseconds passed since the last time update() was called.
         """
+        self.scheduler.advance(elapsed_time)
+        self.player_manager.arbitrate()
         next_state = self.state.update(self.player_manager, elapsed_time)
         if next_state != self.state.name:
             self.change_state(next_state)
+        host = self.state.store.get('host')
+        if host is not None:
+            self.sync.publish(host, self.state, self.player_manager, self.scheduler.now)
 
     def draw(self):
-        """Draws the current frame to the screen."""
+        """Draws the current frame to the screen.
+
+        Returns:
+            list of Rect: Regions of the screen that changed this frame
+        """
+        if self.dirty_rendering:
+            return self.draw_dirty()
         if not self.state.show_score:
             self.state.draw(self.screen)
         else:
@@ -96,6 +147,57 @@ class Game():
             # draw the game board
             self.state.draw(self.game_board)
             self.screen.blit(self.game_board, (0,0))
+        return [self.screen.get_rect()]
+
+    def draw_dirty(self):
+        """Draws only the regions of the screen that have changed since the last frame.
+
+        Returns:
+            list of Rect: Regions of the screen that changed this frame
+        """
+        if not self.state.show_score:
+            rects = self.state.get_dirty_rects(self.screen)
+            if rects:
+                self.state.draw(self.screen)
+            return rects
+
+        # draw score board
+        rects = []
+        for rect in self.score_board.display_score(self.player_manager):
+            rects.append(self.screen.blit(self.score_board.screen, rect.move(1300, 0), rect))
+        # draw the game board
+        board_rects = self.state.get_dirty_rects(self.game_board)
+        if board_rects:
+            self.state.draw(self.game_board)
+        for rect in board_rects:
+            rects.append(self.screen.blit(self.game_board, rect, rect))
+        return rects
+
+    def tick(self):
+        """Waits until the next frame is due according to the frame rate policy.
+
+        While idle, blocks on the event queue so that a click or key press wakes the game
+        immediately instead of waiting for the next frame.
+
+        Returns:
+            int: Milliseconds passed since the last time tick() was called
+        """
+        fps = self.frame_rate.target_fps(self.state, self.player_manager)
+        if fps < self.frame_rate.full_fps:
+            deadline = self.last_tick + 1000 // fps
+            timeout = deadline - pygame.time.get_ticks()
+            while timeout > 0:
+                event = pygame.event.wait(timeout)
+                if event.type not in (pygame.NOEVENT, pygame.MOUSEMOTION):
+                    # leave event to be handled next frame
+                    pygame.event.post(event)
+                    break
+                timeout = deadline - pygame.time.get_ticks()
+            elapsed_time = self.clock.tick()
+        else:
+            elapsed_time = self.clock.tick(fps)
+        self.last_tick = pygame.time.get_ticks()
+        return elapsed_time
 
     def run(self):
         """
@@ -104,15 +206,32 @@ class Game():
         Each iteration will check for user inputs, render the game on screen,
         and update the game state. Loop will run until game is quit.
         """
+        profiler = self.profiler
         while True:
-            quit_pressed = self.handle_events()
+            profiler.start_frame(self.state.name)
+            with profiler.phase('events'):
+                quit_pressed = self.handle_events()
             if quit_pressed:
                 break
-            self.draw()
-            elapsed_time = self.clock.tick()
-            self.update(elapsed_time)
+            with profiler.phase('draw'):
+                rects = self.draw()
+            covered = profiler.overlay_rect
+            overlay = profiler.draw_overlay(self.screen)
+            if overlay is not None:
+                rects.append(overlay)
+                if overlay != covered:
+                    # uncover what a larger overlay was drawn over
+                    self.state.invalidate()
+            elapsed_time = self.tick()
+            with profiler.phase('update'):
+                self.update(elapsed_time)
             # Display screen
-            pygame.display.flip()
+            with profiler.phase('flip'):
+                if self.dirty_rendering:
+                    pygame.display.update(rects)
+                else:
+                    pygame.display.flip()
+            profiler.end_frame()
 
         if 'host' in self.state.store and self.state.store['host'] is not None:
             self.state.store['host'].close()
@@ -0,0 +1,469 @@
+"""
+Play complete games without a display, sound card, or buzzers, as fast as possible, and
+report how long each game state takes to update and draw.
+
+SDL's dummy drivers stand in for the display and sound card, and gpiozero's MockFactory
+for the buzzers. Clicks, key presses and buzzer presses are scripted, and each frame
+advances the game clock by a fixed step, so timers run out without waiting in real time.
+Games are generated from a clue bank, which is filled with made up clues unless one is
+given, so no network connection is needed.
+
+Results can be saved as JSON and compared with an earlier run to catch regressions.
+
+Usage Example:
+    $ python game_benchmark.py --games 3
+    $ python game_benchmark.py --clue-bank clues.db --json before.json
+    $ python game_benchmark.py --baseline before.json --tolerance 0.1
+"""
+import argparse
+import gc
+import json
+import os
+import pickle
+import random
+import tempfile
+import time
+import tracemalloc
+import pygame
+from pygame import mixer
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+from game import Game
+from states.board import Board
+from states.categories import IntroScreen
+from states.daily_double import DailyDouble
+from states.final import Final
+from states.hall_of_fame import Hall
+from states.loading import LoadingScreen
+from states.options import OptionsScreen
+from states.question import Question
+from states.stats import Stats
+from states.tie_breaker import TieBreaker
+from states.title import TitleScreen
+from util.clue_bank import ClueBank, FINAL_ROUND
+from util.constants import GameState
+from util.fetch import FetchClient
+from util.speech_backends import BACKENDS, SpeechBackend
+from util.stats import percentile
+from util.util import Font, SoundEffects, TTS
+
+class SilentBackend(SpeechBackend):
+    """Speech engine that returns a moment of silence straight away."""
+    name = 'silent'
+
+    def synthesize(self, text, frequency, channels):
+        return bytes(2 * channels * (frequency // 1000))
+
+def fill_bank(bank, categories, rng):
+    """Fills a clue bank with made up categories.
+
+    Args:
+        bank (ClueBank): Bank to add clues to
+        categories (int): Number of complete categories to add to each round
+        rng (Random): Random number generator used to vary the length of clues
+    """
+    words = ['river', 'planet', 'novel', 'opera', 'treaty', 'glacier', 'sonnet', 'atom']
+    clues = []
+    for round_ in (0, 1):
+        for cat in range(categories):
+            for value in [x*(round_+1) for x in [200,400,600,800,1000]]:
+                answer = ' '.join(rng.choice(words) for _ in range(rng.randrange(6, 30)))
+                clues.append({'round': round_, 'category': f'CATEGORY {round_}-{cat}',
+                    'value': value, 'answer': 'This ' + answer, 'question': 'What is ' +
+                    rng.choice(words), 'air_date': str(cat)})
+    for cat in range(categories):
+        clues.append({'round': FINAL_ROUND, 'category': f'FINAL {cat}', 'value': None,
+            'answer': 'This final ' + rng.choice(words), 'question': 'What is ' +
+            rng.choice(words)})
+    bank.add_clues(clues)
+
+# pylint: disable=R0902
+class Simulation():
+    """Plays games by injecting clicks, key presses, and buzzer presses into a Game.
+
+    Attributes:
+        game (Game): The game being played
+        step (int): Milliseconds of game time that pass each frame
+        rng (Random): Random number generator that decides how each clue is played
+        mouse (int, int): Position reported to the game as the mouse position
+        frames (int): Number of frames run
+        timings (dict of GameState: dict of str: list): Seconds spent in update and draw,
+            and bytes allocated, for each frame in each state
+        collections (dict of GameState: int): Garbage collections run in each state
+        allocations (boolean): True if memory allocations are traced
+    """
+    def __init__(self, game, step, rng, allocations=False):
+        """Initializes Simulation Object
+
+        Args:
+            game (Game): The game to play
+            step (int): Milliseconds of game time that pass each frame
+            rng (Random): Random number generator that decides how each clue is played
+            allocations (boolean, optional): Trace memory allocated by each frame, which
+                makes frames much slower. Defaults to False.
+        """
+        self.game = game
+        self.step = step
+        self.rng = rng
+        self.mouse = (0, 0)
+        self.frames = 0
+        self.timings = {}
+        self.collections = {}
+        self.allocations = allocations
+        # the dummy video driver has no mouse, so report the scripted position instead
+        pygame.mouse.get_pos = lambda: self.mouse
+        gc.callbacks.append(self.count_collection)
+
+    def count_collection(self, phase, _info):
+        """Counts garbage collections in the current state."""
+        if phase == 'start':
+            name = self.game.state.name
+            self.collections[name] = self.collections.get(name, 0) + 1
+
+    def measure(self, name, kind, function, *args):
+        """Calls a function, recording how long it took and how much it allocated.
+
+        Args:
+            name (GameState): State the time is counted towards
+            kind (str): 'update' or 'draw'
+
+        Returns:
+            Any: What the function returned
+        """
+        timing = self.timings.setdefault(name, {'update': [], 'draw': [], 'alloc': []})
+        if self.allocations:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = function(*args)
+        timing[kind].append(time.perf_counter() - start)
+        if self.allocations:
+            timing['alloc'].append(tracemalloc.get_traced_memory()[1] - before)
+        return result
+
+    def frame(self):
+        """Runs one iteration of the game loop, like Game.run() without waiting."""
+        game = self.game
+        if game.handle_events():
+            raise RuntimeError('game quit')
+        rects = self.measure(game.state.name, 'draw', game.draw)
+        self.measure(game.state.name, 'update', game.update, self.step)
+        if game.dirty_rendering:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        self.frames += 1
+
+    def run_until(self, condition, limit=20000):
+        """Runs frames until a condition is true.
+
+        Args:
+            condition (function): Returns True when the simulation can move on
+            limit (int, optional): Most frames to run before giving up. Defaults to 20000.
+
+        Raises:
+            RuntimeError: If the condition is still false after limit frames
+        """
+        for _ in range(limit):
+            if condition():
+                return
+            self.frame()
+            # give speech and loading threads a chance to run
+            time.sleep(0)
+        raise RuntimeError('stuck in ' + self.game.state.name.name)
+
+    def run_until_state(self, name):
+        """Runs frames until the game reaches a state."""
+        self.run_until(lambda: self.game.state.name == name)
+
+    def click(self, pos):
+        """Clicks the left mouse button at a position and runs a frame."""
+        self.mouse = (int(pos[0]), int(pos[1]))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=self.mouse))
+        self.frame()
+
+    def click_button(self, button):
+        """Waits for a button to be drawn, then clicks it."""
+        self.run_until(lambda: button.rect is not None)
+        self.click(button.rect.center)
+
+    def type_text(self, text):
+        """Types text on the keyboard and runs a frame."""
+        for char in text:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char))
+        self.frame()
+
+    def buzz(self, player):
+        """Presses and releases a player's buzzer."""
+        pin = player.buzzer.buzzer.pin
+        pin.drive_low()
+        pin.drive_high()
+
+    def play_game(self):
+        """Plays one game from the title screen through to the stats screen."""
+        game = self.game
+        self.run_until_state(GameState.TITLE)
+        self.click_button(game.state.play_button)
+        self.run_until_state(GameState.BOARD)
+        while game.state.name != GameState.FINAL:
+            if game.state.name == GameState.BOARD:
+                self.pick_clue()
+            elif game.state.name == GameState.QUESTION:
+                self.play_question()
+            elif game.state.name == GameState.DAILY_DOUBLE:
+                self.play_daily_double()
+            else:
+                self.frame() # introducing the next round's categories
+        self.play_final()
+        if game.state.name == GameState.TIE:
+            self.play_tie_breaker()
+        self.run_until_state(GameState.HALL)
+        self.type_text('SIM')
+        self.click_button(game.state.enter_button)
+        self.click_button(game.state.continue_button)
+        self.run_until_state(GameState.STATS)
+        self.click_button(game.state.continue_button)
+        self.run_until_state(GameState.TITLE)
+
+    def pick_clue(self):
+        """Clicks a random clue still on the board."""
+        board = self.game.state
+        self.run_until(lambda: len(board.grid[0]) > 0) # board has been drawn
+        grid = board.store['data'][board.store['round']]
+        cells = [(column, row) for column in range(grid.COLUMNS) for row in range(grid.ROWS)
+            if not grid.is_taken(column, row)]
+        if not cells:
+            self.frame() # the board moves on to the next round
+            return
+        column, row = self.rng.choice(cells)
+        horizontal_lines, vertical_lines = board.grid
+        self.click(((column + 0.5) * vertical_lines.step, (row + 1.5) * horizontal_lines.step))
+
+    def play_question(self):
+        """Plays a clue: sometimes no one rings in, and sometimes a player rings in early."""
+        state = self.game.state
+        player_manager = self.game.player_manager
+        players = player_manager.players
+        roll = self.rng.random()
+        if roll < 0.2:
+            # an early press locks the player out, so someone else rings in
+            early = self.rng.choice(players)
+            self.buzz(early)
+            players = [player for player in players if player is not early]
+        self.run_until(lambda: player_manager.green or state.show_answer)
+        if roll >= 0.1 and not state.show_answer:
+            self.buzz(self.rng.choice(players))
+        # the answer and buttons are shown when time runs out to ring in or answer
+        self.run_until(lambda: state.show_answer)
+        if state.rang_in:
+            self.click_button(self.rng.choice([state.buttons.correct_button,
+                state.buttons.wrong_button]))
+        else:
+            self.click_button(state.buttons.continue_button)
+
+    def play_daily_double(self):
+        """Wagers on a daily double and answers it."""
+        state = self.game.state
+        self.type_text(str(self.rng.choice([200, 500, 1000])))
+        self.click_button(state.buttons.continue_button)
+        self.run_until(lambda: state.show_answer)
+        self.click_button(self.rng.choice([state.buttons.correct_button,
+            state.buttons.wrong_button]))
+
+    def play_final(self):
+        """Wagers on final jeopardy and answers it for every player."""
+        state = self.game.state
+        width, height = self.game.game_board.get_size()
+        self.run_until(lambda: state.wait_for_wagers)
+        self.click((width / 2, height * 3 / 4))
+        self.run_until(lambda: state.show_answer)
+        while state.winner is None and self.game.state.name == GameState.FINAL:
+            player = state.players_left[0]
+            self.type_text(str(max(0, min(player.score, 1000))))
+            self.click_button(self.rng.choice([state.buttons.correct_button,
+                state.buttons.wrong_button]))
+        if self.game.state.name == GameState.FINAL:
+            self.click_button(state.buttons.continue_button)
+
+    def play_tie_breaker(self):
+        """Plays tie breakers until one of the tied players answers correctly."""
+        state = self.game.state
+        player_manager = self.game.player_manager
+        while state.winner is None:
+            self.run_until(lambda: state.question is not None and not TTS.is_busy())
+            self.click_button(state.buttons.continue_button)
+            self.run_until(lambda: player_manager.green)
+            self.buzz(self.rng.choice(state.store['candidates']))
+            self.run_until(lambda: state.rang_in)
+            self.run_until(lambda: state.show_answer)
+            self.click_button(state.buttons.correct_button)
+        self.click_button(state.buttons.continue_button)
+
+    def summary(self):
+        """Returns frame counts, times in microseconds, and allocations for each state."""
+        states = {}
+        for name, timing in self.timings.items():
+            update = sorted(timing['update'])
+            draw = sorted(timing['draw'])
+            states[name.name] = {
+                'frames': len(update),
+                'update_mean_us': sum(update) / len(update) * 1e6,
+                'update_p99_us': percentile(update, 99) * 1e6,
+                'draw_mean_us': sum(draw) / len(draw) * 1e6,
+                'draw_p99_us': percentile(draw, 99) * 1e6,
+                'collections': self.collections.get(name, 0),
+            }
+            if timing['alloc']:
+                states[name.name]['alloc_mean_kb'] = sum(timing['alloc']) / len(
+                    timing['alloc']) / 1024
+        return states
+
+def print_summary(results):
+    """Prints a table of the time spent in each state."""
+    print(f"{results['games']} games, {results['frames']} frames in "
+        f"{results['seconds']:.2f} s: {results['fps']:.0f} frames/s")
+    columns = ['frames', 'update_mean_us', 'update_p99_us', 'draw_mean_us', 'draw_p99_us',
+        'collections', 'alloc_mean_kb']
+    print(f"{'STATE':<14}" + ''.join(f'{column:>16}' for column in columns))
+    for name, state in results['states'].items():
+        print(f'{name:<14}' + ''.join(f'{state[column]:>16.0f}' if column in state else
+            f"{'-':>16}" for column in columns))
+
+def compare(results, baseline, tolerance, min_frames=100, min_change_us=20):
+    """Prints changes from an earlier run.
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of an earlier run
+        tolerance (float): Largest slowdown allowed, as a fraction
+        min_frames (int, optional): States with fewer frames than this are printed but
+            not checked, since a few slow frames would swing their means. Defaults to 100.
+        min_change_us (float, optional): Slowdowns of fewer microseconds than this are
+            within timer noise and never fail. Defaults to 20.
+
+    Returns:
+        boolean: True if frames/s and every checked state's mean update and draw time are
+            within tolerance of the baseline
+    """
+    passed = True
+    change = baseline['fps'] / results['fps'] - 1
+    print(f"frames/s: {baseline['fps']:.0f} -> {results['fps']:.0f}")
+    if change > tolerance:
+        passed = False
+    for name, state in results['states'].items():
+        before = baseline['states'].get(name)
+        if before is None:
+            continue
+        for column in ('update_mean_us', 'draw_mean_us'):
+            change = state[column] / max(before[column], 1e-9) - 1
+            flag = ''
+            checked = min(state['frames'], before['frames']) >= min_frames and (
+                state[column] - before[column] >= min_change_us)
+            if change > tolerance and checked:
+                flag = '  REGRESSION'
+                passed = False
+            print(f'{name} {column}: {before[column]:.0f} -> {state[column]:.0f} us '
+                f'({change:+.0%}){flag}')
+    return passed
+
+def setup_headless():
+    """Starts pygame without a display or sound card, with mock buzzers and silent speech.
+
+    Returns:
+        Surface: Pygame display the game is drawn on
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    Device.pin_factory = MockFactory()
+    pygame.init()
+    Font.load_fonts()
+    mixer.init()
+    silence = mixer.Sound(buffer=bytes(64))
+    SoundEffects.daily_double_sound = SoundEffects.time_sound = silence
+    SoundEffects.final_sound = silence
+    BACKENDS[SilentBackend.name] = SilentBackend
+    TTS.set_backend(SilentBackend.name)
+    return pygame.display.set_mode((1600,1000))
+
+def make_game(screen, bank, dirty_rendering):
+    """Returns a game with every state, loading games and tie breakers from a clue bank.
+
+    Args:
+        screen (Surface): Pygame display the game is drawn on
+        bank (ClueBank): Clues to play
+        dirty_rendering (boolean): Only redraw changed regions of the screen
+    """
+    states = {GameState.LOADING: LoadingScreen(bank), GameState.TIE: TieBreaker(bank)}
+    for name, state in ((GameState.TITLE, TitleScreen), (GameState.OPTIONS, OptionsScreen),
+            (GameState.INTRO, IntroScreen), (GameState.BOARD, Board),
+            (GameState.QUESTION, Question), (GameState.DAILY_DOUBLE, DailyDouble),
+            (GameState.FINAL, Final), (GameState.HALL, Hall), (GameState.STATS, Stats)):
+        states[name] = state()
+    return Game(screen, states, dirty_rendering=dirty_rendering)
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark complete games without hardware.')
+    parser.add_argument('--games', type=int, default=1, help='games to play (default: 1)')
+    parser.add_argument('--step', type=int, default=16,
+        help='milliseconds of game time that pass each frame (default: 16)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default: 1)')
+    parser.add_argument('--clue-bank', metavar='PATH',
+        help='clue database to play from (default: a bank of made up clues)')
+    parser.add_argument('--dirty-rects', action='store_true',
+        help='only redraw regions of the screen that change each frame')
+    parser.add_argument('--allocations', action='store_true',
+        help='trace memory allocated each frame, which makes frames much slower')
+    parser.add_argument('--json', metavar='PATH', help='save results to a JSON file')
+    parser.add_argument('--baseline', metavar='PATH',
+        help='compare with results saved by an earlier run, failing on a regression')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+        help='slowdown allowed when comparing with the baseline (default: 0.2)')
+    args = parser.parse_args()
+
+    screen = setup_headless()
+    rng = random.Random(args.seed)
+    clue_bank = os.path.abspath(args.clue_bank) if args.clue_bank else None
+    cwd = os.getcwd()
+
+    # high scores, speech, and downloads are saved in the working directory
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        with open('scores', 'wb') as file:
+            pickle.dump([], file) # empty hall of fame
+        if clue_bank is None:
+            bank = ClueBank('clues.db', random.Random(args.seed))
+            fill_bank(bank, 60, rng)
+        else:
+            bank = ClueBank(clue_bank, random.Random(args.seed))
+        # games should only come from the bank, so fail fast if it is used up
+        FetchClient.configure(base_url='http://127.0.0.1:9', cache_dir=None, retries=0)
+        simulation = Simulation(make_game(screen, bank, args.dirty_rects), args.step, rng,
+            args.allocations)
+        if args.allocations:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(args.games):
+            simulation.play_game()
+        seconds = time.perf_counter() - start
+        tracemalloc.stop()
+        bank.close()
+        TTS.shutdown()
+        os.chdir(cwd)
+
+    results = {'games': args.games, 'frames': simulation.frames, 'seconds': seconds,
+        'fps': simulation.frames / seconds, 'states': simulation.summary()}
+    print_summary(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    passed = True
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            passed = compare(results, json.load(file), args.tolerance)
+    pygame.quit()
+    if not passed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
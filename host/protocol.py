@@ -0,0 +1,206 @@
+"""
+Message protocol shared by the game's host server and the host program.
+
+Every message is framed as a 4 byte big endian payload length, a 1 byte message type,
+and a payload holding one typed value. Values are packed with a one byte tag followed by
+a fixed size struct or a length prefixed body, so strings of any length, numbers, lists
+and dicts survive the trip intact and several messages can share one read.
+
+Usage Example:
+    connection = Connection()
+    connection.write(MessageType.ANSWER, 'What is a Raspberry Pi?')
+    sock.sendall(connection.outbox)
+    for kind, value in connection.read(sock.recv(4096)):
+        ...
+"""
+from enum import IntEnum
+import struct
+
+HEADER = struct.Struct('!IB')
+MAX_PAYLOAD = 16 * 1024 * 1024
+MAX_DEPTH = 32 # most lists and dicts a value may be nested inside
+
+class MessageType(IntEnum):
+    """Kinds of messages sent between the game and host."""
+    ANSWER = 1 # game -> host, value is the correct response to show the host
+    RANG_IN = 2 # game -> host, a player rang in and the host should rule on their answer
+    CONTINUE = 3 # game -> host, time ran out and the host should click continue
+    RESPONSE = 4 # host -> game, value is True if correct (or continue), False if incorrect
+    STATE = 5 # game -> host, value is a dict of game state fields that changed
+
+class ProtocolError(ValueError):
+    """Raised when received bytes are not a valid message."""
+
+_BYTE = struct.Struct('!b')
+_INT = struct.Struct('!q')
+_FLOAT = struct.Struct('!d')
+_LENGTH = struct.Struct('!I')
+_CONSTANTS = {None: b'N', True: b'T', False: b'F'}
+
+def pack_value(value, out):
+    """Appends a typed value to a buffer.
+
+    Args:
+        value (None, bool, int, float, str, list, tuple or dict): Value to pack. Lists,
+            tuples and dicts may only contain values that can be packed.
+        out (bytearray): Buffer the packed value is added to
+    """
+    if value is None or isinstance(value, bool):
+        out += _CONSTANTS[value]
+    elif isinstance(value, int):
+        if -128 <= value < 128:
+            out += b'b' + _BYTE.pack(value)
+        else:
+            out += b'i' + _INT.pack(value)
+    elif isinstance(value, float):
+        out += b'd' + _FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode()
+        out += b's' + _LENGTH.pack(len(data)) + data
+    elif isinstance(value, (list, tuple)):
+        out += b'l' + _LENGTH.pack(len(value))
+        for item in value:
+            pack_value(item, out)
+    elif isinstance(value, dict):
+        out += b'm' + _LENGTH.pack(len(value))
+        for key, item in value.items():
+            pack_value(key, out)
+            pack_value(item, out)
+    else:
+        raise TypeError('Cannot pack value of type ' + type(value).__name__)
+
+# pylint: disable=R0911
+def unpack_value(data, offset=0, depth=0):
+    """Reads a typed value from a buffer.
+
+    Args:
+        data (bytes): Buffer holding packed values
+        offset (int, optional): Index in the buffer where the value starts. Defaults to 0.
+        depth (int, optional): Number of lists and dicts the value is inside. Defaults to 0.
+
+    Returns:
+        (Any, int): Tuple (value, index just past the value)
+
+    Raises:
+        ProtocolError: If the bytes are not a valid value
+    """
+    if depth > MAX_DEPTH:
+        raise ProtocolError('Value is nested more than ' + str(MAX_DEPTH) + ' deep')
+    try:
+        tag = data[offset:offset+1]
+        offset += 1
+        if tag == b'N':
+            return None, offset
+        if tag in (b'T', b'F'):
+            return tag == b'T', offset
+        if tag == b'b':
+            return _BYTE.unpack_from(data, offset)[0], offset + _BYTE.size
+        if tag == b'i':
+            return _INT.unpack_from(data, offset)[0], offset + _INT.size
+        if tag == b'd':
+            return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+        if tag in (b's', b'l', b'm'):
+            length = _LENGTH.unpack_from(data, offset)[0]
+            offset += _LENGTH.size
+            if tag == b's':
+                if offset + length > len(data):
+                    raise ProtocolError('String runs past end of message')
+                return bytes(data[offset:offset+length]).decode(), offset + length
+            return _unpack_items(data, offset, tag == b'm', length, depth)
+    except (struct.error, UnicodeDecodeError) as error:
+        raise ProtocolError(str(error)) from error
+    raise ProtocolError('Unknown value tag ' + repr(tag))
+
+def _unpack_items(data, offset, is_dict, length, depth):
+    """Reads the items of a list or dict from a buffer.
+
+    Args:
+        data (bytes): Buffer holding packed values
+        offset (int): Index in the buffer where the first item starts
+        is_dict (boolean): True if the items are the keys and values of a dict
+        length (int): Number of items, or of keys for a dict
+        depth (int): Number of lists and dicts the list or dict is inside
+
+    Returns:
+        (list or dict, int): Tuple (value, index just past the last item)
+    """
+    items = []
+    for _ in range(length * 2 if is_dict else length):
+        item, offset = unpack_value(data, offset, depth + 1)
+        items.append(item)
+    if not is_dict:
+        return items, offset
+    keys = items[::2]
+    if any(isinstance(key, (list, dict)) for key in keys):
+        raise ProtocolError('Dict key must not be a list or dict')
+    return dict(zip(keys, items[1::2])), offset
+
+def encode(kind, value=None):
+    """Frames a message.
+
+    Args:
+        kind (MessageType): Type of message
+        value (Any, optional): Payload of the message. Defaults to None.
+
+    Returns:
+        bytes: The framed message
+    """
+    payload = bytearray()
+    pack_value(value, payload)
+    return HEADER.pack(len(payload), kind) + payload
+
+class Connection():
+    """Buffers for one end of a connection between the game and a host.
+
+    Attributes:
+        address (str, int): Address and port of the other end
+        inbox (bytearray): Received bytes that do not yet form a complete message
+        outbox (bytearray): Framed messages waiting to be sent
+    """
+    def __init__(self, address=None):
+        self.address = address
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+
+    def read(self, data):
+        """Adds received bytes to the inbox.
+
+        Args:
+            data (bytes): Bytes received from the socket
+
+        Returns:
+            list of (MessageType, Any): Tuple (type, value) of each message completed by
+                the received bytes
+
+        Raises:
+            ProtocolError: If the bytes are not valid messages
+        """
+        self.inbox += data
+        messages = []
+        offset = 0
+        while len(self.inbox) - offset >= HEADER.size:
+            length, kind = HEADER.unpack_from(self.inbox, offset)
+            if length > MAX_PAYLOAD:
+                raise ProtocolError('Message of ' + str(length) + ' bytes is too long')
+            end = offset + HEADER.size + length
+            if len(self.inbox) < end:
+                break
+            value, stop = unpack_value(self.inbox[offset + HEADER.size:end])
+            if stop != length:
+                raise ProtocolError('Message has bytes left over after its value')
+            try:
+                messages.append((MessageType(kind), value))
+            except ValueError as error:
+                raise ProtocolError(str(error)) from error
+            offset = end
+        del self.inbox[:offset]
+        return messages
+
+    def write(self, kind, value=None):
+        """Adds a message to the outbox.
+
+        Args:
+            kind (MessageType): Type of message
+            value (Any, optional): Payload of the message. Defaults to None.
+        """
+        self.outbox += encode(kind, value)
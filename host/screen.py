@@ -3,7 +3,9 @@ Screen for human host to view answers and indicate if player answered correctly.
 """
 from collections import namedtuple
 import pygame
+from host.protocol import MessageType
 from util.constants import Colors
+from util.game_data import RoundGrid
 from util.util import display_text, Button,  Font
 
 class Host():
@@ -18,8 +20,12 @@ class Host():
             and Wrong buttons are shown after answer is given. Continue button is shown
             if no one rung in.
         timer (int): Milliseconds left for players to ring in
+        answer (str): Correct response to the current clue
+        game (dict of str: Any): Latest game state fields sent by the game (see StateSync)
         """
     def __init__(self):
+        self.answer = ''
+        self.game = {}
         self.rang_in = False
         self.timer_expired = False
         self.clicked = False
@@ -47,6 +53,25 @@ class Host():
                 self.clicked = True
         return False
 
+    def handle_message(self, kind, value):
+        """
+        Updates the screen with a message from the game.
+
+        Args:
+            kind (MessageType): Type of message
+            value (Any): Payload of the message
+        """
+        if kind == MessageType.STATE:
+            self.game.update(value)
+            return
+        print(kind.name, value)
+        if kind == MessageType.CONTINUE:
+            self.timer_expired = True
+        elif kind == MessageType.RANG_IN:
+            self.rang_in = True
+        elif kind == MessageType.ANSWER:
+            self.answer = value
+
     def update(self):
         """Checks if players have rung in or time has expired for the question to be answered.
         Waits for host to click a button to return to board."""
@@ -84,6 +109,7 @@ class Host():
         screen.fill(Colors.BLUE)
 
         width, height = screen.get_size()
+        self.draw_status(screen)
         # draw answer
         display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
         if self.rang_in:
@@ -93,3 +119,28 @@ class Host():
         elif self.timer_expired:
             # draw continue button
             self.buttons.continue_button.draw(screen, (width*1/2, height*3/4))
+
+    def draw_status(self, screen):
+        """
+        Draws scores, the answer timer, and clues left on the board along the top of the screen.
+
+        Args:
+            screen (Surface): Pygame surface where status will be drawn
+        """
+        width, _ = screen.get_size()
+        scores = self.game.get('scores', [])
+        for i, score in enumerate(scores):
+            color = Colors.GOLD if self.game.get('rung_in') == i else Colors.WHITE
+            text = Font.category.render('P' + str(i+1) + ': $' + str(score), True, color)
+            screen.blit(text, text.get_rect(midleft=(20 + i*220, 40)))
+        timer = self.game.get('timer')
+        if timer is not None:
+            text = Font.category.render(str(round(timer / 1000, 1)), True, Colors.WHITE)
+            screen.blit(text, text.get_rect(center=(width - 180, 40)))
+        # miniature board with a lit cell for each clue still on the board
+        taken = self.game.get('taken', 0)
+        for column in range(RoundGrid.COLUMNS):
+            for row in range(RoundGrid.ROWS):
+                if not taken >> (column * RoundGrid.ROWS + row) & 1:
+                    rect = (width - 110 + column * 15, 15 + row * 10, 13, 8)
+                    screen.fill(Colors.GOLD, rect)
@@ -1,51 +1,196 @@
 """
 Server class for game to interface with host screen.
+
+Network traffic is handled on a background thread, so the game loop never waits on a
+socket. Messages are framed with the protocol in host.protocol.
+
+Usage Example:
+    server = Server()
+    server.send(MessageType.ANSWER, "What is a Raspberry Pi?")
+    correct = server.poll() # None if the host has not responded
 """
+from queue import SimpleQueue, Empty
+import selectors
 import socket
-import select
+import threading
+from host.protocol import Connection, MessageType, ProtocolError
 from host.socket_util import get_lan
 
+# pylint: disable=R0902
 class Server():
-    """Class for managing communication with Host when game is run in hosted mode."""
-    def __init__(self, port=8081):
-        lan = get_lan()
+    """Class for managing communication with Host when game is run in hosted mode.
+
+    A selector thread accepts any number of host clients, reads their messages into a
+    queue, and writes out messages sent by the game. Messages sent by the game go to every
+    client, and a message from any client is handled as the host's response.
+
+    Attributes:
+        server (socket): Listening socket host clients connect to
+        messages (SimpleQueue): Messages (type, value) received from clients, not yet polled
+        connections (dict of socket: Connection): Connected clients
+        wait (boolean): True while the game is waiting for the host to click continue
+        joined (int): Number of clients that have connected since the server started
+        thread (Thread): Thread that runs the selector loop
+    """
+    def __init__(self, port=8081, address=None):
+        """Initializes Server Object
+
+        Args:
+            port (int, optional): Port host clients connect to. Defaults to 8081.
+            address (str, optional): Address to listen on. Defaults to the LAN address.
+        """
+        if address is None:
+            address = get_lan()
         # start server
         print("Starting host server...")
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server.bind((lan, port))
-        self.server.listen(1)
-        self.client_poller = select.poll()
-        self.client_poller.register(self.server, select.POLLIN)
-        self.client = None
-        self.poller = select.poll()
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((address, port))
+        self.server.listen()
+        self.server.setblocking(False)
+        self.messages = SimpleQueue()
+        self.connections = {}
         self.wait = False
+        self.joined = 0
+        self.running = True
+        self._lock = threading.Lock()
+        # writing to the waker interrupts select() so new messages are sent right away
+        self._waker, self._wake = socket.socketpair()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.server, selectors.EVENT_READ)
+        self._selector.register(self._waker, selectors.EVENT_READ)
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
 
-    def send(self, msg):
-        """Send message to host."""
-        self.client.send(msg.encode())
+    def send(self, kind, value=None):
+        """Send message to every connected host.
 
-    def poll_for_connection(self):
-        """Receive connection from host."""
-        events = self.client_poller.poll(10)
-        if len(events) > 0:
-            client, _ = self.server.accept()
-            print("Connected to host")
-            self.client = client
-            self.poller.register(client, select.POLLIN)
+        Args:
+            kind (MessageType): Type of message
+            value (Any, optional): Payload of the message. Defaults to None.
+        """
+        with self._lock:
+            for connection in self.connections.values():
+                connection.write(kind, value)
+        self._wake.send(b'\0')
 
     def is_connected(self):
-        """Returns whether host is connected."""
-        return self.client is not None
+        """Returns whether a host is connected."""
+        with self._lock:
+            return len(self.connections) > 0
 
     def poll(self):
-        """Wait for response from host."""
-        events = self.poller.poll(10)
-        if len(events) > 0:
-            resp = self.client.recv(512).decode()
-            self.wait = False
-            return resp
-        return False
+        """Returns the host's next response without waiting.
+
+        Returns:
+            boolean: True if the host ruled the answer correct or clicked continue, False if
+                the answer was incorrect, or None if no response has arrived
+        """
+        while True:
+            try:
+                kind, value = self.messages.get_nowait()
+            except Empty:
+                return None
+            if kind == MessageType.RESPONSE:
+                self.wait = False
+                return bool(value)
 
     def close(self):
-        """Close connection with host."""
+        """Close connections with hosts and stop the server thread."""
+        self.running = False
+        self._wake.send(b'\0')
+        self.thread.join()
+        for sock in list(self.connections):
+            sock.close()
+        self._selector.close()
+        self._waker.close()
+        self._wake.close()
         self.server.close()
+
+    def serve(self):
+        """Runs the selector loop until the server is closed."""
+        while self.running:
+            for key, events in self._selector.select():
+                if key.fileobj is self.server:
+                    self.accept()
+                elif key.fileobj is self._waker:
+                    self._waker.recv(4096)
+                    self.update_interest()
+                else:
+                    if events & selectors.EVENT_READ:
+                        self.receive(key.fileobj)
+                    if events & selectors.EVENT_WRITE and key.fileobj in self.connections:
+                        self.flush(key.fileobj)
+
+    def accept(self):
+        """Accept a new host client."""
+        client, address = self.server.accept()
+        client.setblocking(False)
+        print("Connected to host", address)
+        with self._lock:
+            self.connections[client] = Connection(address)
+        self._selector.register(client, selectors.EVENT_READ)
+        self.joined += 1
+
+    def receive(self, client):
+        """Read from a client, putting each complete message on the queue.
+
+        Args:
+            client (socket): Client with data waiting to be read
+        """
+        try:
+            data = client.recv(65536)
+        except OSError:
+            data = b''
+        try:
+            messages = self.connections[client].read(data)
+        except ProtocolError as error:
+            print(error)
+            data = b''
+        if len(data) == 0:
+            self.disconnect(client)
+            return
+        for msg in messages:
+            self.messages.put(msg)
+
+    def flush(self, client):
+        """Send as much waiting data to a client as the socket will accept.
+
+        Args:
+            client (socket): Client ready to be written to
+        """
+        with self._lock:
+            connection = self.connections[client]
+            try:
+                sent = client.send(connection.outbox)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                sent = None
+            if sent is not None:
+                del connection.outbox[:sent]
+        if sent is None:
+            self.disconnect(client)
+        else:
+            self.update_interest()
+
+    def update_interest(self):
+        """Watch clients for writing only while they have data waiting to be sent."""
+        with self._lock:
+            for client, connection in self.connections.items():
+                events = selectors.EVENT_READ
+                if len(connection.outbox) > 0:
+                    events |= selectors.EVENT_WRITE
+                self._selector.modify(client, events)
+
+    def disconnect(self, client):
+        """Forget a client that has closed its connection.
+
+        Args:
+            client (socket): Client that disconnected
+        """
+        self._selector.unregister(client)
+        with self._lock:
+            connection = self.connections.pop(client)
+        client.close()
+        print("Host disconnected", connection.address)
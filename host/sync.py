@@ -0,0 +1,96 @@
+"""
+Keeps host displays in sync with the game by sending only what has changed.
+
+Usage Example:
+    sync = StateSync(interval=100)
+    sync.publish(server, state, player_manager, now) # once per frame
+"""
+from host.protocol import MessageType
+from util.constants import GameState
+
+class StateSync():
+    """Publishes incremental game state to host clients at a bounded rate.
+
+    Each publish compares a snapshot of the game with what was last sent and sends only the
+    fields that changed, in a single STATE message. Publishing at most once per interval
+    coalesces changes made between publishes into one message. When a new client connects
+    the whole snapshot is sent again so it can catch up.
+
+    Snapshot fields:
+        state (str): Name of the current game state
+        round (int): Current round, starting from 0
+        scores (list of int): Score of each player
+        taken (int): Bitmap of clues taken off the board this round (see RoundGrid.taken)
+        rung_in (int): Id of the player answering, or None
+        control (int): Id of the player who picks the next clue
+        timer (int): Milliseconds left for the player who rang in to answer, rounded up to
+            a tenth of a second, or None if no one has rung in
+        value (int): Dollar value of the current clue, or None
+
+    Attributes:
+        interval (int): Minimum milliseconds between published messages
+        sent (dict of str: Any): Last value of each field sent to the clients
+        last_publish (int): Scheduler time of the last publish, or None
+        joined (int): Number of clients that had connected at the last publish
+    """
+    def __init__(self, interval=100):
+        """Initializes StateSync Object
+
+        Args:
+            interval (int, optional): Minimum milliseconds between messages. Defaults to 100.
+        """
+        self.interval = interval
+        self.sent = {}
+        self.last_publish = None
+        self.joined = 0
+
+    def snapshot(self, state, player_manager):
+        """Returns the fields of the game state that host displays show.
+
+        Args:
+            state (State): The game's current state
+            player_manager (PlayerManager): Reference to manager that keeps track of players
+        """
+        store = state.store
+        round_ = store.get('round')
+        taken = 0
+        if 'data' in store and round_ in store['data']:
+            taken = store['data'][round_].taken
+        clue = None
+        if state.name in (GameState.QUESTION, GameState.DAILY_DOUBLE):
+            clue = store.get('clue')
+        timer = None
+        if player_manager.rung_in is not None:
+            timer = -(-player_manager.timer // 100) * 100 # round up
+        return {
+            'state': state.name.name,
+            'round': round_,
+            'scores': [player.score for player in player_manager.players],
+            'taken': taken,
+            'rung_in': player_manager.rung_in,
+            'control': player_manager.control,
+            'timer': timer,
+            'value': None if clue is None else clue.value,
+        }
+
+    def publish(self, server, state, player_manager, now):
+        """Sends fields that changed since the last publish, if the interval has passed.
+
+        Args:
+            server (Server): Server connected to the host clients
+            state (State): The game's current state
+            player_manager (PlayerManager): Reference to manager that keeps track of players
+            now (int): Current time in milliseconds
+        """
+        if self.last_publish is not None and now - self.last_publish < self.interval:
+            return
+        self.last_publish = now
+        if server.joined != self.joined:
+            # a client connected, send it everything
+            self.joined = server.joined
+            self.sent = {}
+        delta = {key: value for key, value in self.snapshot(state, player_manager).items()
+            if key not in self.sent or self.sent[key] != value}
+        if len(delta) > 0:
+            server.send(MessageType.STATE, delta)
+            self.sent.update(delta)
@@ -0,0 +1,95 @@
+"""
+Measure how long messages take to encode, decode, and travel between game and host.
+
+Starts a host server on the loopback interface and a client that answers every clue it is
+sent, like a host clicking Correct as fast as possible.
+
+Usage Example:
+    $ python host_benchmark.py --count 2000 --size 200
+"""
+import argparse
+import socket
+import statistics
+import threading
+import time
+from host.protocol import Connection, MessageType, encode
+from host.server import Server
+
+def echo_client(port, count):
+    """Connect to the server and respond to every answer it sends.
+
+    Args:
+        port (int): Port the server is listening on
+        count (int): Number of answers to respond to before disconnecting
+    """
+    sock = socket.create_connection(('127.0.0.1', port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    connection = Connection()
+    answered = 0
+    while answered < count:
+        for kind, _ in connection.read(sock.recv(65536)):
+            if kind == MessageType.ANSWER:
+                connection.write(MessageType.RESPONSE, True)
+                answered += 1
+        sock.sendall(connection.outbox)
+        connection.outbox.clear()
+    sock.close()
+
+def summarize(name, times):
+    """Print the distribution of measured times.
+
+    Args:
+        name (str): What was measured
+        times (list of float): Measured times in seconds
+    """
+    times = sorted(time * 1e6 for time in times)
+    print(f'{name}: median {statistics.median(times):.1f} us, '
+        f'p99 {times[int(len(times) * 0.99) - 1]:.1f} us, max {times[-1]:.1f} us')
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark the host message protocol.')
+    parser.add_argument('--count', type=int, default=1000,
+        help='number of round trips to time (default: 1000)')
+    parser.add_argument('--size', type=int, default=200,
+        help='characters in each answer (default: 200)')
+    parser.add_argument('--port', type=int, default=8082,
+        help='loopback port to run the server on (default: 8082)')
+    args = parser.parse_args()
+    answer = 'x' * args.size
+
+    # codec alone
+    frames = [encode(MessageType.ANSWER, answer) for _ in range(args.count)]
+    encode_times = []
+    decode_times = []
+    connection = Connection()
+    for frame in frames:
+        start = time.perf_counter()
+        encode(MessageType.ANSWER, answer)
+        encode_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        connection.read(frame)
+        decode_times.append(time.perf_counter() - start)
+    print(f'frame size: {len(frames[0])} bytes for a {args.size} character answer')
+    summarize('encode', encode_times)
+    summarize('decode', decode_times)
+
+    # round trips through the server
+    server = Server(args.port, address='127.0.0.1')
+    client = threading.Thread(target=echo_client, args=(args.port, args.count))
+    client.start()
+    while not server.is_connected():
+        time.sleep(0.001)
+    round_trips = []
+    for _ in range(args.count):
+        start = time.perf_counter()
+        server.send(MessageType.ANSWER, answer)
+        while server.poll() is None:
+            time.sleep(0) # let the server thread run
+        round_trips.append(time.perf_counter() - start)
+    client.join()
+    server.close()
+    summarize('round trip', round_trips)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Import clues into the local clue bank so games can be played without a network connection.
+
+Usage Example:
+    $ python import_clues.py clues.jsonl more_clues.jsonl --db clues.db
+    $ python import_clues.py --download 20
+"""
+import argparse
+import time
+from util.clue_bank import ClueBank, parse_line
+from util.fetch import FetchClient
+
+def main():
+    """Import clue dumps or download games into the clue bank."""
+    parser = argparse.ArgumentParser(description='Import clues into the local clue bank.')
+    parser.add_argument('dumps', nargs='*',
+        help='JSON lines files with one clue or one game on each line')
+    parser.add_argument('--db', default='clues.db', help='clue bank to import into '
+        '(default: clues.db)')
+    parser.add_argument('--download', type=int, default=0, metavar='N',
+        help='also download N games from the clue API')
+    args = parser.parse_args()
+    bank = ClueBank(args.db)
+    for path in args.dumps:
+        print(path + ': added ' + str(bank.import_jsonl(path)) + ' clues')
+    client = FetchClient.shared()
+    for i in range(args.download):
+        added = bank.add_clues(parse_line(client.get_json('/api', timeout=120)))
+        print('game ' + str(i+1) + ': added ' + str(added) + ' clues')
+    if args.download > 0:
+        print(client.report())
+    print(str(bank.count()) + ' clues in ' + args.db)
+
+    # check that a game can be generated, and how long it takes
+    start = time.perf_counter()
+    game = bank.generate_game()
+    elapsed = (time.perf_counter() - start) * 1000
+    if game is None:
+        print('Not enough complete categories to generate a game yet')
+    else:
+        print(f'Generated a game in {elapsed:.1f} ms')
+    bank.close()
+
+if __name__ == "__main__":
+    main()
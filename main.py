@@ -2,43 +2,97 @@
 
   Usage Example:
     $ python main.py
+    $ python main.py --dirty-rects --fps 30 --idle-fps 5 --tie-window 2
+    $ python main.py --clue-bank clues.db
+    $ python main.py --prefetch-games 3 --prefetch-tie-breakers 5
+    $ python main.py --clue-api http://localhost:8000
+    $ python main.py --profile profile.csv
 """
+import argparse
+import os
 import pygame
 from game import Game
+from player.arbiter import RingInArbiter
+from player.player_manager import PlayerManager
 from states.board import Board
 from states.categories import IntroScreen
 from states.daily_double import DailyDouble
 from states.final import Final
 from states.hall_of_fame import Hall
-from states.loading import LoadingScreen
+from states.loading import LoadingScreen, is_valid_clue, is_valid_game, load_game
 from states.options import OptionsScreen
 from states.question import Question
 from states.stats import Stats
-from states.tie_breaker import TieBreaker
+from states.tie_breaker import TieBreaker, fetch_tie_breaker
 from states.title import TitleScreen
-from util.util import Font, SoundEffects
+from util.clue_bank import ClueBank
+from util.fetch import API_URL, FetchClient
+from util.prefetch import PrefetchPool
+from util.validation import GameValidator
+from util.util import Font, SoundEffects, TTS
+from util.frame_rate import FrameRatePolicy
+from util.profiler import FrameProfiler
 from util.constants import GameState
 
 def main():
     """Initializes pygame display, loads resources, & launches game."""
+    parser = argparse.ArgumentParser(description='Quiz game built on Raspberry Pi 4 hardware.')
+    parser.add_argument('--dirty-rects', action='store_true',
+        help='only redraw regions of the screen that change each frame')
+    parser.add_argument('--fps', type=int, default=60,
+        help='frame rate while buzzers are live or timers are running (default: 60)')
+    parser.add_argument('--idle-fps', type=int, default=5,
+        help='frame rate while waiting for a click or key press (default: 5)')
+    parser.add_argument('--tie-window', type=float, default=2,
+        help='milliseconds within which buzzer presses count as simultaneous (default: 2)')
+    parser.add_argument('--clue-bank', default='clues.db',
+        help='clue database to generate games from without a network connection, '
+            'see import_clues.py (default: clues.db)')
+    parser.add_argument('--prefetch-games', type=int, default=2, metavar='N',
+        help='validated games to keep ready in the background (default: 2)')
+    parser.add_argument('--prefetch-tie-breakers', type=int, default=3, metavar='M',
+        help='tie breaker clues to keep ready in the background (default: 3)')
+    parser.add_argument('--clue-api', default=API_URL, metavar='URL',
+        help='server to download games and tie breakers from (default: ' + API_URL + ')')
+    parser.add_argument('--profile', metavar='PATH',
+        help='save how long each part of every frame took to PATH at exit, as CSV if it '
+            'ends in .csv and JSON otherwise')
+    args = parser.parse_args()
+    FetchClient.configure(base_url=args.clue_api)
+    clue_bank = ClueBank(args.clue_bank) if os.path.exists(args.clue_bank) else None
+    validator = GameValidator(clue_bank)
+    games = PrefetchPool('games', args.prefetch_games, lambda: load_game(clue_bank, validator),
+        is_valid_game)
+    tie_breakers = PrefetchPool('tie_breakers', args.prefetch_tie_breakers,
+        lambda: fetch_tie_breaker(clue_bank), is_valid_clue)
     pygame.init()
     SoundEffects.load_sounds()
     Font.load_fonts()
     screen = pygame.display.set_mode((1600,1000))
+    profiler = FrameProfiler()
     game = Game(screen, {
         GameState.TITLE: TitleScreen(),
         GameState.OPTIONS: OptionsScreen(),
-        GameState.LOADING: LoadingScreen(),
+        GameState.LOADING: LoadingScreen(clue_bank, games, validator),
         GameState.INTRO: IntroScreen(),
         GameState.BOARD: Board(),
         GameState.QUESTION: Question(),
         GameState.DAILY_DOUBLE: DailyDouble(),
         GameState.FINAL: Final(),
         GameState.HALL: Hall(),
-        GameState.TIE: TieBreaker(),
+        GameState.TIE: TieBreaker(clue_bank, tie_breakers),
         GameState.STATS: Stats()
-    })
+    }, dirty_rendering=args.dirty_rects,
+        frame_rate=FrameRatePolicy(args.fps, args.idle_fps),
+        player_manager=PlayerManager(RingInArbiter(tie_window=args.tie_window / 1000)),
+        profiler=profiler)
     game.run()
+    if args.profile:
+        profiler.dump(args.profile)
+    games.close()
+    tie_breakers.close()
+    print(FetchClient.shared().report())
+    TTS.shutdown()
     pygame.quit()
 
 
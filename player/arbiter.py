@@ -0,0 +1,130 @@
+"""
+Decides which player rang in first from buzzer presses made on other threads.
+
+Usage Example:
+    arbiter = RingInArbiter(tie_window=0.002)
+    arbiter.press(player_id, time.perf_counter()) # on gpiozero's thread
+    for player_id, pressed in arbiter.collect(): # on the game loop's thread
+        ...
+    winner = arbiter.decide(time.perf_counter())
+"""
+from queue import SimpleQueue, Empty
+import time
+
+class RingInArbiter():
+    """Arbitrates ring-ins between players.
+
+    Buzzer callbacks only put a timestamped press on a queue, which is safe to do from
+    any thread without a lock. Everything else happens on the game loop's thread: presses
+    are taken off the queue, early presses lock the player out until a deadline, and the
+    winner is the earliest valid press once no earlier press can still arrive.
+
+    Attributes:
+        tie_window (float): Seconds within which presses are treated as simultaneous.
+            The winner is not decided until this long after the earliest valid press.
+        lockout (float): Seconds a player is locked out for after pressing too early
+        presses (SimpleQueue): Presses (player id, time pressed) not yet collected
+        candidates (list of (float, int)): Valid presses (time pressed, player id) since
+            the winner was last decided
+        locked_until (dict of int: float): Time each locked out player can ring in again
+        last_win (dict of int: int): Order in which each player last won a ring-in,
+            used to break ties in favour of the player who won least recently
+        wins (int): Number of ring-ins decided so far
+    """
+    def __init__(self, tie_window=0.002, lockout=0.25):
+        """Initializes RingInArbiter Object
+
+        Args:
+            tie_window (float, optional): Seconds within which presses are treated as
+                simultaneous. Defaults to 0.002.
+            lockout (float, optional): Seconds a player is locked out after pressing too
+                early. Defaults to 0.25.
+        """
+        self.tie_window = tie_window
+        self.lockout = lockout
+        self.presses = SimpleQueue()
+        self.candidates = []
+        self.locked_until = {}
+        self.last_win = {}
+        self.wins = 0
+
+    def press(self, player_id, pressed=None):
+        """Records a button press. Safe to call from any thread.
+
+        Args:
+            player_id (int): Id number of player who pressed their button
+            pressed (float, optional): Time (from time.perf_counter) of the press.
+                Defaults to now.
+        """
+        if pressed is None:
+            pressed = time.perf_counter()
+        self.presses.put((player_id, pressed))
+
+    def collect(self):
+        """Takes every press off the queue, in the order they were pressed.
+
+        Returns:
+            list of (int, float): Tuple (player id, time pressed) of each press
+        """
+        presses = []
+        while True:
+            try:
+                presses.append(self.presses.get_nowait())
+            except Empty:
+                break
+        return sorted(presses, key=lambda press: press[1])
+
+    def is_locked_out(self, player_id, when):
+        """Returns True if a player is locked out at the given time.
+
+        Args:
+            player_id (int): Id number of player
+            when (float): Time (from time.perf_counter) to check
+        """
+        return when < self.locked_until.get(player_id, 0)
+
+    def accept(self, player_id, pressed):
+        """Makes a press a candidate to win the ring-in.
+
+        Args:
+            player_id (int): Id number of player who pressed their button
+            pressed (float): Time (from time.perf_counter) of the press
+        """
+        self.candidates.append((pressed, player_id))
+
+    def lock_out(self, player_id, pressed):
+        """Locks out a player who pressed their button too early.
+
+        Args:
+            player_id (int): Id number of player who pressed their button
+            pressed (float): Time (from time.perf_counter) of the press
+        """
+        self.locked_until[player_id] = pressed + self.lockout
+
+    def decide(self, now):
+        """Picks the winner once the tie window after the earliest valid press has passed.
+
+        Args:
+            now (float): Current time (from time.perf_counter)
+
+        Returns:
+            (int, float): Tuple (player id, time pressed) of the winner, or None if there is
+                no winner yet
+        """
+        if len(self.candidates) == 0:
+            return None
+        first = min(self.candidates)[0]
+        if now < first + self.tie_window:
+            # a press at nearly the same time might not have been collected yet
+            return None
+        tied = [(self.last_win.get(player_id, -1), pressed, player_id)
+            for pressed, player_id in self.candidates if pressed <= first + self.tie_window]
+        _, pressed, player_id = min(tied)
+        self.last_win[player_id] = self.wins
+        self.wins += 1
+        self.candidates = []
+        return player_id, pressed
+
+    def clear(self):
+        """Discards candidates that have not won yet. Lockouts still apply."""
+        self.candidates = []
@@ -25,3 +25,8 @@ class Buzzer:
     def light_off(self):
         """Turn off a player's light."""
         self.led.off()
+
+    def close(self):
+        """Release the button and led pins so they can be used again."""
+        self.buzzer.close()
+        self.led.close()
@@ -3,10 +3,14 @@ Manager that keeps track of players and provides an easy interface
 for other classes to access/update player score and status.
 """
 from types import SimpleNamespace
+import time
 import gpiozero
+from player.arbiter import RingInArbiter
 from player.player import Player
+from util.scheduler import Scheduler
 buzzer_pins = [6,21,17, 22, 26]
 led_pins = [19, 16, 12, 27, 13]
+# pylint: disable=R0902
 class PlayerManager():
     """
     Class for keeping track of players and hardware.
@@ -18,8 +22,24 @@ class PlayerManager():
         ring_in (int): The id of the player who rung in
         control (int): The id of the player who has control of the board (picks the next question)
         timer (int): Time in milliseconds left to answer question
+        green_time (float): Time (from time.perf_counter) the green light last turned on
+        arbiter (RingInArbiter): Decides which player rung in first
+        scheduler (Scheduler): Runs the countdown for answering questions
+        answer_timer (Timer): Countdown for the player who rung in, or None if no one has
+        timed_out (boolean): True when time to answer has run out and poll() has not
+            reported it yet
     """
-    def __init__(self):
+    ANSWER_TIME = 5000
+
+    def __init__(self, arbiter=None, scheduler=None):
+        """Initializes PlayerManager Object
+
+        Args:
+            arbiter (RingInArbiter, optional): Decides which player rung in first.
+                Defaults to RingInArbiter().
+            scheduler (Scheduler, optional): Runs the countdown for answering questions.
+                Defaults to Scheduler().
+        """
         self.players = []
         try:
             self.stoplight = gpiozero.RGBLED(red=18, blue=24, green=23)
@@ -28,12 +48,20 @@ class PlayerManager():
         self.stoplight.color = (0,0,0)
         self.rung_in = None
         self.control = 0
-        self.timer = 5000
         self.green = False
+        self.green_time = 0
+        self.arbiter = RingInArbiter() if arbiter is None else arbiter
+        self.scheduler = Scheduler() if scheduler is None else scheduler
+        self.answer_timer = None
+        self.timed_out = False
         self.triple_stumpers = 0
 
     def initialize_players(self, num_players):
-        """Add players to game based on number specified in settings."""
+        """Add players to game based on number specified in settings, replacing the
+        players from the last game."""
+        for player in self.players:
+            player.buzzer.close()
+        self.players = []
         for i in range(num_players):
             player = Player(led_pins[i], buzzer_pins[i], i, self)
             self.players.append(player)
@@ -49,10 +77,12 @@ class PlayerManager():
         Called immediately after a question is read."""
         self.stoplight.color = (0, 1, 0)
         self.rung_in = None
-        self.timer = 5000
+        self.stop_answer_timer()
+        self.arbiter.clear()
         for player in self.players:
             if eligible == 'all' or player in eligible:
                 player.eligible = True
+        self.green_time = time.perf_counter()
         self.green = True
 
     def reset(self):
@@ -61,36 +91,91 @@ class PlayerManager():
         Called after question is answered or timer has experied."""
         self.stoplight.color = (0,0,0)
         self.green = False
+        self.arbiter.clear()
+        self.stop_answer_timer()
         for player in self.players:
             player.eligible = False
             player.buzzer.light_off()
 
-    def poll(self, elapsed_time):
-        """Counts down player timer and checks to see if time has expired.
+    @property
+    def timer(self):
+        """Time in milliseconds left to answer question."""
+        if self.answer_timer is None:
+            return self.ANSWER_TIME
+        return self.answer_timer.remaining
 
-        Args:
-            elapsed_time (int): Milliseconds that have passed since poll() was last called
+    def poll(self):
+        """Checks to see if the player who rung in has run out of time to answer.
 
         Returns:
-            boolean: True if player timer has expired
+            boolean: True the first time poll() is called after the time has expired
         """
-        # count down timer of player that rung in
-        self.timer -= elapsed_time
-        if self.timer <= 0:
-            return True
+        timed_out = self.timed_out
+        self.timed_out = False
+        return timed_out
 
-        return False
+    def time_up(self):
+        """Called by the scheduler when the player who rung in runs out of time."""
+        self.timed_out = True
 
-    def ring_in(self, player_id):
+    def stop_answer_timer(self):
+        """Cancels the countdown for answering, resetting the timer display."""
+        if self.answer_timer is not None:
+            self.answer_timer.cancel()
+            self.answer_timer = None
+        self.timed_out = False
+
+    def press(self, player_id, pressed):
+        """Queues a button press for the game loop to arbitrate. Safe to call from any thread.
+
+        Args:
+            player_id (int): Id number of player who pressed their button
+            pressed (float): Time (from time.perf_counter) the player pressed their button
+        """
+        self.arbiter.press(player_id, pressed)
+
+    def arbitrate(self):
+        """Handles button presses since the last frame and decides who rung in.
+
+        Players who press before the green light, or when they are not allowed to ring in,
+        are locked out for a moment. Called once per frame from the game loop."""
+        for player_id, pressed in self.arbiter.collect():
+            player = self.players[player_id]
+            live = self.green and pressed >= self.green_time
+            player.stats.record_buzzer()
+            if not live:
+                player.stats.record_early()
+            elif player.eligible:
+                # only presses that could win count towards reaction time
+                player.stats.record_reaction((pressed - self.green_time) * 1000)
+            if self.arbiter.is_locked_out(player_id, pressed):
+                continue
+            if live and player.eligible:
+                self.arbiter.accept(player_id, pressed)
+            else:
+                # Player rung in too early, lock them out
+                self.arbiter.lock_out(player_id, pressed)
+        winner = self.arbiter.decide(time.perf_counter())
+        if winner is not None:
+            self.ring_in(*winner)
+
+    def ring_in(self, player_id, pressed):
         """Records first player to ring in and locks out other players.
 
         Args:
             player_id (int): Id number of player who rung in
+            pressed (float): Time (from time.perf_counter) the player pressed their button
         """
         self.rung_in = player_id
         for player in self.players:
             player.eligible = False
         self.stoplight.color = (0, 0, 0)
+        self.stop_answer_timer()
+        self.answer_timer = self.scheduler.schedule(self.ANSWER_TIME, self.time_up)
+        player = self.players[player_id]
+        player.stats.record_answer()
+        player.stats.record_frame_latency((time.perf_counter() - pressed) * 1000)
+        player.buzzer.light_up()
 
     def update(self, correct, value, hosted=False):
         """Adds clue's dollar amount to player's score if answer is correct,
@@ -109,21 +194,23 @@ class PlayerManager():
         elif hosted:
             # allow players to ring in again
             self.stoplight.color = (0, 1, 0)
-            self.timer = 5000
+            self.stop_answer_timer()
             for player in self.players:
                 player.eligible = True
             self.players[self.rung_in].eligible = False
+            self.green_time = time.perf_counter()
 
         self.rung_in = None
 
     def second_chance(self):
         """Allow players to ring in again after failed guess"""
         self.stoplight.color = (0, 1, 0)
-        self.timer = 5000
+        self.stop_answer_timer()
         for player in self.players:
-            player.led.off()
+            player.buzzer.light_off()
             player.eligible = True
         self.players[self.rung_in].eligible = False
+        self.green_time = time.perf_counter()
 
     def update_control(self):
         """Gives control to the player with the lowest score at start of second round."""
@@ -135,19 +222,13 @@ class PlayerManager():
 
     def show_control(self):
         """Turns on light of player who has control."""
-        self.players[self.control].led.on()
+        self.players[self.control].buzzer.light_up()
 
     def get_winner(self):
         "Returns id number of player with highest score."
-        highest = 0
-        winners = []
-        for player in self.players:
-            if player.score > highest:
-                highest = player.score
-        for player in self.players:
-            if player.score == highest:
-                winners.append(player)
-        return winners
+        # every score can be negative, so start from the highest one rather than 0
+        highest = max(player.score for player in self.players)
+        return [player for player in self.players if player.score == highest]
 
     def sort_players(self):
         """Get list of players sorted according to final reveal order.
@@ -1,7 +1,10 @@
 """
 Module for keeping track of player stats.
 """
+import statistics
+from util.stats import percentile
 
+# pylint: disable=R0902
 class PlayerStats:
     """
     Statistics of player buzzer attempts and questions answered.
@@ -14,6 +17,11 @@ class PlayerStats:
             are negative if question was answered incorrectly.
         buzzers (int): Number of times buzzer was physically pressed on a question.
         active_round (bool): True if and only if players can ring in currently.
+        reaction_times (list of float): Milliseconds from the green light turning on to the
+            player pressing their button, for every press while they could ring in.
+        early_buzzes (int): Number of presses on a question before the green light came on.
+        frame_latencies (list of float): Milliseconds from the player's winning press to
+            the game loop deciding they rung in.
     """
     def __init__(self) -> None:
         self.attempts = 0
@@ -22,12 +30,49 @@ class PlayerStats:
         self.daily_doubles = []
         self.buzzers = 0
         self.active_round = False
+        self.reaction_times = []
+        self.early_buzzes = 0
+        self.frame_latencies = []
 
     def record_buzzer(self):
         """Record each time a player physically presses their button."""
         if self.active_round:
             self.buzzers += 1
 
+    def record_reaction(self, reaction_time):
+        """Record how long after the green light a player pressed their button.
+
+        Args:
+            reaction_time (float): Milliseconds from green light to button press
+        """
+        self.reaction_times.append(reaction_time)
+
+    def record_early(self):
+        """Record a press before the green light came on."""
+        if self.active_round:
+            self.early_buzzes += 1
+
+    def record_frame_latency(self, latency):
+        """Record how long it took the game loop to decide a player rung in.
+
+        Args:
+            latency (float): Milliseconds from button press to the ring-in being decided
+        """
+        self.frame_latencies.append(latency)
+
+    def reaction_summary(self):
+        """Summarize the distribution of reaction times.
+
+        Returns:
+            (float, float, float, float): Tuple (best, median, 90th percentile, worst) of
+                reaction times in milliseconds, or None if player never pressed their button
+                while the green light was on.
+        """
+        if len(self.reaction_times) == 0:
+            return None
+        times = sorted(self.reaction_times)
+        return (times[0], statistics.median(times), percentile(times, 90), times[-1])
+
     def record_clue(self):
         """Players can now ring in."""
         self.active_round = True
@@ -60,4 +105,5 @@ class PlayerStats:
         print('Questions answered: ' + str(self.questions_answered))
         print('Questions correct: ' + str(self.correct))
         print('Daily doubles answered: ' + str(self.daily_doubles))
+        print('Reaction times (best, median, p90, worst): ' + str(self.reaction_summary()))
         print('\n')
@@ -6,4 +6,5 @@ from util.util import TTS, SoundEffects
 
 SoundEffects.load_sounds()
 TTS.play_speech(' This is a test')
-time.sleep(2)
+while TTS.is_busy():
+    time.sleep(0.1)
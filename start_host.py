@@ -2,10 +2,10 @@
 In hosted mode a human as the host can see answers and rule on responses.
 """
 import socket
-import select
 import time
 import pygame
 from host.screen import Host
+from host.protocol import Connection, MessageType
 from host.socket_util import get_lan
 from util.util import Font
 
@@ -23,38 +23,38 @@ def main():
             print("Trying to connect...")
             # connect to server
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((lan, 8080))
+            sock.connect((lan, 8081))
             break
         except ConnectionRefusedError:
             time.sleep(1)
 
-    poller = select.poll()
-    poller.register(sock, select.POLLIN)
+    sock.setblocking(False)
     print("Connected to server")
     clock = pygame.time.Clock()
-    text = ''
+    connection = Connection()
     while not quit_pressed:
-        events = poller.poll(10)
-        if len(events) > 0:
-            msg = sock.recv(512).decode()
-            print(msg)
-            if msg == 'continue':
-                host.timer_expired = True
-            elif msg == 'rangin':
-                host.rang_in = True
-            elif len(msg) > 8:
-                text = msg[8:]
+        try:
+            data = sock.recv(65536)
+        except BlockingIOError:
+            data = None
+        if data == b'':
+            print("Server closed connection")
+            break
+        for kind, value in connection.read(data or b''):
+            host.handle_message(kind, value)
         quit_pressed = host.handle_event()
         if quit_pressed:
             break
-        host.draw(screen, text)
+        host.draw(screen, host.answer)
         if host.update():
             # button was clicked, send back
-            sock.send(str(host.correct).encode())
+            connection.write(MessageType.RESPONSE, host.correct)
+            sock.sendall(connection.outbox)
+            connection.outbox.clear()
             if host.correct or host.timer_expired:
                 # reset
                 host.startup()
-                text = ''
+                host.answer = ''
         # Display screen
         pygame.display.flip()
         clock.tick(40)
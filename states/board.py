@@ -4,6 +4,7 @@ Draw game board & clue values.
 import pygame
 from util.constants import Colors, GameState
 from util.util import display_text, Font
+from util.game_data import RoundGrid
 from states.state import State
 
 class Board(State):
@@ -19,11 +20,18 @@ class Board(State):
             lines used to draw the game board. Each line is represented by an integer that
             is the pixel row (for horizontal lines) or pixel column (vertical lines) the
             line is centered on.
+        surface (Surface): Pre-rendered game board for the current round
+        surface_grid (RoundGrid): Clues the pre-rendered board was drawn for
+        dirty_cells (list of Rect): Cells that have been erased from the pre-rendered board
+            since the last frame
     """
     def __init__(self):
         super().__init__()
         self.grid = ([], [])
         self.show_score = True
+        self.surface = None
+        self.surface_grid = None
+        self.dirty_cells = []
 
     def startup(self, store, player_manager):
         """
@@ -63,33 +71,37 @@ class Board(State):
             self.clicked = False # reset flag
             horizontal_lines, vertical_lines = self.grid
             pos = pygame.mouse.get_pos()
-            i = 0 # game grid column that was clicked
-            while i < len(vertical_lines):
-                if pos[0] < vertical_lines[i]:
-                    break
-                i += 1
-            j = 0 # game grid row that was clicked
-            while j < len(horizontal_lines):
-                if pos[1] < horizontal_lines[j]:
-                    break
-                j += 1
-            if j < 2:
+            # game grid column and row that was clicked
+            column = min(pos[0] // vertical_lines.step, RoundGrid.COLUMNS - 1)
+            row = min(pos[1] // horizontal_lines.step, RoundGrid.ROWS)
+            if row < 1:
                 return GameState.BOARD
-            # Find which clue was clicked based on grid row, col
-            category = list(self.store['data'][round_].keys())[i-1]
-            clues = self.store['data'][round_][category]
-            clue = clues[j-2]
 
-            # check if clicked clue is still on board
+            # check if clicked clue is still on board, and remove it
+            clue = self.store['data'][round_].take(column, row - 1)
             if clue is not None:
                 self.store['clue'] = clue
-                clues[j-2] = None # remove clue from board
-                if clue['daily_double'] == 1:
+                self.erase_cell(column, row)
+                if clue.daily_double:
                     return GameState.DAILY_DOUBLE
                 return GameState.QUESTION
         return GameState.BOARD
 
     def draw(self, screen):
+        """Draws the pre-rendered game board, rendering it first if the round has changed.
+
+        Args:
+            screen (Surface): Pygame surface where game board will be drawn
+        """
+        grid = self.store['data'][self.store['round']]
+        if self.surface is None or self.surface_grid is not grid:
+            self.surface = pygame.Surface(screen.get_size())
+            self.surface_grid = grid
+            self.render_board(self.surface)
+        screen.blit(self.surface, (0, 0))
+        self.dirty_cells = []
+
+    def render_board(self, screen):
         """Draws game board and clue values, skipping exhausted clues.
 
         The game board consists of 6 rows and 6 columns. Each column contains the
@@ -115,31 +127,61 @@ class Board(State):
 
         # draw clues values on board
         round_ = self.store['round']
+        grid = self.store['data'][round_]
         for i, x_pos in enumerate(vertical_lines):
             for j, y_pos in enumerate(horizontal_lines):
-                if j>0 and i<6 and list(self.store['data'][round_].values())[i][j-1] is not None:
+                if j>0 and i<6 and not grid.is_taken(i, j-1):
                     draw_number(screen, j*200*(round_+1), (x_pos,y_pos, width//6, height//6))
 
         # draw categories
         x_pos = 0
-        for category in self.store['data'][round_]:
+        for category in grid.categories:
             display_text(screen, category, Font.category, (x_pos + 5, 0, x_pos + width//6 - 5,
                       height//6))
             x_pos += width//6 + 1
 
+    def erase_cell(self, column, row):
+        """Removes a clue value from the pre-rendered board.
+
+        Args:
+            column (int): Grid column of the clue, starting from 0
+            row (int): Grid row of the clue, starting from 0 for the category row
+        """
+        if self.surface is None:
+            return
+        horizontal_lines, vertical_lines = self.grid
+        bottom = self.surface.get_height() + 2 # bottom row has no line below it
+        if row + 1 < len(horizontal_lines):
+            bottom = horizontal_lines[row + 1]
+        # fill in the inside of the cell, leaving the grid lines around it
+        cell = pygame.Rect(vertical_lines[column] + 3, horizontal_lines[row] + 3,
+            vertical_lines[column + 1] - vertical_lines[column] - 5,
+            bottom - horizontal_lines[row] - 5)
+        self.surface.fill(Colors.BLUE, cell)
+        self.dirty_cells.append(cell)
+
+    def view(self):
+        """Board only changes when the round changes or a clue is removed."""
+        return self.store['round']
+
+    def get_dirty_rects(self, screen):
+        """Returns the whole board when the round changes, otherwise any erased cells.
+
+        Args:
+            screen (Surface): Pygame surface where game board will be drawn
+
+        Returns:
+            list of Rect: Rectangles that need to be redrawn. Empty if nothing has changed.
+        """
+        return super().get_dirty_rects(screen) or list(self.dirty_cells)
+
     def check_clues_left(self, round_):
         """Returns True if any clues are still left on board, False otherwise.
 
         Args:
             rount_ (int): Current round number (1 or 2).
         """
-        clues = self.store['data'][round_]
-        clues_left = False
-        for category in clues:
-            for clue in clues[category]:
-                if clue is not None:
-                    clues_left = True
-        return clues_left
+        return self.store['data'][round_].remaining > 0
 
 def draw_number(screen, num, rect):
     """Draws the clue value on the board.
@@ -151,13 +193,10 @@ def draw_number(screen, num, rect):
             centered inside. (x,y) is the pixel (relative to screen) of the top left
             corner of the rectangle. Width and height are the dimensions.
     """
-    text = Font.number.render('$' + str(num), True, Colors.GOLD)
-    text_shadow = Font.number.render('$' + str(num), True, Colors.BLACK)
+    text = '$' + str(num)
     center_rect = (rect[0] + rect[2]/2, rect[1] + rect[3]/2)
     offset_rect = (center_rect[0]+2, center_rect[1]+2)
     # draw text shadow
-    text_rect = text.get_rect(center=offset_rect)
-    screen.blit(text_shadow,text_rect)
+    Font.number_glyphs.draw(screen, text, Colors.BLACK, offset_rect)
     # draw text
-    text_rect = text.get_rect(center=center_rect)
-    screen.blit(text,text_rect)
+    Font.number_glyphs.draw(screen, text, Colors.GOLD, center_rect)
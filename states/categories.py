@@ -4,6 +4,7 @@ Read aloud categories and explanations.
 from states.state import State
 from util.constants import GameState, Colors
 from util.util import TTS, display_text, Font
+from util.game_data import RoundGrid
 
 class IntroScreen(State):
     """
@@ -23,9 +24,16 @@ class IntroScreen(State):
         self.index = 0
         # load categories for this round
         round_ = store['round']
-        self.categories = list(store['data'][round_].keys())
+        grid = store['data'][round_]
+        self.categories = grid.categories
         # Use Text-to-Speech
         TTS.play_speech("The categories are")
+        # synthesize the rest of the round's speech in the background
+        speech = [category_speech(grid, i) for i in range(len(self.categories))]
+        speech += [clue.speech for i in range(RoundGrid.COLUMNS) for clue in grid.column(i)]
+        if round_ == 1:
+            speech.append(store['data']['fj'].speech)
+        TTS.prefetch(speech)
 
     def update(self, player_manager, elapsed_time):
         """Checks if last speech has finished, and if so, introduces next category.
@@ -43,11 +51,7 @@ class IntroScreen(State):
                 # return to game board when all categories have been introduced
                 return GameState.BOARD
             # introduce next category
-            text = self.categories[self.index]
-            comments = self.store['data'][self.store['round']][text][0]['comments']
-            if comments != '-':
-                text += ' ' + comments # special category commentary
-            TTS.play_speech(text)
+            TTS.play_speech(category_speech(self.store['data'][self.store['round']], self.index))
             self.index += 1
 
         return GameState.INTRO
@@ -61,3 +65,20 @@ class IntroScreen(State):
             # draw text centered on screen with 100px buffer.
             display_text(screen, self.categories[self.index - 1], Font.number,
                       (100, 100, width-100, height-100))
+
+    def view(self):
+        """Redraw when the next category is introduced."""
+        return self.index
+
+def category_speech(grid, index):
+    """Returns text read aloud when introducing a category.
+
+    Args:
+        grid (RoundGrid): Clues for the current round
+        index (int): Grid column of the category
+    """
+    text = grid.categories[index]
+    comments = grid.column(index)[0].comments
+    if comments != '-':
+        text += ' ' + comments # special category commentary
+    return text
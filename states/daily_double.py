@@ -1,7 +1,7 @@
 """
 Implement Daily Double
 """
-import time
+from host.protocol import MessageType
 from util.constants import GameState, Colors
 from util.util import TTS, SoundEffects, display_text, Font
 from states.state import InputState
@@ -15,12 +15,14 @@ class DailyDouble(InputState):
 
     Attributes:
         wager (int): Dollar amount the player would like to wager
-        timer (int): Milliseconds left to respond to question
+        timer (Timer): Countdown to respond to question, or None until the question is read
     """
+    ANSWER_TIME = 6000
+
     def __init__(self):
         super().__init__()
         self.wager = None
-        self.timer = 6000
+        self.timer = None
         self.show_answer = False
 
     def startup(self, store, _player_manager):
@@ -28,16 +30,14 @@ class DailyDouble(InputState):
         self.store = store
         self.clicked = False
         self.wager = None
-        self.timer = 6000
+        self.timer = None
         self.show_answer = False
 
-    def countdown(self, elapsed_time):
-        """Wait for player to answer."""
-        self.timer -= elapsed_time
-        if self.timer <= 0:
-            SoundEffects.play(1) # time's up
-            if self.store['host'] is None:
-                self.show_answer = True
+    def time_up(self):
+        """Called by the scheduler when the player runs out of time to answer."""
+        SoundEffects.play(1) # time's up
+        if self.store['host'] is None:
+            self.show_answer = True
 
     def update(self, player_manager, elapsed_time):
         """Checks if the user has made a wager, reads the question, and counts down the time a
@@ -61,10 +61,9 @@ class DailyDouble(InputState):
                 self.wager = int(self.input)
                 if host is not None:
                     # send answer to host
-                    host.send("answer: " + self.store['clue']['question'])
-                    time.sleep(0.5)
-                    host.send("rangin")
-                TTS.play_speech(self.store['clue']['answer']) # read question
+                    host.send(MessageType.ANSWER, self.store['clue'].question)
+                    host.send(MessageType.RANG_IN)
+                TTS.play_speech(self.store['clue'].speech) # read question
         else:
             if self.show_answer:
                 # Determine if player answered correctly based on which button was clicked
@@ -75,12 +74,12 @@ class DailyDouble(InputState):
                         return GameState.BOARD
             else:
                 # Count down time left to answer
-                if self.timer > 0:
-                    self.countdown(elapsed_time)
+                if self.timer is None:
+                    self.timer = self.scheduler.schedule(self.ANSWER_TIME, self.time_up)
                 if host is not None:
-                    resp = host.poll()
-                    if resp in ["True", "False"]:
-                        correct = resp == "True"
+                    correct = host.poll()
+                    if correct is not None:
+                        self.timer.cancel()
                         player = player_manager.players[player_manager.control]
                         player.answer_question(correct, self.wager)
                         player.stats.record_daily_double(self. wager, correct)
@@ -105,16 +104,23 @@ class DailyDouble(InputState):
             screen.blit(text,rect)
             self.buttons.continue_button.draw(screen, (width*1/2, height*3/4))
             # display wagered amount
-            text = Font.number.render('$' + self.input, True, Colors.WHITE)
-            rect = text.get_rect(center=(width/2, height/2))
-            screen.blit(text,rect)
+            Font.number_glyphs.draw(screen, '$' + self.input, Colors.WHITE, (width/2, height/2))
         elif self.show_answer:
             # draw answer
-            text = self.store['clue']['question']
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+            text = self.store['clue'].display_question
+            display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
             # draw correct/incorrect buttons
             self.draw_buttons(screen)
         else:
             # draw clue
-            text = self.store['clue']['answer']
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+            text = self.store['clue'].display_answer
+            display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
+
+    def is_animating(self, _player_manager):
+        """Countdown is running while the player answers."""
+        return self.wager is not None and not self.show_answer and (
+            self.timer is None or self.timer.remaining > 0)
+
+    def view(self):
+        """Redraw when the wager is typed, the clue is shown, or the answer is revealed."""
+        return (self.input, self.wager, self.show_answer)
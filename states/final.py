@@ -1,7 +1,7 @@
 """
 Implement final jeopardy
 """
-
+from host.protocol import MessageType
 from util.constants import Colors, GameState
 from util.util import SoundEffects, display_text, TTS, Font
 from states.state import InputState
@@ -29,6 +29,20 @@ class Final(InputState):
         self.winner = None
         self.players_left = []
 
+    def startup(self, store, player_manager):
+        """Clears the last game's wagers and winner.
+
+        Args:
+            store (dict of str: Any): Dictionary of persistent data passed from state to state
+        """
+        super().startup(store, player_manager)
+        self.input = ''
+        self.show_answer = False
+        self.wait_for_wagers = True
+        self.play_sound = False
+        self.winner = None
+        self.players_left = []
+
     def play_final(self, player_manager):
         """Play final jeopardy theme."""
         if not TTS.is_busy() and self.play_sound:
@@ -39,7 +53,7 @@ class Final(InputState):
             # When final theme finishes, show the answer
             host = self.store['host']
             if host is not None:
-                host.send("Answer: " + self.store['data']['fj']['question'])
+                host.send(MessageType.ANSWER, self.store['data']['fj'].question)
             self.show_answer = True
             self.players_left = player_manager.sort_players()
 
@@ -58,7 +72,7 @@ class Final(InputState):
             # Wait until continue is clicked, then present question
             if self.clicked:
                 self.wait_for_wagers = False
-                TTS.play_speech(clue['answer'])
+                TTS.play_speech(clue.speech)
                 self.play_sound = True
         elif not self.show_answer:
             self.play_final(player_manager)
@@ -104,7 +118,7 @@ class Final(InputState):
             screen.blit(final_rect,rect)
 
             # display category
-            text = clue['category']
+            text = clue.category
             cat_rect = Font.number.render(text, True, Colors.WHITE)
             rect = cat_rect.get_rect(center = (width*1/2, height/2))
             screen.blit(cat_rect, rect)
@@ -123,8 +137,8 @@ class Final(InputState):
                 else:
                     # draw answer
                     if self.store['host'] is None:
-                        text = clue['question']
-                        display_text(screen, text.upper(), Font.clue, (100, 0, width-100, height/3))
+                        text = clue.display_question
+                        display_text(screen, text, Font.clue, (100, 0, width-100, height/3))
                     player = self.players_left[0].number
                     text = "Player " + str(player + 1) + " wager:"
                     display_text(screen, text, Font.number, (100, height/3, width-100, height/2))
@@ -134,5 +148,10 @@ class Final(InputState):
                     self.draw_buttons(screen)
             else:
                 # draw clue
-                text = clue['answer']
-                display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+                text = clue.display_answer
+                display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
+
+    def view(self):
+        """Redraw when the clue, answer, wagers, or winner change."""
+        return (self.wait_for_wagers, self.show_answer, self.input, len(self.players_left),
+            self.winner)
@@ -85,3 +85,7 @@ class Hall(InputState):
                 text = Font.category.render( '$' + str(self.scores[i]['score']), True, color)
                 rect = text.get_rect(midleft=(width/2 + 100, height/4 + (i+1)*50))
                 screen.blit(text,rect)
+
+    def view(self):
+        """Redraw when a name is typed or the high scores change."""
+        return (self.new_entry, self.input, self.place)
@@ -2,38 +2,69 @@
 Load questions from external API.
 """
 import threading
-import requests
 from util.constants import GameState, Colors
-from util.util import Font
+from util.fetch import FetchClient, FetchError
+from util.util import Font, TTS, layout_text
+from util.game_data import Clue, RoundGrid
+from util.validation import GameValidator
 from states.state import State
 from host.server import Server
 
+# where clues are drawn on the 1300x1000 game board, and the final answer above the wagers
+CLUE_RECT = (100, 100, 1200, 900)
+FINAL_ANSWER_RECT = (100, 0, 1200, 1000/3)
+
 class LoadingScreen(State):
     """Game State that draws loading screen and loads questions.
 
     Attributes:
         text (Surface): Pygame surface where loading text is drawn
-        data (dict of Any: dict): Nested dictionary of questions. Dictionary is indexed
-            by round (1,2, or 'fj'), and then indexed again by category (str). Each category
-            contains a list of question objects.
-        thread (Thread): a thread used to load data from the API
+        data (dict of Any: Any): Dictionary of questions indexed by round. Rounds 0 and 1
+            are RoundGrids of clues, and 'fj' is the final question.
+        thread (Thread): a thread used to load data from the API, or None if the game was
+            taken from the prefetch pool
+        clue_bank (ClueBank): Local clues used instead of the API when it has enough, or None
+        pool (PrefetchPool): Games fetched and validated in the background, or None
+        validator (GameValidator): Repairs fetched games, replacing bad categories
     """
-    def __init__(self):
+    def __init__(self, clue_bank=None, pool=None, validator=None):
+        """Initializes LoadingScreen Object
+
+        Args:
+            clue_bank (ClueBank, optional): Local clues to generate games from. Defaults to
+                None, which always loads games from the API.
+            pool (PrefetchPool, optional): Prefetched games, used before fetching a new one.
+                Defaults to None.
+            validator (GameValidator, optional): Repairs fetched games. Defaults to a new
+                GameValidator using the clue bank.
+        """
         super().__init__()
         self.text = Font.button.render("Loading...", True, Colors.WHITE)
         self.data = {}
         self.thread = None
+        self.clue_bank = clue_bank
+        self.pool = pool
+        self.validator = GameValidator(clue_bank) if validator is None else validator
 
     def startup(self, store, player_manager):
         """
-        Starts a new thread to fetch questions.
+        Takes a game from the prefetch pool, or starts a new thread to fetch questions.
 
         Args:
             store (dict of str: Any): Dictionary of persistent data passed from state to state
         """
         self.store = store
-        self.thread = threading.Thread(target=self.fetch)
-        self.thread.start()
+        TTS.clear() # discard speech left over from last game
+        self.data = {}
+        self.thread = None
+        data_json = None if self.pool is None else self.pool.take()
+        if data_json is None:
+            self.thread = threading.Thread(target=self.fetch)
+            self.thread.start()
+        else:
+            self.data = build_game(data_json)
+        if self.store.get('host') is not None:
+            self.store['host'].close() # free the port used by the last game
         if self.store['hosted']:
             self.store['host'] = Server()
         else:
@@ -41,13 +72,14 @@ class LoadingScreen(State):
         player_manager.initialize_players(self.store['n_players'])
 
     def fetch(self):
-        """Fetches questions from the API and formats them into rounds."""
-        data = requests.get('http://mathnerd7.pythonanywhere.com/api', timeout=120)
-        data_json = data.json()
-        self.load_round(data_json['clues'][0], 0)
-        self.load_round(data_json['clues'][1], 1) # double jeopardy round
-        # final jeopardy
-        self.data['fj'] = data_json['fj']
+        """Fetches questions from the clue bank or API and formats them into rounds."""
+        try:
+            data_json = load_game(self.clue_bank, self.validator)
+        except FetchError as error:
+            print('Could not load game: ' + str(error))
+            return
+        if data_json is not None:
+            self.data = build_game(data_json)
 
     def update(self, player_manager, elapsed_time):
         """Checks if data has finished loading from the API.
@@ -61,13 +93,10 @@ class LoadingScreen(State):
                 otherwise returns LOADING state.
         """
         host = self.store['host']
-        # wait for host connection
-        if host is not None and not host.is_connected():
-            host.poll_for_connection()
-
         # check if loading thread has exited
-        if not self.thread.is_alive():
-            if self.check_data():
+        if self.thread is None or not self.thread.is_alive():
+            if self.data and check_data(self.data):
+                fit_clues(self.data)
                 self.store['data'] = self.data
             else:
                 # fetch again
@@ -79,23 +108,6 @@ class LoadingScreen(State):
                 return GameState.INTRO
         return GameState.LOADING
 
-    def check_data(self):
-        """Returns true if loaded data is valid jeopardy game."""
-        if 'fj' not in self.data or not check_clue(self.data['fj']):
-            print("Bad final jeopardy: " + str(self.data['fj']))
-            return False
-        return self.check_round(0) and self.check_round(1)
-
-    def check_round(self, round_):
-        """Validate clues for given round are all present."""
-        if round_ not in self.data or len(self.data[round_].keys()) < 6:
-            print("Not enough categories for round " + str(round_))
-            return False
-        for cat in self.data[round_]:
-            if not check_category(self.data[round_][cat], round_):
-                return False
-        return True
-
     def draw(self, screen):
         """
         Draws Loading text on simple background.
@@ -111,23 +123,129 @@ class LoadingScreen(State):
         text_rect = self.text.get_rect(center=(width/2, 30))
         screen.blit(self.text, text_rect)
 
-    def load_round(self, clues, round_):
-        """Organizes questions into a dictionary indexed by round and category.
+    def view(self):
+        """Loading screen never changes once drawn."""
+        return ()
 
-        Args:
-            clues (list of list): 2d array containing questions.
-            round_ (int): The questions' round number (1 or 2).
-        """
-        self.data[round_] = {}
-        cats = []
-        for clue in clues[0]:
-            cats.append(clue['category'] )
-        for value in clues:
-            for i, clue in enumerate(value):
-                category = cats[i]
-                if category not in self.data[round_]:
-                    self.data[round_][category] = []
-                self.data[round_][category].append(clue)
+def fetch_game(clue_bank=None):
+    """Fetches a game from the clue bank, or from the API if the bank does not have enough.
+
+    Args:
+        clue_bank (ClueBank, optional): Local clues to generate the game from. Defaults to None.
+
+    Raises:
+        FetchError: If the game could not be downloaded
+
+    Returns:
+        dict: Game in the format returned by the clue API
+    """
+    data_json = None
+    if clue_bank is not None:
+        data_json = clue_bank.generate_game()
+    if data_json is None:
+        data_json = FetchClient.shared().get_json('/api', timeout=120)
+    return data_json
+
+def load_game(clue_bank, validator):
+    """Fetches a game and repairs it, printing each problem found.
+
+    Args:
+        clue_bank (ClueBank): Local clues to generate the game from, or None
+        validator (GameValidator): Checks the game and repairs or replaces bad categories
+
+    Raises:
+        FetchError: If the game could not be downloaded
+
+    Returns:
+        dict: Game in the format returned by the clue API, or None if it could not be repaired
+    """
+    data_json, issues = validator.repair_game(fetch_game(clue_bank))
+    for rule, where, action in issues:
+        print('Game check failed: ' + where + ': ' + rule + ' (' + action + ')')
+    return data_json
+
+def build_game(data_json):
+    """Formats a game from the clue API into rounds of Clues.
+
+    Args:
+        data_json (dict): Game in the format returned by the clue API
+
+    Returns:
+        dict of Any: Any: Rounds 0 and 1 are RoundGrids of clues, and 'fj' is the final question.
+    """
+    return {
+        0: load_round(data_json['clues'][0]),
+        1: load_round(data_json['clues'][1]), # double jeopardy round
+        'fj': Clue.from_dict(data_json['fj']), # final jeopardy
+    }
+
+def load_round(clues):
+    """Organizes questions into a grid with one column for each category.
+
+    Args:
+        clues (list of list): 2d array containing questions. Each row contains one
+            clue value for every category.
+
+    Returns:
+        RoundGrid: The round's clues
+    """
+    columns = [[] for _ in clues[0]]
+    for value in clues:
+        for i, clue in enumerate(value):
+            columns[i].append(Clue.from_dict(clue))
+    cats = [column[0].category for column in columns]
+    return RoundGrid(cats, columns)
+
+def fit_clues(data):
+    """Works out the font size and line breaks of every clue in a game before it starts,
+    so they are not worked out on the frame a clue is first shown.
+
+    Must be called from the main thread, since pygame fonts are not thread safe.
+
+    Args:
+        data (dict of Any: Any): Rounds 0 and 1 are RoundGrids of clues, and 'fj' is the
+            final question.
+    """
+    for round_ in (0, 1):
+        for column in data[round_].columns:
+            for clue in column:
+                layout_text(clue.display_answer, Font.clue, CLUE_RECT)
+                layout_text(clue.display_question, Font.clue, CLUE_RECT)
+    layout_text(data['fj'].display_answer, Font.clue, CLUE_RECT)
+    layout_text(data['fj'].display_question, Font.clue, FINAL_ANSWER_RECT)
+
+def is_valid_game(data_json):
+    """Returns true if a game in the clue API format can be played."""
+    try:
+        return check_data(build_game(data_json))
+    except (KeyError, IndexError, TypeError, AttributeError):
+        print('Badly formatted game')
+        return False
+
+def is_valid_clue(data):
+    """Returns true if a clue in the clue API format can be played."""
+    try:
+        return check_clue(Clue.from_dict(data))
+    except (KeyError, TypeError, AttributeError):
+        print('Bad clue: ' + str(data))
+        return False
+
+def check_data(data):
+    """Returns true if loaded data is valid jeopardy game."""
+    if 'fj' not in data or not check_clue(data['fj']):
+        print("Bad final jeopardy: " + str(data.get('fj')))
+        return False
+    return check_round(data, 0) and check_round(data, 1)
+
+def check_round(data, round_):
+    """Validate clues for given round are all present."""
+    if round_ not in data or len(data[round_].categories) != RoundGrid.COLUMNS:
+        print("Wrong number of categories for round " + str(round_))
+        return False
+    for column in data[round_].columns:
+        if not check_category(column, round_):
+            return False
+    return data[round_].is_complete()
 
 def check_category(category, round_):
     """Validate given category has one clue for each value amount."""
@@ -139,23 +257,23 @@ def check_category(category, round_):
     for clue in category:
         if not check_clue(clue):
             return False
-        if clue['daily_double'] == 1:
+        if clue.daily_double:
             daily_double += 1
         else:
-            if clue['value'] not in values:
+            if clue.value not in values:
                 print('Clue has bad value: ' + str(clue))
                 return False
-            values.discard(clue['value'])
+            values.discard(clue.value)
     if len(values) == 0:
         return True
     if len(values) == 1 and daily_double == 1:
         return True
     print("Clues have wrong values: " + str(category))
     return False
+
 def check_clue(clue):
     """Validate each clue has question and answer."""
-    try:
-        return len(clue['category']) > 0 and len(clue['answer'])>0 and len(clue['question'])>0
-    except KeyError:
-        print('Bad clue: ' + str(clue))
-        return False
+    if len(clue.category) > 0 and len(clue.answer) > 0 and len(clue.question) > 0:
+        return True
+    print('Bad clue: ' + str(clue))
+    return False
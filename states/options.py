@@ -2,7 +2,8 @@
 Display Options screen.
 """
 from util.constants import GameState, Colors
-from util.util import Button, Font
+from util.util import Button, Font, TTS
+from util.speech_backends import available_backends
 from states.state import State
 
 class OptionsScreen(State):
@@ -17,6 +18,7 @@ class OptionsScreen(State):
         self.back = Button("Back")
         self.hosted_toggle = Button("OFF")
         self.num_players_toggle = Button("3")
+        self.speech_toggle = Button("google")
 
     def update(self, player_manager, elapsed_time):
         """
@@ -42,6 +44,15 @@ class OptionsScreen(State):
                 if self.store['n_players'] > 5:
                     self.store['n_players'] = 2
                 self.num_players_toggle.set_text(str(self.store['n_players']))
+            if self.speech_toggle.was_clicked():
+                # switch to next speech engine installed on this machine
+                backends = available_backends()
+                index = -1
+                if self.store['speech'] in backends:
+                    index = backends.index(self.store['speech'])
+                self.store['speech'] = backends[(index + 1) % len(backends)]
+                self.speech_toggle.set_text(self.store['speech'])
+                TTS.set_backend(self.store['speech'])
 
         self.clicked = False # reset flag for next loop
         return GameState.OPTIONS
@@ -68,3 +79,12 @@ class OptionsScreen(State):
         text_rect = text.get_rect(center=(width/4, height/2 + 100))
         screen.blit(text, text_rect)
         self.num_players_toggle.draw(screen, (width*3/4, height/2 + 100))
+
+        text = Font.button.render("Speech", True, Colors.WHITE)
+        text_rect = text.get_rect(center=(width/4, height/2 + 200))
+        screen.blit(text, text_rect)
+        self.speech_toggle.draw(screen, (width*3/4, height/2 + 200))
+
+    def view(self):
+        """Redraw when an option is toggled."""
+        return (self.store['hosted'], self.store['n_players'], self.store['speech'])
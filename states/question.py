@@ -1,6 +1,7 @@
 """
 Show question on screen and get player response
 """
+from host.protocol import MessageType
 from util.constants import Colors, GameState
 from util.util import SoundEffects, display_text, TTS, Font
 from states.state import QuestionState
@@ -16,7 +17,7 @@ class Question(QuestionState):
         buttons (Button, Button, Button): Continue, Correct, and Wrong buttons. Correct
             and Wrong buttons are shown after answer is given. Continue button is shown
             if no one rung in.
-        timer (int): Milliseconds left for players to ring in
+        timer (Timer): Countdown for players to ring in
         """
 
     def startup(self, store, player_manager):
@@ -25,14 +26,14 @@ class Question(QuestionState):
         Args:
             store (dict of str: Any): Dictionary of persistent data passed from state to state
         """
-        TTS.play_speech(store['clue']['answer'])
+        TTS.play_speech(store['clue'].speech)
         self.store = store
         self.reset(player_manager)
         player_manager.log_clue()
         host = self.store['host']
         if host is not None:
             # send answer to host
-            host.send("answer: " + store['clue']['question'])
+            host.send(MessageType.ANSWER, store['clue'].question)
 
     def wait_for_continue(self, player_manager):
         """Check if buttons have been clicked to return to board."""
@@ -44,11 +45,11 @@ class Question(QuestionState):
             # Correct/incorrect button to indicate if player who rung in answered correctly
             if self.buttons.correct_button.was_clicked():
                 player_manager.log_question_stats()
-                player_manager.update(True,self.store['clue']['value'])
+                player_manager.update(True,self.store['clue'].value)
                 return GameState.BOARD
             if self.buttons.wrong_button.was_clicked():
                 player_manager.log_question_stats()
-                player_manager.update(False,self.store['clue']['value'])
+                player_manager.update(False,self.store['clue'].value)
                 return GameState.BOARD
         return None
 
@@ -56,15 +57,15 @@ class Question(QuestionState):
         """Wait for host to say if player answered correctly."""
         host = self.store['host']
         resp = host.poll()
-        if resp == "True":
+        if resp is True:
             player_manager.log_question_stats()
             player_manager.reset()
-            player_manager.update(True,self.store['clue']['value'])
+            player_manager.update(True,self.store['clue'].value)
             return GameState.BOARD
-        if resp == "False":
-            self.timer = 5000
+        if resp is False:
+            self.start_timer()
             player_manager.second_chance()
-            player_manager.update(False,self.store['clue']['value'])
+            player_manager.update(False,self.store['clue'].value)
             self.rang_in = False
             return GameState.QUESTION
         return None
@@ -84,9 +85,10 @@ class Question(QuestionState):
         if TTS.is_busy():
             # question is still being read
             return GameState.QUESTION
-        if not player_manager.green:
-            # turn on light to let players know to ring in
+        if self.timer is None:
+            # turn on light to let players know to ring in, once per clue
             player_manager.green_light()
+            self.start_timer()
 
         if self.show_answer:
             next_state = self.wait_for_continue(player_manager)
@@ -94,9 +96,8 @@ class Question(QuestionState):
                 return next_state
         else:
             if player_manager.rung_in is None:
-                # Decrement timer while waiting for players to ring in
-                self.timer -= elapsed_time
-                if self.timer <= 0:
+                # Wait for players to ring in until time runs out
+                if self.timer.expired:
                     # no one rung in
                     if host is not None:
                         if self.wait_for_host(player_manager):
@@ -109,7 +110,7 @@ class Question(QuestionState):
                         self.show_answer = True
             else:
                 # player rang in, wait for response
-                self.wait_for_response(player_manager, elapsed_time)
+                self.wait_for_response(player_manager)
 
                 if host is not None:
                     game_state = self.poll_host(player_manager)
@@ -131,11 +132,14 @@ class Question(QuestionState):
 
         width, height = screen.get_size()
         if self.show_answer:
-            # draw answer
-            text = self.store['clue']['question']
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
-            self.draw_buttons(self.rang_in)
+            # draw answer and buttons
+            text = self.store['clue'].display_question
+            self.draw_buttons(screen)
         else:
             # draw question
-            text = self.store['clue']['answer']
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+            text = self.store['clue'].display_answer
+        display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
+
+    def view(self):
+        """Redraw when the answer or buttons are revealed."""
+        return (self.show_answer, self.rang_in)
@@ -11,6 +11,7 @@ handles user input such as mouse clicks and keyboard presses.
 """
 from collections import namedtuple
 import pygame
+from host.protocol import MessageType
 from util.util import Button, Font, SoundEffects
 from util.constants import Colors
 
@@ -22,12 +23,15 @@ class State():
         name (GameState): Enum that represents this game state
         store (dict of str: Any): Dictionary of data that should be persistent and
             transfered from state to state
+        scheduler (Scheduler): The game's scheduler for countdowns and delayed callbacks
     """
     def __init__(self):
         self.store = {}
         self.show_score = False
         self.clicked = False
         self.name = None
+        self.drawn_view = None
+        self.scheduler = None
 
     def set_name(self, name):
         """Set title for a game state."""
@@ -73,6 +77,45 @@ class State():
         """
         raise NotImplementedError('draw() not implemented for this State.')
 
+    def is_animating(self, _player_manager):
+        """Returns True if the state has timers running and needs the full frame rate.
+
+        Args:
+            player_manager (PlayerManager): reference to PlayerManager object that keeps track
+                of players
+        """
+        return False
+
+    def view(self):
+        """Returns a snapshot of everything draw() depends on.
+
+        States that return a value here are only redrawn when the value changes. States that
+        return None are redrawn every frame.
+
+        Returns:
+            Any: Hashable value that changes whenever the state's frame would change, or None
+        """
+        return None
+
+    def get_dirty_rects(self, screen):
+        """Returns regions of the screen that have changed since the state was last drawn.
+
+        Args:
+            screen (Surface): Pygame surface where state will be drawn
+
+        Returns:
+            list of Rect: Rectangles that need to be redrawn. Empty if nothing has changed.
+        """
+        view = self.view() # pylint: disable=E1128
+        if view is None or view != self.drawn_view:
+            self.drawn_view = view
+            return [screen.get_rect()]
+        return []
+
+    def invalidate(self):
+        """Forces the whole state to be redrawn on the next frame."""
+        self.drawn_view = None
+
 #pylint: disable=W0223
 class QuestionState(State):
     """Abstract class for game states that require user input.
@@ -83,13 +126,16 @@ class QuestionState(State):
         buttons (Button, Button, Button): Continue, Correct, and Wrong buttons. Continue
             button is clicked after wager is entered. Correct and Wrong buttons are clicked
             after answer is given.
+        timer (Timer): Countdown for players to ring in, or None until the green light
     """
+    RING_IN_TIME = 5000
+
     def __init__(self):
         super().__init__()
         ButtonList = namedtuple('ButtonsList',['continue_button', 'correct_button', 'wrong_button'])
         self.buttons = ButtonList(Button('Continue'), Button('Correct'), Button('Incorrect'))
         self.show_score = True
-        self.timer = 5000
+        self.timer = None
         self.show_answer = False
         self.rang_in = False
 
@@ -98,9 +144,17 @@ class QuestionState(State):
         self.clicked = False
         self.show_answer = False
         self.rang_in = False
-        self.timer = 5000
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
         player_manager.reset()
 
+    def start_timer(self):
+        """Starts counting down the time players have to ring in."""
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = self.scheduler.schedule(self.RING_IN_TIME)
+
     def draw_buttons(self, screen):
         """Draws correct/incorrect buttons on bottom of screen.
 
@@ -122,25 +176,24 @@ class QuestionState(State):
         if not host.wait:
             player_manager.reset()
             SoundEffects.play(1) # time's up
-            host.send("continue")
+            host.send(MessageType.CONTINUE)
             host.wait = True
         # wait for host to continue
-        return host.poll()
-    def wait_for_response(self, player_manager, elapsed_time):
+        return host.poll() is not None
+    def wait_for_response(self, player_manager):
         """Wait for response from player who range in."""
         host = self.store['host']
         if not self.rang_in:
             if host is not None:
-                host.send("rangin")
+                host.send(MessageType.RANG_IN)
             self.rang_in = True
 
-        if player_manager.timer > 0:
-            if player_manager.poll(elapsed_time):
-                # out of time
-                if host is None:
-                    self.show_answer = True
-                else:
-                    SoundEffects.play(1) # time's up
+        if player_manager.poll():
+            # out of time
+            if host is None:
+                self.show_answer = True
+            else:
+                SoundEffects.play(1) # time's up
 
 # pylint: disable=W0223
 class InputState(State):
@@ -220,6 +273,4 @@ class InputState(State):
             screen (Surface): Pygame surface where board will be drawn
         """
         width, height = screen.get_size()
-        text = Font.number.render('$' + self.input, True, Colors.WHITE)
-        rect = text.get_rect(center=(width/2, height*3/5))
-        screen.blit(text,rect)
+        Font.number_glyphs.draw(screen, '$' + self.input, Colors.WHITE, (width/2, height*3/5))
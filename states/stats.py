@@ -11,10 +11,13 @@ class Stats(State):
         super().__init__()
         self.continue_button = Button('Return')
         self.stats = []
+        self.reactions = []
         self.triple_stumpers = 0
 
     def startup(self, store, player_manager):
         "Retrieve player stats."
+        self.stats = []
+        self.reactions = []
         for player in player_manager.players:
             buzzer = player.stats.questions_answered
             attempts = player.stats.attempts
@@ -32,10 +35,8 @@ class Stats(State):
             player_stats = [player.number+1, attempts, buzzer, buz_pct,
                 str(player.stats.correct) + '/' + str(not_correct),
                 correct_pct, daily_double_str, '$' + str(player.score)]
-            rendered_text = []
-            for stat in player_stats:
-                rendered_text.append(Font.category.render( str(stat),  True, Colors.WHITE))
-            self.stats.append(rendered_text)
+            self.stats.append(render_row(player_stats))
+            self.reactions.append(render_row(reaction_stats(player)))
         self.store = store
         self.triple_stumpers = player_manager.triple_stumpers
 
@@ -48,21 +49,20 @@ class Stats(State):
         screen.blit(text,rect)
         self.continue_button.draw(screen, (width*1/2, height*3.5/4))
         stats = ['PLAYER', 'ATT' , 'BUZ' , 'BUZ%' ,  'COR/INC', 'CORRECT %' ,'DD' , 'FINAL SCORE']
-        for i, stat in enumerate(stats):
-            text = Font.category.render(stat, True, Colors.WHITE)
-            box_width = (width - 50) / len(stats)
-            rect = text.get_rect(midleft=(50 + box_width*i, 200))
-            screen.blit(text,rect)
-
-            for j, player_stats in enumerate(self.stats):
-                text = player_stats[i]
-                rect = text.get_rect(midleft=(50 + box_width*i, 250 + j*50))
-                screen.blit(text,rect)
+        draw_table(screen, stats, self.stats, 200, 50)
 
         text = Font.category.render('Triple stumpers: '+str(self.triple_stumpers),True,Colors.WHITE)
         rect = text.get_rect(center=(width/2, len(self.stats)*50 + 300))
         screen.blit(text,rect)
 
+        # reaction times in milliseconds
+        stats = ['PLAYER', 'EARLY', 'BEST', 'MEDIAN', 'P90', 'WORST', 'FRAME LAG']
+        draw_table(screen, stats, self.reactions, len(self.stats)*50 + 370, 40)
+
+    def view(self):
+        """Stats screen never changes once drawn."""
+        return ()
+
     def update(self, player_manager, elapsed_time):
         """
         Waits for continue button to be clicked.
@@ -77,3 +77,53 @@ class Stats(State):
                 return GameState.TITLE
         self.clicked = False
         return GameState.STATS
+
+def reaction_stats(player):
+    """Returns a row of reaction time stats for a player.
+
+    Args:
+        player (Player): Player whose buzzer presses were timed
+    """
+    summary = player.stats.reaction_summary()
+    if summary is None:
+        times = ['N/A'] * 4
+    else:
+        times = [str(round(time)) + ' ms' for time in summary]
+    latencies = player.stats.frame_latencies
+    lag = 'N/A'
+    if len(latencies) > 0:
+        lag = str(round(sum(latencies) / len(latencies))) + ' ms'
+    return [player.number+1, player.stats.early_buzzes] + times + [lag]
+
+def render_row(row):
+    """Render each stat in a row of the stats table.
+
+    Args:
+        row (list of Any): Stats to render
+    """
+    rendered_text = []
+    for stat in row:
+        rendered_text.append(Font.category.render( str(stat),  True, Colors.WHITE))
+    return rendered_text
+
+def draw_table(screen, headers, rows, y_pos, row_height):
+    """Draw a table of stats with one row per player.
+
+    Args:
+        screen (Surface): Pygame surface where table will be drawn
+        headers (list of str): Column titles
+        rows (list of list of Surface): Rendered stats for each player
+        y_pos (int): Pixel row the column titles are centered on
+        row_height (int): Pixels between rows
+    """
+    width, _ = screen.get_size()
+    box_width = (width - 50) / len(headers)
+    for i, stat in enumerate(headers):
+        text = Font.category.render(stat, True, Colors.WHITE)
+        rect = text.get_rect(midleft=(50 + box_width*i, y_pos))
+        screen.blit(text,rect)
+
+        for j, player_stats in enumerate(rows):
+            text = player_stats[i]
+            rect = text.get_rect(midleft=(50 + box_width*i, y_pos + 50 + j*row_height))
+            screen.blit(text,rect)
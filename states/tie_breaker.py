@@ -2,11 +2,15 @@
 Show question on screen and get player response
 """
 import threading
-import requests
+from host.protocol import MessageType
 from util.constants import Colors, GameState
+from util.fetch import FetchClient, FetchError
+from util.game_data import Clue
 from util.util import SoundEffects, display_text, TTS, Font
 from states.state import QuestionState
+from states.loading import is_valid_clue
 
+# pylint: disable=R0902
 class TieBreaker(QuestionState):
     """Tie breaking round when scores are equal. First to ring in and guess correctly wins.
 
@@ -17,10 +21,22 @@ class TieBreaker(QuestionState):
         buttons (Button, Button, Button): Continue, Correct, and Wrong buttons. Correct
             and Wrong buttons are shown after answer is given. Continue button is shown
             if no one rung in.
-        timer (int): Milliseconds left for players to ring in
+        timer (Timer): Countdown for players to ring in
+        clue_bank (ClueBank): Local clues used instead of the API, or None
+        pool (PrefetchPool): Tie breakers fetched and validated in the background, or None
+        """
+    def __init__(self, clue_bank=None, pool=None):
+        """Initializes TieBreaker Object
+
+        Args:
+            clue_bank (ClueBank, optional): Local clues to pick tie breakers from. Defaults
+                to None, which always loads tie breakers from the API.
+            pool (PrefetchPool, optional): Prefetched tie breakers, used before fetching a
+                new one. Defaults to None.
         """
-    def __init__(self):
         super().__init__()
+        self.clue_bank = clue_bank
+        self.pool = pool
         self.question = None
         self.thread = None
         self.winner = None
@@ -34,6 +50,7 @@ class TieBreaker(QuestionState):
         """
         # fetch a clue
         super().startup(store, player_manager)
+        self.winner = None
         self.tiebreaker(player_manager)
 
     def tiebreaker(self, player_manager):
@@ -41,21 +58,36 @@ class TieBreaker(QuestionState):
         self.reset(player_manager)
         self.question = None
         self.show_category = True
-        self.thread = threading.Thread(target=self.load_question)
-        self.thread.start()
+        question = None if self.pool is None else self.pool.take()
+        if question is None:
+            self.thread = threading.Thread(target=self.load_question, daemon=True)
+            self.thread.start()
+        else:
+            question = Clue.from_dict(question)
+            TTS.prefetch([question.speech])
+            self.question = question
 
     def load_question(self):
-        """Fetch a tiebreaker question."""
-        data = requests.get('http://mathnerd7.pythonanywhere.com/one',  timeout=60)
-        self.question = data.json()
+        """Fetch a tiebreaker question, trying again until one loads."""
+        question = None
+        while question is None:
+            try:
+                question = fetch_tie_breaker(self.clue_bank)
+            except FetchError as error:
+                print('Could not load tie breaker: ' + str(error))
+            if question is not None and not is_valid_clue(question):
+                question = None
+        question = Clue.from_dict(question)
+        TTS.prefetch([question.speech])
+        self.question = question
 
     def play_question(self):
         """Read question aloud."""
-        TTS.play_speech(self.question['answer'])
+        TTS.play_speech(self.question.speech)
         host = self.store['host']
         if host is not None:
             # send answer to host
-            host.send("answer: " + self.question['question'])
+            host.send(MessageType.ANSWER, self.question.question)
 
     def determine_winner(self, player_manager):
         """Wait for input to determine if player won."""
@@ -71,10 +103,9 @@ class TieBreaker(QuestionState):
             if self.buttons.wrong_button.was_clicked():
                 self.tiebreaker(player_manager)
 
-    def wait_for_ring_in(self, player_manager, elapsed_time):
-        """Decrement timer while waiting for players to ring in."""
-        self.timer -= elapsed_time
-        if self.timer <= 0:
+    def wait_for_ring_in(self, player_manager):
+        """Wait for players to ring in until time runs out."""
+        if self.timer.expired:
             # no one rung in
             host = self.store['host']
             if host is not None:
@@ -100,9 +131,10 @@ class TieBreaker(QuestionState):
         if TTS.is_busy() or self.question is None:
             # question is still being read
             return GameState.TIE
-        if not player_manager.green and not self.show_category:
-            # turn on light to let players know to ring in
+        if self.timer is None and not self.show_category:
+            # turn on light to let players know to ring in, once per clue
             player_manager.green_light(eligible=self.store['candidates'])
+            self.start_timer()
         if self.winner is not None:
             if self.clicked and self.buttons.continue_button.was_clicked():
                 return GameState.HALL
@@ -114,17 +146,17 @@ class TieBreaker(QuestionState):
             self.determine_winner(player_manager)
         else:
             if player_manager.rung_in is None:
-                self.wait_for_ring_in(player_manager,elapsed_time)
+                self.wait_for_ring_in(player_manager)
             else:
-                self.wait_for_response(player_manager,elapsed_time)
+                self.wait_for_response(player_manager)
                 host = self.store['host']
                 if host is not None:
                     resp = host.poll()
-                    if resp == "True":
+                    if resp is True:
                         self.winner = player_manager.rung_in
                         return GameState.TIE
-                    if resp == "False":
-                        self.timer = 5000
+                    if resp is False:
+                        self.start_timer()
                         player_manager.second_chance()
                         return GameState.TIE
 
@@ -147,7 +179,7 @@ class TieBreaker(QuestionState):
             display_text(screen, 'Loading...', Font.button, (100, 100, width-100, height-100))
         elif self.show_answer:
             # draw answer
-            text = self.question['question']
+            text = self.question.display_question
             if self.rang_in:
                 if self.winner is not None:
                     text = "Player " + str(self.winner + 1) + " wins!"
@@ -155,16 +187,40 @@ class TieBreaker(QuestionState):
                     self.buttons.continue_button.draw(screen, (width/2, height*3/4))
                     return
             self.draw_buttons(screen)
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+            display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
 
         elif self.show_category:
             # display category
-            text = self.question['category']
+            text = self.question.category
             cat_rect = Font.number.render(text, True, Colors.WHITE)
             rect = cat_rect.get_rect(center = (width*1/2, height/2))
             screen.blit(cat_rect, rect)
             self.buttons.continue_button.draw(screen, (width*1/2, height*3/4))
         else:
             # draw question
-            text = self.question['answer']
-            display_text(screen, text.upper(), Font.clue, (100, 100, width-100, height-100))
+            text = self.question.display_answer
+            display_text(screen, text, Font.clue, (100, 100, width-100, height-100))
+
+    def view(self):
+        """Redraw when a new question loads or the answer or winner is revealed."""
+        return (id(self.question), self.show_category, self.show_answer, self.rang_in,
+            self.winner)
+
+def fetch_tie_breaker(clue_bank=None):
+    """Fetches a tie breaker clue from the clue bank, or from the API if the bank is empty.
+
+    Args:
+        clue_bank (ClueBank, optional): Local clues to pick from. Defaults to None.
+
+    Raises:
+        FetchError: If the clue could not be downloaded
+
+    Returns:
+        dict: The clue
+    """
+    question = None
+    if clue_bank is not None:
+        question = clue_bank.random_clue()
+    if question is None:
+        question = FetchClient.shared().get_json('/one', timeout=60)
+    return question
@@ -34,6 +34,7 @@ class TitleScreen(State):
         """Set default values for game options."""
         self.store['hosted'] = False
         self.store['n_players'] = 3
+        self.store['speech'] = 'google'
 
     def update(self, player_manager, elapsed_time):
         """
@@ -74,3 +75,7 @@ class TitleScreen(State):
         self.play_button.draw(screen, (width/2, height/3))
         self.hall_button.draw(screen, (width/2, height*3/4))
         self.options.draw(screen, (width/2, height*7/12))
+
+    def view(self):
+        """Title screen never changes once drawn."""
+        return ()
@@ -0,0 +1,62 @@
+"""
+Tests that malformed messages from one host client do not stop the host server.
+
+Usage Example:
+    python -m pytest tests/test_host_server.py
+"""
+import socket
+import time
+import pytest
+from host.protocol import HEADER, MessageType, ProtocolError, encode, unpack_value
+from host.server import Server
+
+LIST_KEY_MAP = b'm\x00\x00\x00\x01' + b'l\x00\x00\x00\x00' + b'N'
+DEEP_LIST = b'l\x00\x00\x00\x01' * 5000 + b'N'
+
+def frame(payload):
+    """Returns a RESPONSE message holding a raw payload."""
+    return HEADER.pack(len(payload), MessageType.RESPONSE) + payload
+
+def wait_until(condition, timeout=2):
+    """Waits for a condition to become true, returning whether it did."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+@pytest.mark.parametrize('payload', [LIST_KEY_MAP, DEEP_LIST], ids=['list_key', 'deep'])
+def test_unpack_rejects_malformed_value(payload):
+    """Values that cannot be rebuilt are reported as protocol errors."""
+    with pytest.raises(ProtocolError):
+        unpack_value(payload)
+
+def test_unpack_keeps_nested_state():
+    """Nested lists and dicts within the depth limit still unpack."""
+    value = {'scores': [0, 200], 'board': [[True, False]], 'clue': {'value': 400}}
+    payload = encode(MessageType.STATE, value)[HEADER.size:]
+    assert unpack_value(payload) == (value, len(payload))
+
+@pytest.mark.parametrize('payload', [LIST_KEY_MAP, DEEP_LIST], ids=['list_key', 'deep'])
+def test_malformed_frame_disconnects_only_sender(payload):
+    """A bad frame closes that client while other hosts keep talking to the game."""
+    server = Server(port=0, address='127.0.0.1')
+    try:
+        address = server.server.getsockname()
+        good = socket.create_connection(address)
+        bad = socket.create_connection(address)
+        assert wait_until(lambda: len(server.connections) == 2)
+
+        bad.sendall(frame(payload))
+        bad.settimeout(2)
+        assert bad.recv(4096) == b''
+        assert wait_until(lambda: len(server.connections) == 1)
+        assert server.thread.is_alive()
+
+        good.sendall(encode(MessageType.RESPONSE, True))
+        assert wait_until(lambda: server.poll() is True)
+        good.close()
+        bad.close()
+    finally:
+        server.close()
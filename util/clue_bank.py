@@ -0,0 +1,221 @@
+"""
+Local database of clues, used to put together games without a network connection.
+
+Usage Example:
+    bank = ClueBank('clues.db')
+    bank.import_jsonl('clues.jsonl')
+    game = bank.generate_game() # same format as the clue API
+"""
+import json
+import random
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clues (
+    id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    value INTEGER,
+    air_date TEXT NOT NULL DEFAULT '',
+    answer TEXT NOT NULL,
+    question TEXT NOT NULL,
+    comments TEXT NOT NULL DEFAULT '',
+    UNIQUE (round, category, air_date, answer)
+);
+CREATE INDEX IF NOT EXISTS clues_category ON clues (category);
+CREATE INDEX IF NOT EXISTS clues_value ON clues (value);
+CREATE INDEX IF NOT EXISTS clues_round_category ON clues (round, category, air_date, value);
+CREATE INDEX IF NOT EXISTS clues_air_date ON clues (air_date);
+"""
+
+FINAL_ROUND = 2
+
+class ClueBank():
+    """SQLite store of clues with indexes on category, value, round, and air date.
+
+    Clues keep the round they aired in (0 and 1 for the two board rounds, 2 for final
+    jeopardy), and clues from one category on one air date are kept together, so generated
+    boards use categories as they were written.
+
+    Attributes:
+        path (str): Path of the database file
+        rng (Random): Random number generator used to pick categories and clues
+    """
+    def __init__(self, path='clues.db', rng=None):
+        """Initializes ClueBank Object
+
+        Args:
+            path (str, optional): Path of the database file. Defaults to 'clues.db'.
+            rng (Random, optional): Random number generator. Defaults to a new Random().
+        """
+        self.path = path
+        self.rng = random.Random() if rng is None else rng
+        # games are generated on loading threads, so share one connection behind a lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._categories = {} # complete categories in each round, until clues are added
+        with self._lock:
+            self._db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def count(self, round_=None):
+        """Returns number of clues in the bank.
+
+        Args:
+            round_ (int, optional): Only count clues from this round. Defaults to all rounds.
+        """
+        with self._lock:
+            if round_ is None:
+                return self._db.execute('SELECT COUNT(*) FROM clues').fetchone()[0]
+            return self._db.execute('SELECT COUNT(*) FROM clues WHERE round = ?',
+                (round_,)).fetchone()[0]
+
+    def add_clues(self, clues):
+        """Adds clues to the bank, skipping clues it already has.
+
+        Args:
+            clues (iterable of dict): Clues with 'round', 'category', 'value', 'answer' and
+                'question' keys, and optionally 'air_date' and 'comments'
+
+        Returns:
+            int: Number of clues added
+        """
+        rows = ((clue['round'], clue['category'], clue.get('value'), clue.get('air_date') or '',
+            clue['answer'], clue['question'], clue.get('comments') or '') for clue in clues)
+        with self._lock, self._db:
+            self._categories = {}
+            before = self._db.total_changes
+            self._db.executemany('INSERT OR IGNORE INTO clues (round, category, value, '
+                'air_date, answer, question, comments) VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            return self._db.total_changes - before
+
+    def import_jsonl(self, path):
+        """Imports a JSON lines dump of clues or games.
+
+        Each line is either a single clue with a 'round' key (0, 1, or 2 for final
+        jeopardy), or a whole game in the format returned by the clue API.
+
+        Args:
+            path (str): Path of the dump
+
+        Returns:
+            int: Number of clues added
+        """
+        with open(path, encoding='utf-8') as file:
+            return self.add_clues(clue for line in file if line.strip()
+                for clue in parse_line(json.loads(line)))
+
+    def generate_game(self):
+        """Puts together a game from random categories in the bank.
+
+        Returns:
+            dict: Game in the same format as the clue API, or None if the bank does not
+                have enough complete categories
+        """
+        rounds = []
+        for round_, daily_doubles in [(0, 1), (1, 2)]:
+            columns = self.pick_categories(round_, 6)
+            if columns is None:
+                return None
+            # hide daily doubles in different categories, never in the top row
+            for col in self.rng.sample(range(6), daily_doubles):
+                columns[col][self.rng.randrange(1, 5)]['daily_double'] = 1
+            rounds.append([[column[row] for column in columns] for row in range(5)])
+        final = self.random_clue(FINAL_ROUND)
+        if final is None:
+            return None
+        return {'clues': rounds, 'fj': final}
+
+    def pick_categories(self, round_, number):
+        """Picks random categories that have a clue for each value in a round.
+
+        Args:
+            round_ (int): Round the categories are for (0 or 1)
+            number (int): Number of categories to pick
+
+        Returns:
+            list of list of dict: Five clues for each category, ordered by value, or None if
+                there are not enough complete categories
+        """
+        values = [x*(round_+1) for x in [200,400,600,800,1000]]
+        with self._lock:
+            if round_ not in self._categories:
+                self._categories[round_] = self._db.execute('SELECT category, air_date '
+                    'FROM clues WHERE round = ? AND value IN (?, ?, ?, ?, ?) '
+                    'GROUP BY category, air_date HAVING COUNT(DISTINCT value) = 5',
+                    (round_, *values)).fetchall()
+            groups = self._categories[round_]
+            if len(groups) < number:
+                return None
+            columns = []
+            for group in self.rng.sample(groups, number):
+                rows = self._db.execute('SELECT * FROM clues WHERE round = ? AND category = ? '
+                    'AND air_date = ? AND value IN (?, ?, ?, ?, ?) ORDER BY value, id',
+                    (round_, group['category'], group['air_date'], *values)).fetchall()
+                by_value = {}
+                for row in rows:
+                    by_value.setdefault(row['value'], row_to_clue(row))
+                columns.append([by_value[value] for value in values])
+        return columns
+
+    def random_clue(self, round_=None):
+        """Returns a random clue, for final jeopardy or tie breakers.
+
+        Args:
+            round_ (int, optional): Only pick from this round. Defaults to any round.
+
+        Returns:
+            dict: The clue, or None if the bank has no clues from the round
+        """
+        where, params = ('', ()) if round_ is None else (' WHERE round = ?', (round_,))
+        with self._lock:
+            count = self._db.execute('SELECT COUNT(*) FROM clues' + where, params).fetchone()[0]
+            if count == 0:
+                return None
+            # OFFSET into the index is much faster than ORDER BY RANDOM() on a large bank
+            row = self._db.execute('SELECT * FROM clues' + where + ' LIMIT 1 OFFSET ?',
+                params + (self.rng.randrange(count),)).fetchone()
+        return row_to_clue(row)
+
+def row_to_clue(row):
+    """Converts a database row to a clue in the format used by the clue API.
+
+    Args:
+        row (Row): Row from the clues table
+    """
+    return {
+        'category': row['category'],
+        'value': row['value'],
+        'answer': row['answer'],
+        'question': row['question'],
+        'daily_double': 0,
+        'comments': row['comments'],
+        'air_date': row['air_date'],
+    }
+
+def parse_line(item):
+    """Returns the clues in one line of a JSON lines dump.
+
+    Args:
+        item (dict): A single clue with a 'round' key, or a game in the clue API format.
+            A game's 'air_date' applies to all of its clues.
+
+    Returns:
+        list of dict: Clues, each with a 'round' key
+    """
+    if 'clues' not in item:
+        return [item]
+    clues = []
+    air_date = {'air_date': item['air_date']} if 'air_date' in item else {}
+    for round_, rows in enumerate(item['clues']):
+        for row in rows:
+            for clue in row:
+                clues.append(dict(air_date, **clue, round=round_))
+    if 'fj' in item:
+        clues.append(dict(air_date, **item['fj'], round=FINAL_ROUND))
+    return clues
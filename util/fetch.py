@@ -0,0 +1,230 @@
+"""
+Shared HTTP client for the clue API, with keep-alive connections, retries, and a disk cache.
+
+Usage Example:
+    client = FetchClient.shared()
+    game = client.get_json('/api')
+    print(client.report())
+"""
+from collections import deque
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from util.stats import percentile
+
+API_URL = 'http://mathnerd7.pythonanywhere.com'
+
+class FetchError(Exception):
+    """Raised when a request still fails after every retry."""
+
+# pylint: disable=R0902
+class FetchClient():
+    """Fetches JSON from the clue API over one keep-alive session.
+
+    Connection errors, timeouts, server errors and responses that are not JSON are retried
+    with exponential backoff. Responses are cached on disk with their ETag and Last-Modified
+    headers, and sent back to the server to revalidate them, so an unchanged response is not
+    downloaded again. Responses with a Cache-Control max-age are not requested again until
+    they expire.
+
+    Attributes:
+        base_url (str): URL that request paths are relative to
+        cache_dir (str): Folder where responses are cached, or None to not cache
+        retries (int): Number of times a failed request is retried
+        backoff (float): Seconds to wait before the first retry, doubled for each retry
+        max_backoff (float): Most seconds to wait between retries
+        session (Session): Keep-alive session shared by all requests
+        latencies (deque of float): Seconds taken by recent successful requests
+        counts (dict of str: int): Number of requests, retries, failures, not modified
+            responses, and responses served from the cache without a request
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    # pylint: disable=R0913,R0917
+    def __init__(self, base_url=API_URL, cache_dir='fetch_cache', retries=3, backoff=0.5,
+            max_backoff=8):
+        """Initializes FetchClient Object
+
+        Args:
+            base_url (str, optional): URL that request paths are relative to. Defaults to
+                the clue API.
+            cache_dir (str, optional): Folder to cache responses in, or None to not cache.
+                Defaults to 'fetch_cache'.
+            retries (int, optional): Times a failed request is retried. Defaults to 3.
+            backoff (float, optional): Seconds before the first retry. Defaults to 0.5.
+            max_backoff (float, optional): Most seconds between retries. Defaults to 8.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.cache_dir = cache_dir
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.latencies = deque(maxlen=1000)
+        self.counts = {'requests': 0, 'retries': 0, 'failures': 0, 'not_modified': 0,
+            'cache_hits': 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Returns the client shared by the whole game, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, **kwargs):
+        """Replaces the shared client with one created with the given arguments.
+
+        Args:
+            **kwargs: Arguments passed to FetchClient()
+        """
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.close()
+            cls._shared = cls(**kwargs)
+            return cls._shared
+
+    def close(self):
+        """Close the session's connections."""
+        self.session.close()
+
+    def get_json(self, path, timeout=60):
+        """Requests a path and returns the decoded JSON response.
+
+        Args:
+            path (str): Path relative to base_url, such as '/api'
+            timeout (float, optional): Seconds to wait for the server. Defaults to 60.
+
+        Raises:
+            FetchError: If the request fails after every retry, or the server rejects it
+
+        Returns:
+            Any: The decoded response
+        """
+        url = self.base_url + path
+        cached = self.read_cache(url)
+        if cached is not None and cached['expires'] > time.time():
+            self.count('cache_hits')
+            return cached['body']
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                self.count('retries')
+                time.sleep(min(self.backoff * 2 ** (attempt - 1), self.max_backoff))
+            try:
+                return self.request(url, cached, timeout)
+            except requests.HTTPError as error:
+                status = error.response.status_code
+                if status < 500 and status != 429:
+                    # the request itself is wrong, so trying again will not help
+                    self.count('failures')
+                    raise FetchError(url + ': ' + str(error)) from error
+                print('Fetch failed: ' + str(error))
+            except (requests.RequestException, ValueError) as error:
+                print('Fetch failed: ' + url + ': ' + repr(error))
+        self.count('failures')
+        raise FetchError(url + ': failed after ' + str(self.retries + 1) + ' attempts')
+
+    def request(self, url, cached, timeout):
+        """Sends one request, revalidating a cached response if there is one.
+
+        Args:
+            url (str): URL to request
+            cached (dict): Cached response with 'etag', 'last_modified', and 'body', or None
+            timeout (float): Seconds to wait for the server
+
+        Returns:
+            Any: The decoded response
+        """
+        headers = {}
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        start = time.perf_counter()
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        self.count('requests')
+        if response.status_code == 304 and cached is not None:
+            self.count('not_modified')
+            body = cached['body']
+        else:
+            response.raise_for_status()
+            body = response.json()
+        with self._lock:
+            self.latencies.append(time.perf_counter() - start)
+        self.write_cache(url, response, body)
+        return body
+
+    def count(self, name):
+        """Adds one to a counter in counts."""
+        with self._lock:
+            self.counts[name] += 1
+
+    def cache_path(self, url):
+        """Returns the path of the file a URL's response is cached in."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + '.json')
+
+    def read_cache(self, url):
+        """Returns the cached response for a URL, or None if it is not cached."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_path(url), encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def write_cache(self, url, response, body):
+        """Caches a response if the server allows it and it can be revalidated or reused.
+
+        Args:
+            url (str): URL that was requested
+            response (Response): The server's response
+            body (Any): The decoded response
+        """
+        if self.cache_dir is None:
+            return
+        control = response.headers.get('Cache-Control', '').lower()
+        max_age = 0
+        for directive in control.split(','):
+            name, _, value = directive.strip().partition('=')
+            if name == 'max-age' and value.isdigit():
+                max_age = int(value)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if 'no-store' in control or not (etag or last_modified or max_age):
+            return
+        entry = {'etag': etag, 'last_modified': last_modified,
+            'expires': 0 if 'no-cache' in control else time.time() + max_age, 'body': body}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.cache_path(url)
+        temp = path + '.' + str(threading.get_ident()) + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+        os.replace(temp, path)
+
+    def summary(self):
+        """Returns fetch counts and latency percentiles in milliseconds."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+            summary = dict(self.counts)
+        if latencies:
+            summary['median_ms'] = percentile(latencies, 50) * 1000
+            summary['p90_ms'] = percentile(latencies, 90) * 1000
+            summary['max_ms'] = latencies[-1] * 1000
+        return summary
+
+    def report(self):
+        """Returns a one line description of the fetch counts and latencies."""
+        return 'Fetches: ' + ', '.join(name + ' ' + (f'{value:.0f}' if
+            isinstance(value, float) else str(value)) for name, value in self.summary().items())
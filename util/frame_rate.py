@@ -0,0 +1,66 @@
+"""
+Frame rate policy that throttles the game loop while it is waiting on the players or host.
+
+Usage Example:
+    policy = FrameRatePolicy(full_fps=60, idle_fps=5)
+    fps = policy.target_fps(state, player_manager)
+"""
+from util.constants import GameState
+
+class FrameRatePolicy():
+    """Decides how many frames per second the game loop should run at.
+
+    The game runs at full speed while buzzers are live or timers are counting down,
+    and drops to a low frame rate while it is only waiting for a click or key press.
+
+    Attributes:
+        full_fps (int): Frame rate used while buzzers are live or timers are running
+        idle_fps (int): Frame rate used while idle in states without their own frame rate
+        state_fps (dict of GameState: int): Frame rate used while idle in each game state.
+            States that poll for speech or network activity need a higher frame rate
+            to respond quickly when it finishes.
+    """
+    STATE_FPS = {
+        GameState.LOADING: 10,
+        GameState.INTRO: 20,
+        GameState.QUESTION: 30,
+        GameState.DAILY_DOUBLE: 30,
+        GameState.FINAL: 20,
+        GameState.TIE: 30,
+    }
+
+    def __init__(self, full_fps=60, idle_fps=5, state_fps=None):
+        """Initializes FrameRatePolicy Object
+
+        Args:
+            full_fps (int, optional): Frame rate while buzzers are live. Defaults to 60.
+            idle_fps (int, optional): Frame rate while idle. Defaults to 5.
+            state_fps (dict of GameState: int, optional): Idle frame rate for each game
+                state. Defaults to STATE_FPS.
+        """
+        self.full_fps = full_fps
+        self.idle_fps = idle_fps
+        self.state_fps = dict(self.STATE_FPS if state_fps is None else state_fps)
+
+    def is_idle(self, state, player_manager):
+        """Returns True if no buzzers are live and no timers are running.
+
+        Args:
+            state (State): The game's current state
+            player_manager (PlayerManager): Reference to manager that keeps track of players
+        """
+        if player_manager.green or player_manager.rung_in is not None:
+            # buzzers are live or a player is answering
+            return False
+        return not state.is_animating(player_manager)
+
+    def target_fps(self, state, player_manager):
+        """Returns the frame rate the game loop should run at for the next frame.
+
+        Args:
+            state (State): The game's current state
+            player_manager (PlayerManager): Reference to manager that keeps track of players
+        """
+        if not self.is_idle(state, player_manager):
+            return self.full_fps
+        return min(self.full_fps, self.state_fps.get(state.name, self.idle_fps))
@@ -0,0 +1,148 @@
+"""
+Data structures for the clues in a game.
+
+Usage Example:
+    clue = Clue.from_dict({'category': 'Category A', 'value': 200, ...})
+    grid = RoundGrid(['Category A', ...], [[clue, clue, ...], ...])
+    clue = grid.take(column, row)
+    if grid.remaining == 0:
+        # round is over
+"""
+import sys
+from util.util import TTS
+
+# pylint: disable=R0902
+class Clue():
+    """One clue, converted from the clue API's format once when a game is loaded.
+
+    Uses __slots__ instead of a dictionary for each clue, and works out the text drawn and
+    read aloud ahead of time so it is not recalculated every frame. Category names are
+    interned, so the clues in a category share one string.
+
+    Attributes:
+        category (str): Name of the clue's category
+        value (int): Dollar value of the clue, or None for final jeopardy
+        answer (str): The clue read to players
+        question (str): The correct response
+        daily_double (bool): True if the clue is a daily double
+        comments (str): Host's comments about the category, or '-' if there are none
+        air_date (str): Date the clue aired, or '' if unknown
+        display_answer (str): answer as drawn on screen
+        display_question (str): question as drawn on screen
+        speech (str): answer as read aloud
+    """
+    __slots__ = ('category', 'value', 'answer', 'question', 'daily_double', 'comments',
+        'air_date', 'display_answer', 'display_question', 'speech')
+
+    # pylint: disable=R0913,R0917
+    def __init__(self, category, value, answer, question, daily_double=False, comments='-',
+            air_date=''):
+        """Initializes Clue Object
+
+        Args:
+            category (str): Name of the clue's category
+            value (int): Dollar value of the clue, or None for final jeopardy
+            answer (str): The clue read to players
+            question (str): The correct response
+            daily_double (bool, optional): True if the clue is a daily double.
+                Defaults to False.
+            comments (str, optional): Host's comments about the category. Defaults to '-'.
+            air_date (str, optional): Date the clue aired. Defaults to ''.
+        """
+        self.category = sys.intern(category)
+        self.value = value
+        self.answer = answer
+        self.question = question
+        self.daily_double = daily_double
+        self.comments = comments
+        self.air_date = air_date
+        self.display_answer = answer.upper()
+        self.display_question = question.upper()
+        self.speech = TTS.prepare_speech(answer)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Creates a clue from the clue API's format.
+
+        Args:
+            data (dict of str: Any): Clue with 'category', 'answer' and 'question' keys, and
+                optionally 'value', 'daily_double', 'comments', and 'air_date'
+
+        Raises:
+            KeyError: If a required key is missing
+        """
+        return cls(data['category'], data.get('value'), data['answer'], data['question'],
+            data.get('daily_double') == 1, data.get('comments') or '-',
+            data.get('air_date') or '')
+
+    def __repr__(self):
+        return 'Clue(' + repr(self.category) + ', ' + repr(self.value) + ', ' + \
+            repr(self.answer) + ')'
+
+class RoundGrid():
+    """Fixed grid of clues for one round of the game.
+
+    Each column holds the clues for one category, ordered by value from top to bottom.
+    Clues taken off the board are tracked with a bitmap and a count of remaining clues,
+    so looking up a clue or checking if the round is over takes constant time.
+
+    Attributes:
+        categories (list of str): Category names, one for each column
+        columns (list of list of Clue): Clues for each category, ordered by value
+        remaining (int): Number of clues left on the board
+        taken (int): Bitmap of clues taken off the board. Bit (column * ROWS + row) is set
+            once the clue in that cell has been taken.
+    """
+    COLUMNS = 6
+    ROWS = 5
+    __slots__ = ('categories', 'columns', 'taken', 'remaining')
+
+    def __init__(self, categories, columns):
+        """Initializes RoundGrid Object
+
+        Args:
+            categories (list of str): Category names, one for each column
+            columns (list of list of Clue): Clues for each category, ordered by value
+        """
+        self.categories = categories
+        self.columns = columns
+        self.taken = 0
+        self.remaining = sum(len(column) for column in columns)
+
+    def is_complete(self):
+        """Returns True if the grid has exactly one clue in every cell."""
+        return len(self.columns) == self.COLUMNS and all(
+            len(column) == self.ROWS for column in self.columns)
+
+    def column(self, column):
+        """Returns all clues in a category, including those already taken.
+
+        Args:
+            column (int): Grid column of the category, starting from 0
+        """
+        return self.columns[column]
+
+    def is_taken(self, column, row):
+        """Returns True if the clue in a cell has been taken off the board.
+
+        Args:
+            column (int): Grid column of the clue, starting from 0
+            row (int): Grid row of the clue, starting from 0
+        """
+        return bool(self.taken >> (column * self.ROWS + row) & 1)
+
+    def take(self, column, row):
+        """Takes a clue off the board.
+
+        Args:
+            column (int): Grid column of the clue, starting from 0
+            row (int): Grid row of the clue, starting from 0
+
+        Returns:
+            Clue: The clue in the cell, or None if it has already been taken
+        """
+        if self.is_taken(column, row):
+            return None
+        self.taken |= 1 << (column * self.ROWS + row)
+        self.remaining -= 1
+        return self.columns[column][row]
@@ -0,0 +1,147 @@
+"""
+Background pool of validated games or clues, fetched before they are needed.
+
+Usage Example:
+    pool = PrefetchPool('games', 2, fetch_game, is_valid_game)
+    game = pool.take() # None if the pool is empty
+"""
+from collections import deque
+import json
+import os
+import threading
+import time
+
+# pylint: disable=R0902
+class PrefetchPool():
+    """Keeps a number of fetched and validated items ready in memory and on disk.
+
+    A background thread fetches items until the pool is full, and starts again whenever an
+    item is taken. Items that fail validation are thrown away. Failed fetches are retried
+    with exponential backoff. Items are also saved to disk, so a pool filled in one session
+    is ready as soon as the next session starts.
+
+    Attributes:
+        name (str): Name of the pool, used for its folder on disk
+        size (int): Number of items to keep ready
+        fetch (function): Returns a new item, may raise an exception if fetching fails
+        validate (function): Returns True if an item can be used
+        directory (str): Folder where items are saved
+        items (deque of (str, Any)): Tuples (file path, item) ready to be taken
+        max_backoff (float): Most seconds to wait before retrying a failed fetch
+    """
+    # pylint: disable=R0913,R0917
+    def __init__(self, name, size, fetch, validate, directory='prefetch'):
+        """Initializes PrefetchPool Object and starts filling it.
+
+        Args:
+            name (str): Name of the pool, used for its folder on disk
+            size (int): Number of items to keep ready
+            fetch (function): Returns a new item, may raise an exception if fetching fails
+            validate (function): Returns True if an item can be used
+            directory (str, optional): Parent folder where items are saved.
+                Defaults to 'prefetch'.
+        """
+        self.name = name
+        self.size = size
+        self.fetch = fetch
+        self.validate = validate
+        self.directory = os.path.join(directory, name)
+        self.items = deque()
+        self.max_backoff = 60
+        self.running = True
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self.load()
+        self.thread = threading.Thread(target=self.fill, daemon=True)
+        self.thread.start()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.items)
+
+    def take(self):
+        """Removes an item from the pool without waiting.
+
+        Returns:
+            Any: The oldest item in the pool, or None if the pool is empty
+        """
+        with self._lock:
+            if len(self.items) == 0:
+                item = None
+            else:
+                path, item = self.items.popleft()
+                remove(path)
+        self._wake.set() # refill
+        return item
+
+    def close(self):
+        """Stops filling the pool once any fetch in progress finishes. Items already saved
+        stay on disk for next time."""
+        self.running = False
+        self._wake.set()
+
+    def load(self):
+        """Loads items saved to disk by an earlier session."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding='utf-8') as file:
+                    item = json.load(file)
+            except (OSError, ValueError):
+                item = None
+            if item is not None and self.validate(item) and len(self.items) < self.size:
+                self.items.append((path, item))
+            else:
+                remove(path)
+
+    def save(self, item):
+        """Saves an item to disk.
+
+        Args:
+            item (Any): Item that can be converted to JSON
+
+        Returns:
+            str: Path of the file the item was saved to
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, str(time.time_ns()) + '.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(item, file)
+        os.replace(path + '.tmp', path)
+        return path
+
+    def fill(self):
+        """Fetches items until the pool is full, then waits for an item to be taken."""
+        backoff = 1
+        while self.running:
+            if len(self) >= self.size:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            try:
+                item = self.fetch()
+            except Exception as error: # pylint: disable=W0718
+                print(self.name + ' prefetch failed: ' + repr(error))
+                item = None
+            if item is not None and self.validate(item):
+                path = self.save(item)
+                with self._lock:
+                    self.items.append((path, item))
+                backoff = 1
+            else:
+                # wait before trying again, unless the pool is closed
+                self._wake.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+def remove(path):
+    """Deletes a file, ignoring files that are already gone.
+
+    Args:
+        path (str): Path of the file
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
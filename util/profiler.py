@@ -0,0 +1,168 @@
+"""
+Frame profiler that times each part of the game loop in each game state.
+
+Usage Example:
+    profiler = FrameProfiler()
+    profiler.start_frame(GameState.BOARD)
+    with profiler.phase('draw'):
+        state.draw(screen)
+    profiler.end_frame()
+    profiler.draw_overlay(screen)
+    profiler.dump('profile.json')
+"""
+from collections import deque
+from contextlib import contextmanager
+import csv
+import json
+import time
+import pygame
+from util.constants import Colors
+from util.stats import percentile
+
+PHASES = ('events', 'update', 'draw', 'flip')
+
+# pylint: disable=R0902
+class FrameProfiler():
+    """Times handle_events(), update(), draw() and the display flip for every frame.
+
+    Recent times are kept for each game state and phase, so percentiles show how each
+    state is behaving now rather than averaged over the whole session. Every frame is
+    also kept in a trace, which can be saved to a file and read offline.
+
+    Attributes:
+        window (int): Number of recent frames that percentiles are taken over
+        times (dict of (GameState, str): deque of float): Seconds taken by recent frames,
+            for each state and phase
+        frames (dict of GameState: int): Number of frames profiled in each state
+        trace (deque of dict): Recent frames, with the state, start time, and milliseconds
+            taken by each phase
+        overlay (boolean): True if the percentiles are drawn over the game
+        overlay_rect (Rect): Region of the screen the overlay was last drawn in
+    """
+    def __init__(self, window=600, trace_size=100000):
+        """Initializes FrameProfiler Object
+
+        Args:
+            window (int, optional): Frames that percentiles are taken over. Defaults to 600.
+            trace_size (int, optional): Most frames kept in the trace. Defaults to 100000.
+        """
+        self.window = window
+        self.times = {}
+        self.frames = {}
+        self.trace = deque(maxlen=trace_size)
+        self.overlay = False
+        self.overlay_rect = None
+        self._frame = None
+        self._font = None
+        self._start = time.perf_counter()
+
+    def start_frame(self, state):
+        """Starts timing a frame.
+
+        Args:
+            state (GameState): State the game is in at the start of the frame
+        """
+        self._frame = {'state': state, 'start': time.perf_counter()}
+
+    @contextmanager
+    def phase(self, name):
+        """Times the code run inside a with block as one phase of the current frame.
+
+        Args:
+            name (str): One of PHASES
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._frame is not None:
+                self._frame[name] = time.perf_counter() - start
+
+    def end_frame(self):
+        """Finishes the current frame, adding its times to the state it started in."""
+        frame = self._frame
+        if frame is None:
+            return
+        self._frame = None
+        state = frame['state']
+        self.frames[state] = self.frames.get(state, 0) + 1
+        row = {'state': state.name, 'time_ms': (frame['start'] - self._start) * 1000}
+        for name in PHASES:
+            seconds = frame.get(name, 0.0)
+            times = self.times.get((state, name))
+            if times is None:
+                times = self.times[(state, name)] = deque(maxlen=self.window)
+            times.append(seconds)
+            row[name + '_ms'] = seconds * 1000
+        self.trace.append(row)
+
+    def summary(self):
+        """Returns percentiles in milliseconds of recent frames for each state and phase.
+
+        Returns:
+            dict of str: dict: For each state name, the number of frames profiled and the
+                p50, p95 and p99 milliseconds of each phase
+        """
+        summary = {}
+        for state, count in self.frames.items():
+            phases = {}
+            for name in PHASES:
+                times = sorted(self.times[(state, name)])
+                phases[name] = {pct: percentile(times, int(pct[1:])) * 1000
+                    for pct in ('p50', 'p95', 'p99')}
+            summary[state.name] = {'frames': count, 'phases': phases}
+        return summary
+
+    def toggle_overlay(self):
+        """Shows the overlay if it is hidden, or hides it if it is shown."""
+        self.overlay = not self.overlay
+        self.overlay_rect = None
+
+    def draw_overlay(self, screen):
+        """Draws the current state's percentiles in the top left corner of the screen.
+
+        Args:
+            screen (Surface): Pygame display where the overlay will be drawn
+
+        Returns:
+            Rect: Region of the screen the overlay was drawn in, or None if it is hidden
+        """
+        if not self.overlay or self._frame is None:
+            return None
+        if self._font is None:
+            self._font = pygame.font.SysFont('arial', 20)
+        state = self._frame['state']
+        lines = [state.name + '  ms  p50 / p95 / p99']
+        for name in PHASES:
+            times = sorted(self.times.get((state, name), ()))
+            if times:
+                lines.append(name + '  ' + ' / '.join(f'{percentile(times, pct) * 1000:.1f}'
+                    for pct in (50, 95, 99)))
+        surfaces = [self._font.render(line, True, Colors.WHITE) for line in lines]
+        # round the width up so the overlay does not change size as the numbers change
+        width = (max(surface.get_width() for surface in surfaces) + 20) // 100 * 100 + 100
+        height = sum(surface.get_height() for surface in surfaces) + 20
+        self.overlay_rect = screen.fill(Colors.BLACK, (0, 0, width, height))
+        y_pos = 10
+        for surface in surfaces:
+            screen.blit(surface, (10, y_pos))
+            y_pos += surface.get_height()
+        return self.overlay_rect
+
+    def dump(self, path):
+        """Saves the trace to a file, as CSV if the path ends in .csv and JSON otherwise.
+
+        JSON files also contain the summary.
+
+        Args:
+            path (str): File to write
+        """
+        if path.endswith('.csv'):
+            with open(path, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.DictWriter(file, ['state', 'time_ms'] +
+                    [name + '_ms' for name in PHASES])
+                writer.writeheader()
+                writer.writerows(self.trace)
+        else:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'summary': self.summary(), 'trace': list(self.trace)}, file)
@@ -0,0 +1,97 @@
+"""
+Scheduler for countdowns and delayed callbacks, driven by the game loop.
+
+Usage Example:
+    scheduler = Scheduler()
+    timer = scheduler.schedule(5000, time_up) # call time_up() in 5 seconds
+    scheduler.advance(elapsed_time) # once per frame
+    if timer.remaining < 1000:
+        # less than a second left
+"""
+import heapq
+import itertools
+
+class Timer():
+    """Handle to a deadline registered with a Scheduler.
+
+    Attributes:
+        scheduler (Scheduler): Scheduler the deadline was registered with
+        deadline (int): Scheduler time in milliseconds when the timer expires
+        callback (function): Called once when the timer expires, or None
+        cancelled (boolean): True if the timer was cancelled before it expired
+    """
+    def __init__(self, scheduler, deadline, callback):
+        """Initializes Timer Object
+
+        Args:
+            scheduler (Scheduler): Scheduler the deadline is registered with
+            deadline (int): Scheduler time in milliseconds when the timer expires
+            callback (function): Called once when the timer expires, or None
+        """
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    @property
+    def remaining(self):
+        """Milliseconds left until the timer expires. 0 once expired or cancelled."""
+        if self.cancelled:
+            return 0
+        return max(0, self.deadline - self.scheduler.now)
+
+    @property
+    def expired(self):
+        """True once the deadline has passed, unless the timer was cancelled."""
+        return not self.cancelled and self.scheduler.now >= self.deadline
+
+    def cancel(self):
+        """Stops the timer. Its callback will not be called."""
+        self.cancelled = True
+
+class Scheduler():
+    """Keeps track of deadlines and calls their callbacks when they expire.
+
+    Time only moves forward when the game loop calls advance(), so nothing waits or
+    sleeps on the main thread. Timers with callbacks are kept in a heap ordered by
+    deadline, so each frame only looks at the timers that have expired. Timers without
+    callbacks are never stored, and are checked through their handle instead.
+
+    Attributes:
+        now (int): Milliseconds the game loop has advanced the scheduler by
+        queue (list of (int, int, Timer)): Heap of (deadline, order scheduled, timer)
+    """
+    def __init__(self):
+        self.now = 0
+        self.queue = []
+        self._order = itertools.count()
+
+    def schedule(self, delay, callback=None):
+        """Registers a deadline.
+
+        Args:
+            delay (int): Milliseconds from now until the timer expires
+            callback (function, optional): Called with no arguments when the timer
+                expires. Defaults to None.
+
+        Returns:
+            Timer: Handle to check how much time is left or cancel the timer
+        """
+        timer = Timer(self, self.now + delay, callback)
+        if callback is not None:
+            heapq.heappush(self.queue, (timer.deadline, next(self._order), timer))
+        return timer
+
+    def advance(self, elapsed_time):
+        """Moves time forward and calls the callbacks of timers that have expired.
+
+        Callbacks are called in order of deadline, then in the order they were scheduled.
+
+        Args:
+            elapsed_time (int): Milliseconds that have passed since advance() was last called
+        """
+        self.now += elapsed_time
+        while len(self.queue) > 0 and self.queue[0][0] <= self.now:
+            _, _, timer = heapq.heappop(self.queue)
+            if not timer.cancelled:
+                timer.callback()
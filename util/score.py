@@ -1,12 +1,27 @@
 """
 Util functions for score display.
 """
+import math
 import pygame
 from util.constants import Colors
 from util.util import Font
 
+TIMER_LIGHTS = 9
+TIMER_HEIGHT = 20
+
+# pylint: disable=R0902
 class Score:
-    """Display player scores and question timers."""
+    """Display player scores and question timers.
+
+    Text is only rendered when it changes, and the timer lights are copied from a sprite
+    sheet drawn once, so redrawing a score box is a fill and a few blits.
+
+    Attributes:
+        labels (dict of int: Surface): Rendered 'Player N' label of each player
+        amounts (dict of int: (str, Surface)): Last score text rendered for each player,
+            and the rendered text
+        timer_sheet (Surface): The timer lights for 0 to 5 seconds left, side by side
+    """
 
     def __init__(self) -> None:
         self.score_boxes = []
@@ -14,11 +29,16 @@ class Score:
         self.editing = None
         self.edit_text = ''
         self.screen = pygame.Surface((300, 1000))
+        self.drawn = {}
+        self.labels = {}
+        self.amounts = {}
+        self.timer_sheet = make_timer_sheet(self.screen.get_width())
 
     def make_score_boxes(self, num_players):
         """Generate surfaces where scores will be drawn."""
         width, height = self.screen.get_size()
         box_height = height / num_players
+        self.score_boxes = []
         for i in range(num_players):
             self.score_boxes.append((0, i*box_height, width, box_height)) # box for player's score
 
@@ -51,69 +71,118 @@ class Score:
             except ValueError:
                 print("Invalid input. Must be a number")
             self.editing = None
+        self.drawn = {} # redraw all score boxes
 
-        if len(self.score_boxes) == 0 and len(player_manager.players) > 0:
+        if len(self.score_boxes) != len(player_manager.players) and player_manager.players:
             self.make_score_boxes(len(player_manager.players))
 
     def display_score(self, player_manager):
-        """Draws the score board.
+        """Draws the score board, redrawing only score boxes whose score or timer changed.
 
         Args:
-            screen (Surface): Pygame surface where score board should be drawn
             player_manager (PlayerManager): Reference to manager that keeps track of players
-        """
-        # background color
-        self.screen.fill(Colors.BLUE)
 
+        Returns:
+            list of Rect: Score boxes that were redrawn
+        """
+        dirty = []
         # Draw score boxes stacked vertically - one box for each player
         for i, player in enumerate(player_manager.players):
             rect = self.score_boxes[i] # box for player's score
+            answering = (player_manager.rung_in == player.number
+                and player_manager.answer_timer is not None)
             active = player_manager.rung_in == player.number
             if self.editing == i:
                 score = self.edit_text
                 active = True
             else:
                 score = player.score
-            draw_score(self.screen, rect, i, score)
-            draw_timer(self.screen, rect, player_manager.timer, active)
+            # only light the timer while the player's time to answer is counting down
+            box = (str(score), active, timer_step(player_manager.timer) if answering else 0)
+            if self.drawn.get(i) == box:
+                continue # nothing has changed
+            self.drawn[i] = box
+            # round outwards so fractional box edges are included
+            top = math.floor(rect[1])
+            dirty.append(pygame.Rect(rect[0], top, rect[2], math.ceil(rect[1] + rect[3]) - top))
+
+            # background color
+            self.screen.fill(Colors.BLUE, rect)
+            self.draw_score(rect, i, str(score))
+            self.draw_timer(rect, box[2])
             if active:
                 # draw white outline
                 outline = (5, rect[1]+5, rect[2]-10, rect[3]-10)
                 pygame.draw.rect(self.screen, Colors.WHITE, outline, 10)
             # draw box outline
             pygame.draw.rect(self.screen, Colors.BLACK, rect, 5)
+        return dirty
+
+    def draw_score(self, rect, player_number, score):
+        """Draws score and player identifier for one player, rendering text only when it
+        has changed.
+
+        Args:
+            rect (int, int, int, int): Tuple (x, y, width, height) representing box to draw
+                score in. (x,y) is pixel position of the top left corner. Width, height are
+                dimensions of the box
+            player_number (int): id number of the player
+            score (str): Score, or the score being typed in
+        """
+        # Draw player score amount
+        cached = self.amounts.get(player_number)
+        if cached is None or cached[0] != score:
+            cached = (score, Font.number.render('$' + score, True, Colors.WHITE))
+            self.amounts[player_number] = cached
+        text = cached[1]
+        text_rect = text.get_rect(center=((rect[0] + rect[2])/2, rect[1] + rect[3]*2/3))
+        self.screen.blit(text,text_rect)
+
+        # Draw player identifier
+        text = self.labels.get(player_number)
+        if text is None:
+            text = Font.number.render('Player ' + str(player_number + 1), True, Colors.WHITE)
+            self.labels[player_number] = text
+        text_rect = text.get_rect(center=((rect[0] + rect[2])/2, rect[1] + rect[3]/4))
+        self.screen.blit(text,text_rect)
+
+    def draw_timer(self, rect, seconds):
+        """Copies the timer lights for the seconds left from the sprite sheet.
+
+        Args:
+            rect (int, int, int, int): Box the timer is drawn at the bottom of
+            seconds (int): Seconds left, from timer_step(), or 0 if the player is not
+                answering
+        """
+        width = self.timer_sheet.get_width() // 6
+        self.screen.blit(self.timer_sheet, (rect[0], rect[1] + rect[3] - 30),
+            (seconds * width, 0, width, TIMER_HEIGHT))
+
+def timer_step(timer):
+    """Returns number of seconds (0-5) left on the timer, rounded up."""
+    return max(0, min(5, math.ceil(timer/1000)))
 
-def draw_score(screen, rect, player_number, score):
-    """Draws score and timer display for one player.
+def make_timer_sheet(width):
+    """Draws the timer display for each number of seconds left, side by side.
+
+    Lights are lit outward from the center, one pair for each second left.
 
     Args:
-        screen (Surface): screen (Surface): Pygame surface where score will be drawn
-        rect (int, int, int, int): Tuple (x, y, width, height) representing box to draw score in
-            (x,y) is pixel position of the top left corner. Width, height are dimensions of the box
-        player (Player): Player object that contains score, timer info
-        timer (int): Time in milliseconds left to answer question
+        width (int): Width of the timer display
+
+    Returns:
+        Surface: Six frames of the timer display, for 0 to 5 seconds left
     """
-    # Draw player score amount
-    text = Font.number.render('$' + str(score), True, Colors.WHITE)
-    text_rect = text.get_rect(center=((rect[0] + rect[2])/2, rect[1] + rect[3]*2/3))
-    screen.blit(text,text_rect)
-
-    # Draw player identifier
-    text = Font.number.render('Player ' + str(player_number + 1), True, Colors.WHITE)
-    text_rect = text.get_rect(center=((rect[0] + rect[2])/2, rect[1] + rect[3]/4))
-    screen.blit(text,text_rect)
-
-def draw_timer(screen, rect, active, timer):
-    """Draw timer display to indicate time remaining."""
-    little_rect_width = rect[2]/9
-    for i in range(9):
-        color = Colors.BLACK
-        if active:
-            color = Colors.RED
-            if (i < 5 and 4 - timer/1000 >= i) or (i >= 5 and timer/1000 + 4 < i):
-                color = Colors.BLACK
-        pygame.draw.rect(screen, color,
-            (rect[0] + little_rect_width*i, rect[1] + rect[3] - 30, little_rect_width, 20))
-        # draw border around rectangle
-        pygame.draw.rect(screen, Colors.WHITE,
-            (rect[0] + little_rect_width*i, rect[1] + rect[3] - 30, little_rect_width, 20), 2)
+    sheet = pygame.Surface((width * 6, TIMER_HEIGHT))
+    sheet.fill(Colors.BLUE) # shows through the gaps between lights
+    little_rect_width = width/TIMER_LIGHTS
+    for seconds in range(6):
+        for i in range(TIMER_LIGHTS):
+            color = Colors.BLACK
+            if abs(i - TIMER_LIGHTS // 2) < seconds:
+                color = Colors.RED
+            light = (seconds * width + little_rect_width*i, 0, little_rect_width, TIMER_HEIGHT)
+            pygame.draw.rect(sheet, color, light)
+            # draw border around rectangle
+            pygame.draw.rect(sheet, Colors.WHITE, light, 2)
+    return sheet
@@ -0,0 +1,114 @@
+"""
+Text to speech engines that synthesize clues and announcements.
+
+Backends produce raw signed 16-bit samples in the mixer's native sample rate and number of
+channels, so speech can be handed straight to mixer.Sound(buffer=...) without being
+encoded into and parsed back out of a sound file.
+
+Usage Example:
+    backend = BACKENDS['tone']()
+    pcm = backend.synthesize('This is a test', 44100, 2)
+    sound = mixer.Sound(buffer=pcm)
+"""
+from array import array
+from io import BytesIO
+import math
+import shutil
+import subprocess
+import sys
+import zlib
+from pygame import mixer
+from pydub.utils import get_encoder_name
+from gtts import gTTS
+
+class SpeechBackend():
+    """Abstract class for text to speech engines.
+
+    Attributes:
+        name (str): Name the engine is selected by
+    """
+    name = None
+
+    @classmethod
+    def is_available(cls):
+        """Returns True if the engine can be used on this machine."""
+        return True
+
+    def synthesize(self, text, frequency, channels):
+        """Generates speech for the given text.
+
+        Args:
+            text (str): Words to be read aloud
+            frequency (int): Samples per second the mixer plays at
+            channels (int): Number of channels the mixer plays (1 for mono, 2 for stereo)
+
+        Returns:
+            bytes: Speech as raw signed 16-bit samples in native byte order, with channels
+                interleaved
+        """
+        raise NotImplementedError('synthesize() not implemented for this SpeechBackend.')
+
+class GoogleBackend(SpeechBackend):
+    """Google text to speech. Requires a network connection and ffmpeg."""
+    name = 'google'
+
+    def synthesize(self, text, frequency, channels):
+        # generate mp3 in buffer
+        tts = gTTS(text)
+        bytes_stream = BytesIO()
+        tts.write_to_fp(bytes_stream)
+        # decode mp3 straight to raw samples in the mixer's format
+        sample_format = 's16le' if sys.byteorder == 'little' else 's16be'
+        result = subprocess.run([get_encoder_name(), '-loglevel', 'error', '-i', 'pipe:0',
+            '-f', sample_format, '-ac', str(channels), '-ar', str(frequency), 'pipe:1'],
+            input=bytes_stream.getvalue(), capture_output=True, check=True, timeout=30)
+        return result.stdout
+
+class EspeakBackend(SpeechBackend):
+    """Local speech synthesis with the espeak-ng (or espeak) command line program."""
+    name = 'espeak'
+
+    @classmethod
+    def command(cls):
+        """Returns path to the espeak program, or None if it is not installed."""
+        return shutil.which('espeak-ng') or shutil.which('espeak')
+
+    @classmethod
+    def is_available(cls):
+        return cls.command() is not None
+
+    def synthesize(self, text, frequency, channels):
+        result = subprocess.run([self.command(), '--stdout', text], capture_output=True,
+            check=True, timeout=30)
+        # espeak only writes wav files, let the mixer convert it to its own format
+        return mixer.Sound(file=BytesIO(result.stdout)).get_raw()
+
+class ToneBackend(SpeechBackend):
+    """Deterministic stand-in for speech that plays one beep per word.
+
+    Needs no network or external programs, so it is useful for testing and for measuring
+    latency without a real speech engine.
+
+    """
+    name = 'tone'
+
+    def synthesize(self, text, frequency, channels):
+        samples = array('h')
+        for word in text.split():
+            # pitch and length depend only on the word, so the same text always sounds the same
+            pitch = 300 + zlib.crc32(word.encode()) % 400
+            length = int(frequency * (0.06 + 0.015 * len(word)))
+            samples.extend(int(8000 * math.sin(2 * math.pi * pitch * i / frequency))
+                for i in range(length))
+            samples.extend([0] * int(frequency * 0.04)) # pause between words
+        # play the same samples on every channel
+        interleaved = array('h', bytes(len(samples) * channels * samples.itemsize))
+        for channel in range(channels):
+            interleaved[channel::channels] = samples
+        return interleaved.tobytes()
+
+BACKENDS = {backend.name: backend for backend in [GoogleBackend, EspeakBackend, ToneBackend]}
+
+def available_backends():
+    """Returns names of the speech engines that can be used on this machine."""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
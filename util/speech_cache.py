@@ -0,0 +1,107 @@
+"""
+On-disk cache of synthesized speech, so repeated phrases do not need to be synthesized again.
+
+Usage Example:
+    cache = SpeechCache()
+    audio = cache.load(text)
+    if audio is None:
+        audio = synthesize(text)
+        cache.save(text, audio)
+"""
+import hashlib
+import os
+import threading
+
+class SpeechCache():
+    """Content addressed cache of synthesized speech stored on disk.
+
+    Each phrase is stored in a file named after a hash of its text. When the cache grows
+    past its size limit, the least recently used files are deleted.
+
+    Attributes:
+        directory (str): Folder where speech files are stored
+        max_bytes (int): Maximum total size of the speech files
+        size (int): Current total size of the speech files, or None if not yet known
+    """
+    def __init__(self, directory='speech_cache', max_bytes=100*1024*1024):
+        """Initializes SpeechCache Object
+
+        Args:
+            directory (str, optional): Folder where speech files are stored.
+                Defaults to 'speech_cache'.
+            max_bytes (int, optional): Maximum total size of the speech files. Defaults to 100MB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = None
+        self._lock = threading.Lock()
+
+    def path(self, key):
+        """Returns the path of the file that speech for the given key is stored in.
+
+        Args:
+            key (str): Text that was synthesized, along with anything else that affects
+                how it sounds
+        """
+        name = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.directory, name + '.pcm')
+
+    def load(self, key):
+        """Returns cached speech, or None if it has not been cached.
+
+        Args:
+            key (str): Text that was synthesized, along with anything else that affects
+                how it sounds
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                audio = file.read()
+            os.utime(path) # mark as recently used
+            return audio
+        except OSError:
+            return None
+
+    def save(self, key, audio):
+        """Stores speech in the cache, then removes old speech if the cache is too large.
+
+        Args:
+            key (str): Text that was synthesized, along with anything else that affects
+                how it sounds
+            audio (bytes): Synthesized speech
+        """
+        path = self.path(key)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.size is None:
+                self.size = sum(size for _, size, _ in self.files())
+            # write to a temporary file first so a partially written file is never loaded
+            with open(path + '.tmp', 'wb') as file:
+                file.write(audio)
+            if os.path.exists(path):
+                self.size -= os.path.getsize(path)
+            os.replace(path + '.tmp', path)
+            self.size += len(audio)
+            if self.size > self.max_bytes:
+                self.evict()
+
+    def files(self):
+        """Returns (path, size, last used time) for every speech file in the cache."""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    files.append((entry.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def evict(self):
+        """Deletes least recently used speech until the cache is under its size limit."""
+        for path, size, _ in sorted(self.files(), key=lambda file: file[2]):
+            if self.size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self.size -= size
+            except OSError as error:
+                print(error)
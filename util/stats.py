@@ -0,0 +1,17 @@
+"""
+Summary statistics shared by the game's timing reports.
+
+Usage Example:
+    times = sorted(latencies)
+    print(percentile(times, 50), percentile(times, 99))
+"""
+
+def percentile(values, pct):
+    """Returns the nearest-rank percentile of a sorted list of values.
+
+    Args:
+        values (list of float): Values sorted in ascending order
+        pct (float): Percentile between 0 and 100
+    """
+    index = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+    return values[index]
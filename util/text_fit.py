@@ -0,0 +1,129 @@
+"""
+Fits text inside a rectangle, choosing the largest font size its wrapped lines fit at.
+
+Usage Example:
+    fitter = TextFitter([pygame.font.Font(path, size) for size in range(24, 61, 2)])
+    font, lines, line_height = fitter.fit('THIS CLUE IS READ ALOUD', 1100, 800)
+    for i, line in enumerate(lines):
+        screen.blit(font.render(line, True, color), (100, 100 + i*line_height))
+"""
+from collections import OrderedDict, namedtuple
+
+Layout = namedtuple('Layout', ['font', 'lines', 'line_height'])
+MAX_WORDS = 5000 # word widths kept for each size before they are measured again
+
+class TextFitter():
+    """Finds the largest size of a font that text can be wrapped to fit a rectangle at.
+
+    Sizes are binary searched, so only a few sizes are laid out for each text. The width
+    of every word is measured once for each size and reused by every layout, and finished
+    layouts are kept so text drawn again in the same rectangle is not laid out again.
+
+    Attributes:
+        fonts (list of Font): The same typeface at each size, smallest first
+        maxsize (int): Maximum number of layouts kept
+        hits (int): Number of fits that found an earlier layout
+        misses (int): Number of fits that had to lay out the text
+    """
+    def __init__(self, fonts, maxsize=256):
+        """Initializes TextFitter Object
+
+        Args:
+            fonts (list of Font): The same typeface at each size, smallest first
+            maxsize (int, optional): Most layouts kept. Defaults to 256.
+        """
+        self.fonts = list(fonts)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._widths = [{} for _ in self.fonts]
+        self._layouts = OrderedDict()
+
+    def fit(self, text, width, height):
+        """Returns the layout of text at the largest size that fits a rectangle.
+
+        Text that does not fit at any size is laid out at the smallest size.
+
+        Args:
+            text (str): The words to be drawn
+            width (float): Width in pixels of the rectangle
+            height (float): Height in pixels of the rectangle
+
+        Returns:
+            Layout: Font the text fits in, the lines of text, and line height
+        """
+        key = (text, width, height)
+        if key in self._layouts:
+            self.hits += 1
+            self._layouts.move_to_end(key)
+            return self._layouts[key]
+
+        self.misses += 1
+        words = text.split(' ')
+        best = None
+        low, high = 0, len(self.fonts) - 1
+        middle = high # most text fits at the largest size, so try it first
+        while low <= high:
+            layout, widest = self.wrap(words, middle, width)
+            if widest <= width and layout.line_height*len(layout.lines) <= height:
+                # fits, so try a larger size
+                best = layout
+                low = middle + 1
+            else:
+                high = middle - 1
+            middle = (low + high) // 2
+        if best is None:
+            best = self.wrap(words, 0, width)[0]
+        self._layouts[key] = best
+        if len(self._layouts) > self.maxsize:
+            self._layouts.popitem(last=False) # evict least recently used layout
+        return best
+
+    def wrap(self, words, index, width):
+        """Breaks words into lines that fit within a width, at one size.
+
+        Args:
+            words (list of str): The words to be drawn
+            index (int): Index of the font size in fonts
+            width (float): Width in pixels lines should fit within
+
+        Returns:
+            (Layout, int): The lines of text, and the width in pixels of the widest line.
+                A word wider than the width is put on a line of its own.
+        """
+        font = self.fonts[index]
+        widths = self._widths[index]
+        if len(widths) > MAX_WORDS:
+            widths.clear()
+        lines = [] # list of lines, each line is a string of words
+        widest = 0
+        i = 0
+        while i < len(words):
+            # Add word to new line
+            line = [words[i]]
+            line_width = self.measure(font, widths, words[i])
+            i += 1
+            while i < len(words):
+                # keep adding words to line until it would exceed max width
+                word_len = self.measure(font, widths, words[i] + ' ')
+                if word_len + line_width > width:
+                    break
+                line.append(words[i])
+                line_width += word_len
+                i += 1
+            lines.append(' '.join(line))
+            widest = max(widest, line_width)
+        return Layout(font, lines, font.get_height()), widest
+
+    @staticmethod
+    def measure(font, widths, word):
+        """Returns the width in pixels of a word, measuring it only the first time.
+
+        Args:
+            font (Font): Pygame font the word is drawn in
+            widths (dict of str: int): Widths already measured in the font
+            word (str): The word to measure
+        """
+        if word not in widths:
+            widths[word] = font.size(word)[0]
+        return widths[word]
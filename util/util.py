@@ -1,12 +1,17 @@
 """
 Utility functions and classes
 """
-from io import BytesIO
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import string
+import threading
+import time
 import pygame
-from pydub import AudioSegment
 from pygame import mixer
-from gtts import gTTS
 from util.constants import Colors
+from util.speech_cache import SpeechCache
+from util.speech_backends import BACKENDS, GoogleBackend
+from util.text_fit import TextFitter
 
 class Font():
     """Fonts for rendered text.
@@ -22,19 +27,27 @@ class Font():
     NUMBER = 2
     CATEGORY = 3
     BIG = 4
-    CLUE_SMALL = 5
-    CLUE_SMALLEST = 6
+    # clues are drawn at the largest of these sizes they fit at
+    CLUE_SIZES = range(24, 61, 2)
+    # dollar amounts, wagers, and 'Player N' labels. Other letters are left out because
+    # some pairs of them are kerned, which drawing one glyph at a time would not do.
+    NUMBER_GLYPHS = string.digits + '$-, Player'
     _fonts = {}
+    _atlases = {}
+    _fitters = {}
     @classmethod
     def load_fonts(cls):
-        """Loads fonts to be used in game."""
+        """Loads fonts to be used in game, generates every size of the clue font, and
+        renders the number font's glyph atlas."""
         cls._fonts[cls.DEFAULT] = pygame.font.SysFont("arial", 40)
         cls._fonts[cls.BIG] = pygame.font.SysFont("arial", 80)
-        cls._fonts[cls.CLUE]= pygame.font.Font('fonts/Caudex-Bold.ttf', 60)
-        cls._fonts[cls.CLUE_SMALL]= pygame.font.Font('fonts/Caudex-Bold.ttf', 50)
-        cls._fonts[cls.CLUE_SMALLEST]= pygame.font.Font('fonts/Caudex-Bold.ttf', 40)
+        clue_fonts = [pygame.font.Font('fonts/Caudex-Bold.ttf', size) for size in cls.CLUE_SIZES]
+        cls._fonts[cls.CLUE] = clue_fonts[-1]
+        cls._fitters = {clue_fonts[-1]: TextFitter(clue_fonts)}
         cls._fonts[cls.NUMBER] = pygame.font.Font('fonts/Anton-Regular.ttf', 80)
         cls._fonts[cls.CATEGORY] = pygame.font.Font('fonts/Anton-Regular.ttf', 36)
+        cls._atlases[cls.NUMBER] = GlyphAtlas(cls._fonts[cls.NUMBER], cls.NUMBER_GLYPHS,
+            (Colors.GOLD, Colors.WHITE, Colors.BLACK))
 
     @classmethod
     def get_font(cls, font):
@@ -53,13 +66,18 @@ class Font():
         raise FileNotFoundError('That font has not been loaded. Please try load_fonts() first.')
 
     @classmethod
-    def get_smaller(cls, font):
-        """Retrieve a smaller version of font."""
-        if font == cls.get_font(cls.CLUE):
-            return cls.get_font(cls.CLUE_SMALL)
-        if font == cls.get_font(cls.CLUE_SMALL):
-            return cls.get_font(cls.CLUE_SMALLEST)
-        return cls.get_font(font)
+    def get_fitter(cls, font):
+        """Returns the fitter that lays out text in a font.
+
+        Text in the clue font is shrunk until it fits. Other fonts only have one size, so
+        their text is wrapped but never shrunk.
+
+        Args:
+            font (Font): Pygame font the text is drawn in
+        """
+        if font not in cls._fitters:
+            cls._fitters[font] = TextFitter([font])
+        return cls._fitters[font]
 
     @classmethod
     @property
@@ -85,6 +103,99 @@ class Font():
         """Getter for number font."""
         return cls.get_font(cls.NUMBER)
 
+    @classmethod
+    @property
+    def number_glyphs(cls):
+        """Getter for number font's glyph atlas."""
+        if cls.NUMBER in cls._atlases:
+            return cls._atlases[cls.NUMBER]
+        raise FileNotFoundError('That font has not been loaded. Please try load_fonts() first.')
+
+class GlyphAtlas():
+    """Characters of a font rendered once in each color, so strings made of them can be
+    drawn by copying glyphs instead of rendering the string every frame.
+
+    Each color has one sheet with every character side by side, and a string is drawn
+    with a single Surface.blits() call. Strings with a character or color that is not in
+    the atlas are rendered by the font instead.
+
+    Attributes:
+        font (Font): Pygame font the characters were rendered with
+        height (int): Height in pixels of text rendered by the font
+        top (int): Rows at the top of the font's height that no glyph draws in, which are
+            left off the sheets so drawing does not blend empty pixels
+        glyphs (dict of str: Rect): Where each character is on the sheets
+        sheets (dict of Color: Surface): Sheet of every character in each color
+    """
+    def __init__(self, font, characters, colors):
+        """Initializes GlyphAtlas Object
+
+        Args:
+            font (Font): Pygame font to render the characters with
+            characters (str): Characters to render
+            colors (list of Color): Colors to render the characters in
+        """
+        self.font = font
+        self.height = font.get_height()
+        self.glyphs = {}
+        x_pos = 0
+        for char in characters:
+            width = font.size(char)[0]
+            self.glyphs[char] = pygame.Rect(x_pos, 0, width, self.height)
+            x_pos += width
+        self.sheets = {}
+        for color in colors:
+            sheet = pygame.Surface((x_pos, self.height), pygame.SRCALPHA)
+            sheet.fill((0, 0, 0, 0))
+            for char, area in self.glyphs.items():
+                # copy the glyph's alpha as it is instead of blending it with the sheet
+                sheet.blit(font.render(char, True, color), area,
+                    special_flags=pygame.BLEND_RGBA_MAX)
+            self.sheets[color] = sheet
+        # crop the sheets to the rows the glyphs draw in
+        ink = pygame.Rect(0, 0, 0, 0)
+        if self.sheets:
+            ink = next(iter(self.sheets.values())).get_bounding_rect()
+        self.top = ink.top
+        for color, sheet in self.sheets.items():
+            self.sheets[color] = sheet.subsurface((0, ink.top, x_pos, ink.height)).copy()
+        for area in self.glyphs.values():
+            area.height = ink.height
+
+    def can_draw(self, text, color):
+        """Returns True if every character of the text is in the atlas in the color."""
+        return color in self.sheets and all(char in self.glyphs for char in text)
+
+    def draw(self, screen, text, color, center):
+        """Draws text centered on a point.
+
+        Args:
+            screen (Surface): Pygame surface where the text will be drawn
+            text (str): The characters to be drawn
+            color (Color): Color of the text
+            center (int, int): Pixel position the text is centered on
+
+        Returns:
+            Rect: Region of the screen the text was drawn in
+        """
+        if not self.can_draw(text, color):
+            surface = self.font.render(text, True, color)
+            rect = surface.get_rect(center=center)
+            screen.blit(surface, rect)
+            return rect
+        areas = [self.glyphs[char] for char in text]
+        rect = pygame.Rect(0, 0, sum(area.width for area in areas), self.height)
+        rect.center = center
+        sheet = self.sheets[color]
+        x_pos = rect.x
+        y_pos = rect.y + self.top
+        blits = []
+        for area in areas:
+            blits.append((sheet, (x_pos, y_pos), area))
+            x_pos += area.width
+        screen.blits(blits, doreturn=False)
+        return rect
+
 class SoundEffects():
     """Sound effects
 
@@ -155,6 +266,57 @@ class Button():
         """Change the text on a button."""
         self.text = Font.button.render(text, True, Colors.WHITE)
 
+class TextCache():
+    """Least recently used cache of rendered blocks of text.
+
+    Laying out and rendering a clue is expensive, so each block of text is rendered once
+    onto a transparent surface (with its shadow already drawn) and reused on later frames.
+
+    Attributes:
+        maxsize (int): Maximum number of rendered surfaces kept in the cache
+        hits (int): Number of lookups that found an already rendered surface
+        misses (int): Number of lookups that had to render the text
+    """
+    maxsize = 64
+    hits = 0
+    misses = 0
+    _surfaces = OrderedDict()
+
+    @classmethod
+    def get(cls, text, font, rect, style):
+        """Returns rendered text and the position it should be drawn at, rendering it if needed.
+
+        Args:
+            text (str): The words to be drawn
+            font (Font): Pygame Font to render the text in
+            rect (int, int, int, int): Bounds (left, top, right, bottom) of the rectangle to
+                draw the text within. Bounds are pixel values relative to screen.
+            style (Color, Color, int): Tuple (color, shadow, offset) of the text color, the
+                shadow color (None for no shadow), and the pixels the shadow is shifted by.
+
+        Returns:
+            (Surface, (int, int)): Rendered text and the pixel position of its top left corner
+        """
+        key = (text, font, tuple(rect), style)
+        if key in cls._surfaces:
+            cls.hits += 1
+            cls._surfaces.move_to_end(key)
+            return cls._surfaces[key]
+
+        cls.misses += 1
+        rendered = render_text(text, font, rect, style)
+        cls._surfaces[key] = rendered
+        if len(cls._surfaces) > cls.maxsize:
+            cls._surfaces.popitem(last=False) # evict least recently used text
+        return rendered
+
+    @classmethod
+    def clear(cls):
+        """Empties the cache and resets hit/miss counters."""
+        cls._surfaces.clear()
+        cls.hits = 0
+        cls.misses = 0
+
 def display_text(screen, text, font, rect, offset=2):
     """Displays text with shadow.
 
@@ -165,9 +327,8 @@ def display_text(screen, text, font, rect, offset=2):
         rect (int, int, int, int): Bounds (left, top, right, bottom) of the rectangle to draw
             the text within. Bounds are pixel values relative to screen.
     """
-    shadow_rect = (rect[0]+offset, rect[1]+offset, rect[2]+offset, rect[3]+offset)
-    draw_text(screen, text, font, shadow_rect , Colors.BLACK)
-    draw_text(screen, text, font, rect, Colors.WHITE)
+    surface, pos = TextCache.get(text, font, rect, (Colors.WHITE, Colors.BLACK, offset))
+    screen.blit(surface, pos)
 
 def draw_text(screen, text, font, rect, color):
     """Draws multiline text centered horizontally and vertically within a rectangle.
@@ -179,41 +340,107 @@ def draw_text(screen, text, font, rect, color):
         rect (int, int, int, int): Bounds (left, top, right, bottom) of the rectangle to draw
             the text within. Bounds are pixel values relative to screen.
     """
-    words = text.split(' ') # list of words
-    rects = [] # list of rectangles, where each box contains one line
-    i = 0
-    while i < len(words):
-        # Add word to new line
-        line = words[i]
-        line_width, line_height = font.size(words[i])
-        i += 1
-        while i < len(words):
-            # keep adding words to line until it would exceed max width
-            word_len = font.size(words[i] + ' ')[0]
-            if word_len + line_width > rect[2] - rect[0]:
-                break
-            line += ' ' + words[i]
-            line_width += word_len
-            i += 1
-        # render line to a rectangular surface
-        rects.append(font.render(line, True, color))
-
-    if line_height*len(rects) > screen.get_size()[1] and Font.get_smaller(font):
-        # try again with a smaller font
-        draw_text(screen, text, Font.get_smaller(font), rect, color)
-        return
-
-    # draw text rectangles
-    y_pos = (rect[1] + rect[3])/2 - line_height*len(rects)/2 + line_height/2 # center vertically
-    x_pos = (rect[0] + rect[2]) // 2 # center horizontally
-    for text_rect in rects:
-        screen.blit(text_rect, text_rect.get_rect(center=(x_pos, y_pos)))
-        y_pos += line_height
+    surface, pos = TextCache.get(text, font, rect, (color, None, 0))
+    screen.blit(surface, pos)
+
+def layout_text(text, font, rect):
+    """Breaks text into lines that fit within a rectangle, shrinking the font if it has
+    smaller sizes and the text does not fit.
+
+    Args:
+        text (str): The words to be drawn
+        font (Font): Pygame Font to render the text in
+        rect (int, int, int, int): Bounds (left, top, right, bottom) of the rectangle to draw
+            the text within. Bounds are pixel values relative to screen.
+
+    Returns:
+        (Font, list of str, int): Font the text fits in, the lines of text, and line height
+    """
+    return Font.get_fitter(font).fit(text, rect[2] - rect[0], rect[3] - rect[1])
+
+def render_text(text, font, rect, style):
+    """Renders multiline text, centered horizontally, onto a transparent surface.
+
+    Args:
+        text (str): The words to be drawn
+        font (Font): Pygame Font to render the text in
+        rect (int, int, int, int): Bounds (left, top, right, bottom) of the rectangle to draw
+            the text within. Bounds are pixel values relative to screen.
+        style (Color, Color, int): Tuple (color, shadow, offset) of the text color, the
+            shadow color (None for no shadow), and the pixels the shadow is shifted by.
+
+    Returns:
+        (Surface, (int, int)): Rendered text and the pixel position of its top left corner
+            so that the text is centered vertically and horizontally within rect
+    """
+    color, shadow, offset = style
+    font, lines, line_height = layout_text(text, font, rect)
+    rendered = [font.render(line, True, color) for line in lines]
+    width = max(line.get_width() for line in rendered)
+    height = line_height*len(rendered)
+    surface = pygame.Surface((width + offset, height + offset), pygame.SRCALPHA)
+    if shadow is not None:
+        shadows = [font.render(line, True, shadow) for line in lines]
+        blit_lines(surface, shadows, width, line_height, offset)
+    blit_lines(surface, rendered, width, line_height)
+
+    # center text block within rect
+    return surface, ((rect[0] + rect[2]) // 2 - width // 2, (rect[1] + rect[3]) / 2 - height / 2)
+
+def blit_lines(surface, lines, width, line_height, offset=0):
+    """Draws rendered lines of text stacked vertically and centered horizontally.
+
+    Args:
+        surface (Surface): Pygame surface where text will be drawn
+        lines (list of Surface): Rendered lines of text
+        width (int): Width in pixels of the widest line
+        line_height (int): Height in pixels of each line
+        offset (int, optional): Pixels the lines are shifted right and down by.
+    """
+    for i, line in enumerate(lines):
+        x_pos = (width - line.get_width()) // 2
+        surface.blit(line, (x_pos + offset, i*line_height + offset))
 
 
 class TTS():
-    """Class for implementing Text to Speech."""
+    """Class for implementing Text to Speech.
+
+    Speech is synthesized on a pool of worker threads so the game keeps running while it
+    is generated. Text that will be read later can be prefetched so that playback starts
+    as soon as play_speech() is called.
+
+    Attributes:
+        channel (Channel): Mixer channel speech is playing on
+        workers (int): Number of threads synthesizing speech
+        cache (SpeechCache): On-disk cache of previously synthesized speech
+        backend (SpeechBackend): Engine used to synthesize speech
+        synthesis_times (deque of float): Milliseconds the backend took to synthesize each
+            of the most recent phrases that were not cached
+        latencies (deque of float): Milliseconds from play_speech() being called to speech
+            starting to play, for the most recent phrases
+    """
     channel = None
+    workers = 4
+    cache = SpeechCache()
+    backend = GoogleBackend()
+    synthesis_times = deque(maxlen=100)
+    latencies = deque(maxlen=100)
+    _executor = None
+    _sounds = {} # text -> Future that resolves to synthesized Sound
+    _queued = None # Future for speech waiting to be played
+    _requested = 0 # time play_speech() was called for queued speech
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_backend(cls, name):
+        """Changes the engine used to synthesize speech.
+
+        Args:
+            name (str): Name of the engine. Can be 'google', 'espeak', or 'tone'.
+        """
+        if cls.backend.name != name:
+            cls.clear() # discard speech from the old engine
+            cls.backend = BACKENDS[name]()
 
     @classmethod
     def prepare_speech(cls, text):
@@ -223,31 +450,93 @@ class TTS():
             text (string): raw text from clue database
 
         Returns:
-            string: cleaned text
+            string: cleaned text with whitespace collapsed to single spaces
         """
-        return text.replace('____', ' blank ')
+        return ' '.join(text.replace('____', ' blank ').split())
+
+    @classmethod
+    def synthesize(cls, text):
+        """Loads speech from the cache, or uses the backend to generate it if it has not been
+        cached yet. Runs on a worker thread.
+
+        Args:
+            text (str): Words to be read aloud
+
+        Returns:
+            Sound: Synthesized speech
+        """
+        text = cls.prepare_speech(text)
+        backend = cls.backend
+        frequency, _, channels = mixer.get_init()
+        key = backend.name + ':' + str(frequency) + ':' + str(channels) + ':' + text
+        pcm = cls.cache.load(key)
+        if pcm is None:
+            start = time.perf_counter()
+            pcm = backend.synthesize(text, frequency, channels)
+            cls.synthesis_times.append((time.perf_counter() - start) * 1000)
+            cls.cache.save(key, pcm)
+        # samples are already in the mixer's format, so no decoding is needed
+        return mixer.Sound(buffer=pcm)
+
+    @classmethod
+    def prefetch(cls, texts):
+        """Starts synthesizing speech in the background so it is ready to play later.
+
+        Args:
+            texts (list of str): Words that will be read aloud, in the order they are needed
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(cls.workers, thread_name_prefix='tts')
+            for text in texts:
+                if text not in cls._sounds:
+                    cls._sounds[text] = cls._executor.submit(cls.synthesize, text)
+
+    @classmethod
+    def clear(cls):
+        """Discards prefetched speech that has not been played."""
+        with cls._lock:
+            for future in cls._sounds.values():
+                future.cancel()
+            cls._sounds.clear()
+
+    @classmethod
+    def shutdown(cls):
+        """Stops the worker threads, discarding speech that has not started synthesizing."""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+            cls._sounds.clear()
 
     @classmethod
     def play_speech(cls, text):
-        """Uses google TTS to read given text aloud.
+        """Reads given text aloud as soon as its speech has been synthesized (non-blocking).
 
         Args:
             text (str): Words to be read aloud
         """
-        # generate sound file
-        tts = gTTS(cls.prepare_speech(text))
-        # save sound output in buffer
-        bytes_stream = BytesIO()
-        tts.write_to_fp(bytes_stream)
-        bytes_stream.seek(0) # roll back buffer stream to beginning of file
-        # convert mp3 to wav format
-        sound = AudioSegment.from_file(bytes_stream)
-        wav = sound.export(bytes_stream, format='wav')
-        # play sound
-        sound = mixer.Sound(wav)
-        cls.channel = sound.play()
+        cls.prefetch([text])
+        with cls._lock:
+            cls._queued = cls._sounds.pop(text)
+        cls._requested = time.perf_counter()
+        cls.update()
+
+    @classmethod
+    def update(cls):
+        """Starts playing queued speech once it has finished being synthesized."""
+        if cls._queued is None or not cls._queued.done():
+            return
+        try:
+            cls.channel = cls._queued.result().play()
+            cls.latencies.append((time.perf_counter() - cls._requested) * 1000)
+        except Exception as error: # pylint: disable=W0718
+            print("Speech synthesis failed: " + str(error))
+        cls._queued = None
 
     @classmethod
     def is_busy(cls):
-        """Returns true if sound is currently play, otherwise returns false."""
-        return cls.channel and cls.channel.get_busy()
+        """Returns true if speech is waiting to be played or currently playing, otherwise
+        returns false."""
+        cls.update()
+        return cls._queued is not None or bool(cls.channel and cls.channel.get_busy())
@@ -0,0 +1,311 @@
+"""
+Check fetched games one category at a time, repairing or replacing bad categories.
+
+Usage Example:
+    validator = GameValidator(clue_bank)
+    data_json, issues = validator.repair_game(data_json) # data_json is None if unplayable
+    for rule, where, action in issues:
+        print(where + ': ' + rule + ' (' + action + ')')
+"""
+from collections import deque
+import threading
+
+ROWS = 5
+COLUMNS = 6
+TEXT_FIELDS = ('category', 'answer', 'question')
+
+def round_values(round_):
+    """Returns the clue values of a round, top row first."""
+    return [x*(round_+1) for x in [200,400,600,800,1000]]
+
+def clean_clue(clue):
+    """Returns a copy of a clue with its fields cleaned up, and the rules it broke.
+
+    Whitespace is stripped from text, values like '$400' become numbers, and a missing
+    daily_double flag becomes 0. A clue that still has an empty or missing category is left
+    for its category to fix.
+
+    Args:
+        clue (Any): Clue in the clue API format
+
+    Returns:
+        (dict, list of str): The cleaned clue, or None if it cannot be used, and the names of
+            the rules it broke
+    """
+    if not isinstance(clue, dict):
+        return None, ['not_a_clue']
+    clue = dict(clue)
+    broken = []
+    for field in TEXT_FIELDS:
+        text = clue.get(field)
+        if not isinstance(text, str) or text.strip() == '':
+            broken.append('empty_' + field)
+            clue[field] = ''
+        else:
+            clue[field] = text.strip()
+    if isinstance(clue.get('value'), str):
+        digits = ''.join(c for c in clue['value'] if c.isdigit())
+        clue['value'] = int(digits) if digits else None
+        broken.append('value_not_number')
+    if clue.get('daily_double') not in (0, 1):
+        clue['daily_double'] = 1 if clue.get('daily_double') else 0
+        broken.append('bad_daily_double')
+    if clue['answer'] == '' or clue['question'] == '':
+        return None, broken
+    return clue, broken
+
+class GameValidator():
+    """Checks game data one category at a time, so one bad clue costs one category.
+
+    Small problems are repaired in place. Categories that cannot be repaired are replaced
+    with a complete category from the clue bank, or from the good categories of games that
+    were rejected earlier. A game is only rejected if a category cannot be replaced.
+
+    Attributes:
+        clue_bank (ClueBank): Local clues used to replace bad categories, or None
+        spare_categories (dict of int: deque): Good categories of rejected games, by round
+        spare_finals (deque of dict): Good final jeopardy clues of rejected games
+    """
+    def __init__(self, clue_bank=None, spares=30):
+        """Initializes GameValidator Object
+
+        Args:
+            clue_bank (ClueBank, optional): Local clues used to replace bad categories.
+                Defaults to None.
+            spares (int, optional): Most spare categories to keep for each round.
+                Defaults to 30.
+        """
+        self.clue_bank = clue_bank
+        self.spare_categories = {0: deque(maxlen=spares), 1: deque(maxlen=spares)}
+        self.spare_finals = deque(maxlen=spares)
+        self._lock = threading.Lock()
+
+    def repair_game(self, data_json):
+        """Checks a game, repairing or replacing what it can.
+
+        Args:
+            data_json (dict): Game in the clue API format
+
+        Returns:
+            (dict, list of (str, str, str)): The repaired game, or None if it cannot be
+                played, and the problems found as (rule, location, action) tuples where
+                action is 'repaired', 'replaced' or 'rejected'.
+        """
+        issues = []
+        if not isinstance(data_json, dict) or not isinstance(data_json.get('clues'), list):
+            issues.append(('not_a_game', 'game', 'rejected'))
+            return None, issues
+        rounds = []
+        good = {0: [], 1: []}
+        ok = True
+        for round_ in (0, 1):
+            rows = data_json['clues'][round_] if len(data_json['clues']) > round_ else []
+            columns = self.repair_round(rows, round_, issues, good[round_])
+            if columns is None:
+                ok = False
+            else:
+                rounds.append([[column[row] for column in columns] for row in range(ROWS)])
+        final = self.repair_final(data_json.get('fj'), issues)
+        if not ok or final is None:
+            # keep what was good for the next game that needs it
+            with self._lock:
+                for round_, columns in good.items():
+                    # a daily double's value may be the amount wagered, so skip those
+                    self.spare_categories[round_].extend(column for column in columns
+                        if not any(clue['daily_double'] for clue in column))
+                if final is not None:
+                    self.spare_finals.append(final)
+            return None, issues
+        repaired = dict(data_json, clues=rounds, fj=final)
+        return repaired, issues
+
+    def repair_round(self, rows, round_, issues, good):
+        """Checks each category in a round, replacing the ones that cannot be repaired.
+
+        Args:
+            rows (list of list): Clues in rows, one clue for each category in each row
+            round_ (int): Round number (0 or 1)
+            issues (list): Problems found are added to this list
+            good (list): Good categories are added to this list
+
+        Returns:
+            list of list of dict: Six categories of five clues, or None if the round
+                could not be repaired
+        """
+        if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+            rows = []
+        width = max((len(row) for row in rows), default=0)
+        if len(rows) != ROWS or width != COLUMNS:
+            issues.append(('grid_size', 'round ' + str(round_), 'repaired'))
+        # check every category first, so replacements never clash with a later name
+        columns = []
+        names = set()
+        for col in range(max(width, COLUMNS)):
+            where = 'round ' + str(round_) + ' category ' + str(col)
+            column = [row[col] if col < len(row) else None for row in rows]
+            column = self.repair_category(column, round_, where, issues)
+            if column is not None and column[0]['category'] in names:
+                issues.append(('duplicate_category', where, 'replaced'))
+                column = None
+            if column is not None:
+                good.append(column)
+                names.add(column[0]['category'])
+            columns.append(column)
+        extra = [column for column in columns[COLUMNS:] if column is not None]
+        columns = columns[:COLUMNS]
+        for col, column in enumerate(columns):
+            if column is not None:
+                continue
+            # extra categories in the grid are used before spares
+            column = extra.pop(0) if extra else self.substitute_category(round_, names)
+            if column is None:
+                issues.append(('no_spare_category', 'round ' + str(round_) + ' category ' +
+                    str(col), 'rejected'))
+                return None
+            names.add(column[0]['category'])
+            columns[col] = column
+        return columns
+
+    def repair_category(self, column, round_, where, issues):
+        """Checks the clues of one category and repairs small problems.
+
+        Args:
+            column (list): Clues in the category, top row first
+            round_ (int): Round number (0 or 1)
+            where (str): Location used when reporting problems
+            issues (list): Problems found are added to this list
+
+        Returns:
+            list of dict: Five repaired clues, or None if the category must be replaced
+        """
+        if len(column) != ROWS:
+            issues.append(('clue_count', where, 'replaced'))
+            return None
+        clues = []
+        for row, clue in enumerate(column):
+            clue, broken = clean_clue(clue)
+            action = 'replaced' if clue is None else 'repaired'
+            issues.extend((rule, where + ' clue ' + str(row), action) for rule in broken)
+            if clue is None:
+                return None
+            clues.append(clue)
+        # every clue in a category shares its name
+        names = [clue['category'] for clue in clues if clue['category'] != '']
+        if len(names) == 0:
+            issues.append(('empty_category', where, 'replaced'))
+            return None
+        for clue in clues:
+            if clue['category'] != names[0]:
+                clue['category'] = names[0]
+                issues.append(('category_name', where, 'repaired'))
+        return self.repair_values(clues, round_, where, issues)
+
+    def repair_values(self, clues, round_, where, issues):
+        """Checks a category has one clue for each value, filling in one missing value.
+
+        A daily double may have the amount wagered as its value, so it can be the one clue
+        without a value from the round.
+
+        Args:
+            clues (list of dict): Five cleaned clues
+            round_ (int): Round number (0 or 1)
+            where (str): Location used when reporting problems
+            issues (list): Problems found are added to this list
+
+        Returns:
+            list of dict: The clues, or None if the category must be replaced
+        """
+        missing = set(round_values(round_))
+        unknown = []
+        for clue in clues:
+            if clue['value'] in missing:
+                missing.discard(clue['value'])
+            elif clue['daily_double'] != 1 or clue['value'] in round_values(round_):
+                unknown.append(clue)
+        daily_doubles = sum(clue['daily_double'] for clue in clues)
+        if len(unknown) == 1 and len(missing) == 1:
+            unknown[0]['value'] = missing.pop()
+            issues.append(('bad_value', where, 'repaired'))
+        elif unknown or len(missing) > min(daily_doubles, 1):
+            issues.append(('bad_value', where, 'replaced'))
+            return None
+        return self.order_values(clues, round_, where, issues)
+
+    def order_values(self, clues, round_, where, issues):
+        """Puts the clues of a category in order of value, so each clue is worth the amount
+        shown in its row of the board.
+
+        A daily double keeps its row, since its value may be the amount wagered. Any other
+        clue left in a row worth a different amount is given that row's value.
+
+        Args:
+            clues (list of dict): Five clues with one value from the round each, apart from
+                a daily double
+            round_ (int): Round number (0 or 1)
+            where (str): Location used when reporting problems
+            issues (list): Problems found are added to this list
+
+        Returns:
+            list of dict: The clues, top row first
+        """
+        values = round_values(round_)
+        rows = [row for row, clue in enumerate(clues) if clue['daily_double'] != 1]
+        ordered = list(clues)
+        changed = False
+        for row, clue in zip(rows, sorted((clues[row] for row in rows),
+                key=lambda clue: clue['value'])):
+            changed = changed or clue is not clues[row] or clue['value'] != values[row]
+            ordered[row] = clue
+            clue['value'] = values[row]
+        if changed:
+            issues.append(('value_order', where, 'repaired'))
+        return ordered
+
+    def repair_final(self, clue, issues):
+        """Checks final jeopardy, replacing it if it cannot be repaired.
+
+        Args:
+            clue (dict): Final jeopardy clue
+            issues (list): Problems found are added to this list
+
+        Returns:
+            dict: The repaired clue, or None if no replacement was found
+        """
+        clue, broken = clean_clue(clue)
+        if clue is not None and clue['category'] == '':
+            clue = None
+        action = 'replaced' if clue is None else 'repaired'
+        issues.extend((rule, 'final', action) for rule in broken)
+        if clue is not None:
+            return clue
+        with self._lock:
+            if self.spare_finals:
+                return self.spare_finals.popleft()
+        if self.clue_bank is not None:
+            clue = self.clue_bank.random_clue(2)
+        if clue is None:
+            issues.append(('no_spare_final', 'final', 'rejected'))
+        return clue
+
+    def substitute_category(self, round_, names):
+        """Returns a complete spare category for a round, or None if there are none.
+
+        Args:
+            round_ (int): Round number (0 or 1)
+            names (set of str): Categories already in the round, which are not used again
+        """
+        with self._lock:
+            spares = self.spare_categories[round_]
+            for _ in range(len(spares)):
+                column = spares.popleft()
+                if column[0]['category'] not in names:
+                    return column
+                spares.append(column)
+        if self.clue_bank is not None:
+            for _ in range(10):
+                columns = self.clue_bank.pick_categories(round_, 1)
+                if columns is None:
+                    break
+                if columns[0][0]['category'] not in names:
+                    return columns[0]
+        return None